@@ -1,22 +1,58 @@
-"""HK Citation Health Monitor integration."""
+"""HK Citation Health Monitor integration.
+
+Home Assistant modules are imported inside the setup functions, so the
+HA-independent modules of this package (the probe logic and the standalone
+probe agent) can be imported on hosts without Home Assistant installed.
+"""
 
 from __future__ import annotations
 
 import logging
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .const import DOMAIN, PLATFORMS
+
+try:
+    from homeassistant.helpers import config_validation as cv
+except ImportError:  # A probe agent or command-line host without HA.
+    pass
+else:
+    CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
-from .const import PLATFORMS
-from .coordinator import HKCitationCoordinator
+    from .coordinator import HKCitationCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the HK Citation services, agent endpoint and websocket API."""
+    from .api import async_register_views
+    from .services import async_setup_services
+    from .websocket_api import async_register_websocket_commands
+
+    async_setup_services(hass)
+    async_register_views(hass)
+    async_register_websocket_commands(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HK Citation Health Monitor from a config entry."""
+    from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+    from .coordinator import HKCitationCoordinator
+
     coordinator = HKCitationCoordinator(hass, entry)
     await coordinator.async_load_speakers()
+    await coordinator.async_load_history()
+    await coordinator.async_load_risk()
     await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
@@ -24,15 +60,49 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    entry.async_on_unload(coordinator.async_start_risk_checks())
+
+    async def _async_save_history(event: Event) -> None:
+        await coordinator.async_save_history()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_history)
+    )
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    coordinator: HKCitationCoordinator = entry.runtime_data
+    coordinator.async_cancel_profiling()
+    await coordinator.async_save_history()
+    # A delayed save left pending would write the model back after a removal.
+    await coordinator.async_save_risk()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the stored data of a removed entry.
+
+    That is its speaker registry, freeze risk model and latency history.
+    """
+    from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+    from .coordinator import (
+        RISK_STORAGE_VERSION,
+        STORAGE_VERSION,
+        history_file,
+        risk_storage_key,
+        storage_key,
+    )
+
+    await Store(hass, STORAGE_VERSION, storage_key(entry)).async_remove()
+    await Store(hass, RISK_STORAGE_VERSION, risk_storage_key(entry)).async_remove()
+    path = Path(hass.config.path(STORAGE_DIR, history_file(entry)))
+    await hass.async_add_executor_job(partial(path.unlink, missing_ok=True))
+
+
 async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     coordinator: HKCitationCoordinator = entry.runtime_data
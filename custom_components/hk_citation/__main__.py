@@ -0,0 +1,7 @@
+"""Run the HK Citation command-line prober: ``python -m hk_citation``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
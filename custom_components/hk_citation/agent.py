@@ -0,0 +1,127 @@
+"""Standalone probe agent for HK Citation Health Monitor.
+
+Runs on a host inside another network segment, probes the speakers there
+with the same probe logic as the integration, and pushes the results to
+Home Assistant in one batch per cycle. Latency is then measured from inside
+the speaker's own segment instead of across routers or VPN links.
+
+The agent needs only ``aiohttp``. From the ``custom_components`` directory:
+
+    HK_CITATION_TOKEN=<long-lived access token> python -m hk_citation.agent \\
+        --url http://homeassistant.local:8123 --agent-id vlan20 \\
+        10.0.20.31 10.0.20.32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+from collections.abc import Iterable
+
+import aiohttp
+
+from .const import AGENT_API_PATH, DEFAULT_SCAN_INTERVAL, DEFAULT_THRESHOLD_MS
+from .models import SpeakerStatus
+from .probe import async_probe_ips
+
+_LOGGER = logging.getLogger(__name__)
+
+PUSH_TIMEOUT = 10.0
+AGENT_CONCURRENCY = 16
+TOKEN_ENV = "HK_CITATION_TOKEN"
+
+
+async def async_collect(
+    session: aiohttp.ClientSession, ips: Iterable[str], threshold_ms: float
+) -> list[SpeakerStatus]:
+    """Probe all speakers and return the batch to push.
+
+    Hosts that do not answer eureka_info or are not Citations are left out,
+    like unreachable speakers in the integration's own cycle.
+    """
+    statuses = []
+    async for ip, status in async_probe_ips(
+        session, ips, threshold_ms, AGENT_CONCURRENCY
+    ):
+        if status is None:
+            _LOGGER.debug("No HK Citation answering at %s", ip)
+        else:
+            statuses.append(status)
+    return statuses
+
+
+async def async_push(
+    session: aiohttp.ClientSession,
+    url: str,
+    token: str,
+    agent_id: str,
+    statuses: list[SpeakerStatus],
+    entry_id: str | None = None,
+) -> None:
+    """Push a batch of results to Home Assistant's agent endpoint."""
+    payload: dict = {
+        "agent_id": agent_id,
+        "speakers": [status.as_dict() for status in statuses],
+    }
+    if entry_id:
+        payload["entry_id"] = entry_id
+    async with session.post(
+        f"{url.rstrip('/')}{AGENT_API_PATH}",
+        json=payload,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=aiohttp.ClientTimeout(total=PUSH_TIMEOUT),
+    ) as resp:
+        resp.raise_for_status()
+
+
+async def async_run(args: argparse.Namespace, token: str) -> None:
+    """Probe and push every interval, or once."""
+    async with aiohttp.ClientSession() as session:
+        while True:
+            statuses = await async_collect(session, args.ips, args.threshold_ms)
+            try:
+                await async_push(
+                    session, args.url, token, args.agent_id, statuses, args.entry_id
+                )
+            except (aiohttp.ClientError, TimeoutError) as err:
+                _LOGGER.warning("Pushing results to %s failed: %s", args.url, err)
+            else:
+                _LOGGER.info("Pushed %d speaker results", len(statuses))
+            if args.once:
+                return
+            await asyncio.sleep(args.interval)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the probe agent from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m hk_citation.agent", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("ips", nargs="+", help="speaker IP addresses to probe")
+    parser.add_argument("--url", required=True, help="Home Assistant base URL")
+    parser.add_argument(
+        "--agent-id", required=True, help="name identifying this agent in logs"
+    )
+    parser.add_argument(
+        "--entry-id", help="config entry to report to (default: the first one)"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_SCAN_INTERVAL, help="seconds"
+    )
+    parser.add_argument("--threshold-ms", type=float, default=DEFAULT_THRESHOLD_MS)
+    parser.add_argument("--once", action="store_true", help="probe and push once")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    token = os.environ.get(TOKEN_ENV)
+    if not token:
+        parser.error(f"set {TOKEN_ENV} to a Home Assistant long-lived access token")
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    asyncio.run(async_run(args, token))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""HTTP endpoint for remote probe agents."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+
+import voluptuous as vol
+from aiohttp import web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import AGENT_API_PATH, DOMAIN
+from .coordinator import HKCitationCoordinator, in_segment
+from .models import SpeakerStatus
+
+PROBE_SAMPLE_SCHEMA = vol.Schema(
+    {
+        vol.Required("endpoint"): cv.string,
+        vol.Required("ms"): vol.Coerce(float),
+        vol.Optional("error", default=""): str,
+    }
+)
+
+SPEAKER_RESULT_SCHEMA = vol.Schema(
+    {
+        vol.Required("uuid"): cv.string,
+        vol.Required("name"): str,
+        vol.Required("ip"): cv.string,
+        vol.Optional("model", default=""): str,
+        vol.Required("healthy"): cv.boolean,
+        vol.Required("response_time_ms"): vol.Coerce(float),
+        vol.Optional("probes", default=list): [PROBE_SAMPLE_SCHEMA],
+        vol.Optional("error", default=""): str,
+    },
+    extra=vol.REMOVE_EXTRA,
+)
+
+AGENT_PAYLOAD_SCHEMA = vol.Schema(
+    {
+        vol.Required("agent_id"): cv.string,
+        vol.Optional("entry_id"): cv.string,
+        vol.Required("speakers"): [SPEAKER_RESULT_SCHEMA],
+    }
+)
+
+
+class HKCitationAgentView(HomeAssistantView):
+    """Receive batched probe results from remote probe agents.
+
+    Agents authenticate with a Home Assistant long-lived access token of an
+    administrator.
+    """
+
+    url = AGENT_API_PATH
+    name = f"api:{DOMAIN}:agent"
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Merge a batch of agent probe results into the coordinator."""
+        if not request["hass_user"].is_admin:
+            return self.json_message("Admin access required", HTTPStatus.UNAUTHORIZED)
+        try:
+            payload = AGENT_PAYLOAD_SCHEMA(await request.json())
+        except (ValueError, vol.Invalid) as err:
+            return self.json_message(
+                f"Invalid agent payload: {err}", HTTPStatus.BAD_REQUEST
+            )
+
+        hass: HomeAssistant = request.app[KEY_HASS]
+        coordinators = _async_target_coordinators(hass, payload.get("entry_id"))
+        if not coordinators:
+            return self.json_message(
+                "No loaded HK Citation config entry", HTTPStatus.NOT_FOUND
+            )
+
+        statuses = [SpeakerStatus.from_dict(item) for item in payload["speakers"]]
+        batches: dict[HKCitationCoordinator, list[SpeakerStatus]] = {}
+        for status in statuses:
+            coordinator = next(
+                (c for c in coordinators if in_segment(status.speaker.ip, c.segment)),
+                coordinators[0],
+            )
+            batches.setdefault(coordinator, []).append(status)
+        for coordinator, batch in batches.items():
+            coordinator.async_merge_agent_results(payload["agent_id"], batch)
+        return self.json({"accepted": len(statuses)})
+
+
+@callback
+def _async_target_coordinators(
+    hass: HomeAssistant, entry_id: str | None
+) -> list[HKCitationCoordinator]:
+    """Return the coordinators an agent may report to, most specific first.
+
+    Each speaker goes to the first coordinator whose segment contains its
+    IP, so entries limited to subnets are tried before the default entry.
+    """
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    if entry_id is not None:
+        entries = [entry for entry in entries if entry.entry_id == entry_id]
+    coordinators: list[HKCitationCoordinator] = [
+        entry.runtime_data for entry in entries
+    ]
+    return sorted(coordinators, key=lambda coordinator: not coordinator.segment)
+
+
+@callback
+def async_register_views(hass: HomeAssistant) -> None:
+    """Register the agent endpoint."""
+    hass.http.register_view(HKCitationAgentView())
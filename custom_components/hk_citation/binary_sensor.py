@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import HKCitationCoordinator
+from .models import SpeakerStatus
 
 
 async def async_setup_entry(
@@ -53,13 +58,17 @@ class HKCitationHealthSensor(
 
     def __init__(self, coordinator: HKCitationCoordinator, uuid: str) -> None:
         """Initialize the health sensor."""
-        super().__init__(coordinator)
+        # The UUID is the listener context, so the coordinator only wakes this
+        # entity when its own speaker's data changes.
+        super().__init__(coordinator, context=uuid)
         self._uuid = uuid
         self._attr_unique_id = f"hk_citation_{uuid}"
+        # Firmware version last written to the device registry.
+        self._sw_version: str | None = None
 
     @property
-    def _speaker_data(self) -> dict | None:
-        """Return the speaker data from the coordinator, or None."""
+    def _speaker_data(self) -> SpeakerStatus | None:
+        """Return the speaker status from the coordinator, or None."""
         if not self.coordinator.data:
             return None
         return self.coordinator.data.get("speakers", {}).get(self._uuid)
@@ -75,7 +84,7 @@ class HKCitationHealthSensor(
         data = self._speaker_data
         if data is None:
             return None
-        return data["healthy"]
+        return data.health.healthy
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -83,20 +92,52 @@ class HKCitationHealthSensor(
         data = self._speaker_data
         if data is None:
             return {}
-        return {
-            "response_time_ms": data["response_time_ms"],
-            "ip_address": data["ip"],
+        attributes: dict[str, Any] = {
+            "response_time_ms": data.health.response_time_ms,
+            "ip_address": data.speaker.ip,
+            "stale": data.stale,
         }
+        if (details := data.details) is not None:
+            if details.booted_at is not None:
+                attributes["booted_at"] = datetime.fromtimestamp(
+                    details.booted_at, UTC
+                ).isoformat()
+            if details.mac_address:
+                attributes["mac_address"] = details.mac_address
+            if details.ssid:
+                attributes["wifi_ssid"] = details.ssid
+            if details.signal_level is not None:
+                attributes["wifi_signal_dbm"] = details.signal_level
+        if (risk := data.risk) is not None:
+            attributes["freeze_risk"] = risk.level
+            attributes["freezes_per_day"] = risk.freezes_per_day
+            if risk.reboot_recommended is not None:
+                attributes["reboot_recommended"] = risk.reboot_recommended
+        return attributes
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the firmware version to the device registry when it changes."""
+        data = self._speaker_data
+        sw_version = data.details.sw_version if data and data.details else ""
+        if sw_version and sw_version != self._sw_version and self.device_entry:
+            self._sw_version = sw_version
+            dr.async_get(self.hass).async_update_device(
+                self.device_entry.id, sw_version=sw_version
+            )
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for the speaker."""
         data = self._speaker_data
-        name = data["name"] if data else f"HK Citation {self._uuid[:8]}"
-        model = data.get("model", "HK Citation") if data else "HK Citation"
+        name = data.speaker.name if data else f"HK Citation {self._uuid[:8]}"
+        model = (data.speaker.model or "HK Citation") if data else "HK Citation"
+        sw_version = data.details.sw_version if data and data.details else ""
         return DeviceInfo(
             identifiers={(DOMAIN, self._uuid)},
             name=name,
             manufacturer="Harman Kardon",
             model=model,
+            sw_version=sw_version or None,
         )
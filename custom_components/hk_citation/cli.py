@@ -0,0 +1,159 @@
+"""Command-line prober for HK Citation speakers.
+
+Runs the integration's discovery and probe logic without Home Assistant and
+streams one JSON object per speaker to stdout as each probe finishes. From
+the ``custom_components`` directory:
+
+    python -m hk_citation                       # discover via mDNS, probe once
+    python -m hk_citation 10.0.20.31 10.0.20.32 # probe these hosts
+    python -m hk_citation --subnet 10.0.4.0/22  # sweep a range, then probe
+    python -m hk_citation --interface 10.0.4.2  # discover on one interface
+    python -m hk_citation --watch 30            # repeat every 30 seconds
+
+In single-run mode the exit status is 1 if any speaker is unreachable or
+unhealthy, so the command can gate cron jobs and CI pipelines.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from datetime import UTC, datetime
+from typing import Any, TextIO
+
+import aiohttp
+
+from .const import DEFAULT_SWEEP_CONCURRENCY, DEFAULT_SWEEP_RATE, DEFAULT_THRESHOLD_MS
+from .discovery import run_mdns_scan
+from .probe import async_probe_ips
+from .sweep import SubnetSweeper, parse_subnets
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 32
+DEFAULT_DISCOVER_EVERY = 10
+
+
+async def async_discover(
+    session: aiohttp.ClientSession, args: argparse.Namespace
+) -> tuple[list[str], dict[str, dict[str, str]]]:
+    """Return the IPs to probe: given on the command line, swept, or via mDNS.
+
+    Also returns the identities a subnet sweep has already confirmed, keyed
+    by IP, so those hosts are not identified a second time.
+    """
+    if args.ips:
+        return list(args.ips), {}
+    if args.subnet:
+        networks = parse_subnets(",".join(args.subnet))
+        sweeper = SubnetSweeper(
+            session,
+            networks,
+            concurrency=DEFAULT_SWEEP_CONCURRENCY,
+            rate=DEFAULT_SWEEP_RATE,
+            hosts_per_cycle=sum(network.num_addresses for network in networks),
+        )
+        swept = {speaker["ip"]: speaker for speaker in await sweeper.async_sweep()}
+        return list(swept), swept
+    found = await asyncio.to_thread(run_mdns_scan, args.interface)
+    return [speaker["ip"] for speaker in found], {}
+
+
+async def async_probe_once(
+    session: aiohttp.ClientSession,
+    ips: list[str],
+    args: argparse.Namespace,
+    out: TextIO,
+    identities: dict[str, dict[str, str]] | None = None,
+) -> bool:
+    """Probe all IPs, writing one JSON line per host; return True if all healthy."""
+    all_healthy = True
+    async for ip, status in async_probe_ips(
+        session, ips, args.threshold_ms, args.concurrency, identities
+    ):
+        line: dict[str, Any] = {"time": datetime.now(UTC).isoformat(), "ip": ip}
+        if status is None:
+            line["reachable"] = False
+            all_healthy = False
+        else:
+            line.update(status.as_dict(), reachable=True)
+            all_healthy = all_healthy and status.health.healthy
+        out.write(json.dumps(line) + "\n")
+        out.flush()
+    return all_healthy
+
+
+async def async_run(args: argparse.Namespace, out: TextIO = sys.stdout) -> int:
+    """Run the prober and return the process exit status."""
+    async with aiohttp.ClientSession() as session:
+        ips: list[str] = []
+        cycle = 0
+        while True:
+            identities: dict[str, dict[str, str]] = {}
+            if cycle % args.discover_every == 0:
+                ips, identities = await async_discover(session, args)
+                _LOGGER.info("Probing %d hosts", len(ips))
+            # Sweep identities are fresh only in the cycle that found them;
+            # later cycles read eureka_info again as the reachability check.
+            healthy = await async_probe_once(session, ips, args, out, identities)
+            if args.watch is None:
+                return 0 if healthy and ips else 1
+            cycle += 1
+            await asyncio.sleep(args.watch)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="python -m hk_citation", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("ips", nargs="*", help="speaker IPs (default: mDNS)")
+    parser.add_argument(
+        "--subnet", action="append", help="sweep this CIDR range for speakers"
+    )
+    parser.add_argument(
+        "--interface",
+        metavar="ADDRESS",
+        help="run mDNS discovery on the interface with this IPv4 address",
+    )
+    parser.add_argument("--threshold-ms", type=float, default=DEFAULT_THRESHOLD_MS)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="speakers probed at once",
+    )
+    parser.add_argument(
+        "--watch", type=float, metavar="SECONDS", help="repeat every SECONDS"
+    )
+    parser.add_argument(
+        "--discover-every",
+        type=int,
+        default=DEFAULT_DISCOVER_EVERY,
+        metavar="N",
+        help="in watch mode, rediscover every N cycles",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments and run the prober."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.subnet:
+        try:
+            parse_subnets(",".join(args.subnet))
+        except ValueError as err:
+            parser.error(str(err))
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING, stream=sys.stderr
+    )
+    try:
+        return asyncio.run(async_run(args))
+    except KeyboardInterrupt:
+        return 130
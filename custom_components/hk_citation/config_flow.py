@@ -2,25 +2,63 @@
 
 from __future__ import annotations
 
+from ipaddress import IPv4Address, IPv4Network
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import (
     ConfigEntry,
+    ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlow,
     OptionsFlowWithConfigEntry,
 )
 from homeassistant.core import callback
+from homeassistant.helpers import selector
 
 from .const import (
+    CONF_BROWSE_EVERY,
+    CONF_CYCLE_BUDGET,
+    CONF_INTERFACE,
+    CONF_PROBE_CONCURRENCY,
+    CONF_PROBE_FRESHNESS,
+    CONF_REBOOT_HINT,
+    CONF_REMEDIATION_COOLDOWN,
+    CONF_REMEDIATION_MAX_ATTEMPTS,
+    CONF_REMEDIATION_OFF_TIME,
+    CONF_REMEDIATION_SWITCHES,
+    CONF_RISK_SCHEDULING,
     CONF_SCAN_INTERVAL,
+    CONF_SUBNETS,
+    CONF_SWEEP_CONCURRENCY,
+    CONF_SWEEP_HOSTS_PER_CYCLE,
+    CONF_SWEEP_RATE,
+    CONF_SWEEP_SUBNETS,
     CONF_THRESHOLD_MS,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    DEFAULT_BROWSE_EVERY,
+    DEFAULT_CYCLE_BUDGET,
+    DEFAULT_PROBE_CONCURRENCY,
+    DEFAULT_PROBE_FRESHNESS,
+    DEFAULT_REBOOT_HINT,
+    DEFAULT_REMEDIATION_COOLDOWN,
+    DEFAULT_REMEDIATION_MAX_ATTEMPTS,
+    DEFAULT_REMEDIATION_OFF_TIME,
+    DEFAULT_RISK_SCHEDULING,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SWEEP_CONCURRENCY,
+    DEFAULT_SWEEP_HOSTS_PER_CYCLE,
+    DEFAULT_SWEEP_RATE,
+    DEFAULT_SWEEP_SUBNETS,
     DEFAULT_THRESHOLD_MS,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
     DOMAIN,
 )
+from .coordinator import entry_segment
+from .sweep import parse_subnets
 
 
 class HKCitationConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -31,19 +69,72 @@ class HKCitationConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Handle the initial step — no user input needed."""
-        await self.async_set_unique_id(DOMAIN)
-        self._abort_if_unique_id_configured()
-
-        return self.async_create_entry(
-            title="HK Citation Health Monitor",
-            data={},
-            options={
-                CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
-                CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
-            },
+        """Handle the initial step.
+
+        Each entry monitors one network segment: speakers discovered on the
+        given interface and, if set, inside the given subnets. Leaving both
+        empty monitors the default network, like the single instance of
+        earlier versions, which keeps that entry's unique ID and storage.
+        """
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            interface = user_input.get(CONF_INTERFACE, "").strip()
+            try:
+                if interface:
+                    IPv4Address(interface)
+            except ValueError:
+                errors[CONF_INTERFACE] = "invalid_interface"
+            try:
+                networks = parse_subnets(user_input.get(CONF_SUBNETS, ""))
+            except ValueError:
+                errors[CONF_SUBNETS] = "invalid_subnets"
+
+            if not errors:
+                subnets = ", ".join(str(network) for network in networks)
+                if interface or subnets:
+                    await self.async_set_unique_id(f"{interface}|{subnets}")
+                    title = f"HK Citation {subnets or interface}"
+                else:
+                    await self.async_set_unique_id(DOMAIN)
+                    title = "HK Citation Health Monitor"
+                self._abort_if_unique_id_configured()
+                if self._overlaps_other_entry(networks):
+                    errors[CONF_SUBNETS] = "overlapping_segment"
+            if not errors:
+                return self.async_create_entry(
+                    title=title,
+                    data={CONF_INTERFACE: interface, CONF_SUBNETS: subnets},
+                    options={
+                        CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+                        CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(CONF_INTERFACE, default=""): str,
+                    vol.Optional(CONF_SUBNETS, default=""): str,
+                }
+            ),
+            errors=errors,
         )
 
+    def _overlaps_other_entry(self, networks: list[IPv4Network]) -> bool:
+        """Return True if another entry already monitors these subnets.
+
+        Only one entry may go without subnets; it monitors the addresses no
+        other entry's subnets cover.
+        """
+        for entry in self._async_current_entries(include_ignore=False):
+            other = entry_segment(entry)
+            if not networks and not other:
+                return True
+            if any(network.overlaps(o) for network in networks for o in other):
+                return True
+        return False
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
@@ -54,12 +145,31 @@ class HKCitationConfigFlow(ConfigFlow, domain=DOMAIN):
 class HKCitationOptionsFlow(OptionsFlowWithConfigEntry):
     """Handle options flow for HK Citation."""
 
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        super().__init__(config_entry)
+        # Remediation form field (speaker label) to speaker UUID.
+        self._switch_fields: dict[str, str] = {}
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            return self.async_create_entry(data=user_input)
+            try:
+                parse_subnets(user_input.get(CONF_SWEEP_SUBNETS, ""))
+            except ValueError:
+                errors[CONF_SWEEP_SUBNETS] = "invalid_subnets"
+            if user_input[CONF_TIMEOUT_FLOOR] > user_input[CONF_TIMEOUT_CEILING]:
+                errors[CONF_TIMEOUT_FLOOR] = "timeout_floor_above_ceiling"
+            if user_input[CONF_PROBE_FRESHNESS] >= user_input[CONF_SCAN_INTERVAL]:
+                errors[CONF_PROBE_FRESHNESS] = "freshness_not_below_interval"
+            if not errors:
+                self.options.update(user_input)
+                if self.config_entry.state is ConfigEntryState.LOADED:
+                    return await self.async_step_remediation()
+                return self.async_create_entry(data=self.options)
 
         return self.async_show_form(
             step_id="init",
@@ -77,6 +187,131 @@ class HKCitationOptionsFlow(OptionsFlowWithConfigEntry):
                             CONF_THRESHOLD_MS, DEFAULT_THRESHOLD_MS
                         ),
                     ): vol.All(int, vol.Range(min=200, max=10000)),
+                    vol.Required(
+                        CONF_TIMEOUT_FLOOR,
+                        default=self.options.get(
+                            CONF_TIMEOUT_FLOOR, DEFAULT_TIMEOUT_FLOOR
+                        ),
+                    ): vol.All(int, vol.Range(min=50, max=10000)),
+                    vol.Required(
+                        CONF_TIMEOUT_CEILING,
+                        default=self.options.get(
+                            CONF_TIMEOUT_CEILING, DEFAULT_TIMEOUT_CEILING
+                        ),
+                    ): vol.All(int, vol.Range(min=500, max=30000)),
+                    vol.Required(
+                        CONF_CYCLE_BUDGET,
+                        default=self.options.get(
+                            CONF_CYCLE_BUDGET, DEFAULT_CYCLE_BUDGET
+                        ),
+                    ): vol.All(int, vol.Range(min=30, max=3600)),
+                    vol.Required(
+                        CONF_PROBE_CONCURRENCY,
+                        default=self.options.get(
+                            CONF_PROBE_CONCURRENCY, DEFAULT_PROBE_CONCURRENCY
+                        ),
+                    ): vol.All(int, vol.Range(min=1, max=128)),
+                    vol.Required(
+                        CONF_BROWSE_EVERY,
+                        default=self.options.get(
+                            CONF_BROWSE_EVERY, DEFAULT_BROWSE_EVERY
+                        ),
+                    ): vol.All(int, vol.Range(min=1, max=100)),
+                    vol.Required(
+                        CONF_PROBE_FRESHNESS,
+                        default=self.options.get(
+                            CONF_PROBE_FRESHNESS, DEFAULT_PROBE_FRESHNESS
+                        ),
+                    ): vol.All(int, vol.Range(min=0, max=3600)),
+                    vol.Required(
+                        CONF_RISK_SCHEDULING,
+                        default=self.options.get(
+                            CONF_RISK_SCHEDULING, DEFAULT_RISK_SCHEDULING
+                        ),
+                    ): bool,
+                    vol.Required(
+                        CONF_REBOOT_HINT,
+                        default=self.options.get(CONF_REBOOT_HINT, DEFAULT_REBOOT_HINT),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SWEEP_SUBNETS,
+                        default=self.options.get(
+                            CONF_SWEEP_SUBNETS, DEFAULT_SWEEP_SUBNETS
+                        ),
+                    ): str,
+                    vol.Required(
+                        CONF_SWEEP_CONCURRENCY,
+                        default=self.options.get(
+                            CONF_SWEEP_CONCURRENCY, DEFAULT_SWEEP_CONCURRENCY
+                        ),
+                    ): vol.All(int, vol.Range(min=1, max=512)),
+                    vol.Required(
+                        CONF_SWEEP_RATE,
+                        default=self.options.get(CONF_SWEEP_RATE, DEFAULT_SWEEP_RATE),
+                    ): vol.All(int, vol.Range(min=1, max=2000)),
+                    vol.Required(
+                        CONF_SWEEP_HOSTS_PER_CYCLE,
+                        default=self.options.get(
+                            CONF_SWEEP_HOSTS_PER_CYCLE, DEFAULT_SWEEP_HOSTS_PER_CYCLE
+                        ),
+                    ): vol.All(int, vol.Range(min=1, max=4096)),
                 }
             ),
+            errors=errors,
+        )
+
+    async def async_step_remediation(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Link speakers to the switches that power them."""
+        if user_input is not None:
+            self.options[CONF_REMEDIATION_SWITCHES] = {
+                uuid: user_input[field]
+                for field, uuid in self._switch_fields.items()
+                if user_input.get(field)
+            }
+            for key in (
+                CONF_REMEDIATION_OFF_TIME,
+                CONF_REMEDIATION_MAX_ATTEMPTS,
+                CONF_REMEDIATION_COOLDOWN,
+            ):
+                self.options[key] = user_input[key]
+            return self.async_create_entry(data=self.options)
+
+        speakers = self.config_entry.runtime_data.speakers
+        switches = self.options.get(CONF_REMEDIATION_SWITCHES, {})
+        self._switch_fields = {}
+        for speaker in sorted(speakers.values(), key=lambda s: s.name):
+            field = speaker.name
+            if field in self._switch_fields:
+                field = f"{speaker.name} ({speaker.ip})"
+            self._switch_fields[field] = speaker.uuid
+
+        schema: dict[Any, Any] = {
+            vol.Required(
+                CONF_REMEDIATION_OFF_TIME,
+                default=self.options.get(
+                    CONF_REMEDIATION_OFF_TIME, DEFAULT_REMEDIATION_OFF_TIME
+                ),
+            ): vol.All(int, vol.Range(min=1, max=300)),
+            vol.Required(
+                CONF_REMEDIATION_MAX_ATTEMPTS,
+                default=self.options.get(
+                    CONF_REMEDIATION_MAX_ATTEMPTS, DEFAULT_REMEDIATION_MAX_ATTEMPTS
+                ),
+            ): vol.All(int, vol.Range(min=1, max=10)),
+            vol.Required(
+                CONF_REMEDIATION_COOLDOWN,
+                default=self.options.get(
+                    CONF_REMEDIATION_COOLDOWN, DEFAULT_REMEDIATION_COOLDOWN
+                ),
+            ): vol.All(int, vol.Range(min=60, max=86400)),
+        }
+        for field, uuid in self._switch_fields.items():
+            schema[
+                vol.Optional(field, description={"suggested_value": switches.get(uuid)})
+            ] = selector.EntitySelector(selector.EntitySelectorConfig(domain="switch"))
+
+        return self.async_show_form(
+            step_id="remediation", data_schema=vol.Schema(schema)
         )
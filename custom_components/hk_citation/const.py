@@ -1,9 +1,9 @@
 """Constants for HK Citation Health Monitor."""
 
-from homeassistant.const import Platform
-
 DOMAIN = "hk_citation"
-PLATFORMS = [Platform.BINARY_SENSOR]
+# Plain platform names keep this module importable without Home Assistant,
+# for the standalone probe agent.
+PLATFORMS = ["binary_sensor"]
 
 CAST_SERVICE = "_googlecast._tcp.local."
 HK_MODEL_PREFIX = "HK Citation"
@@ -17,9 +17,49 @@ PROBE_ENDPOINTS = [
 ]
 HTTPS_PROBE_ENDPOINT = "/setup/eureka_info"
 
+CONF_INTERFACE = "interface"
+CONF_SUBNETS = "subnets"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_THRESHOLD_MS = "threshold_ms"
+CONF_SWEEP_SUBNETS = "sweep_subnets"
+CONF_SWEEP_CONCURRENCY = "sweep_concurrency"
+CONF_SWEEP_RATE = "sweep_rate"
+CONF_SWEEP_HOSTS_PER_CYCLE = "sweep_hosts_per_cycle"
+CONF_CYCLE_BUDGET = "cycle_budget"
+CONF_PROBE_CONCURRENCY = "probe_concurrency"
+CONF_BROWSE_EVERY = "browse_every"
+CONF_PROBE_FRESHNESS = "probe_freshness"
+CONF_RISK_SCHEDULING = "risk_scheduling"
+CONF_REBOOT_HINT = "reboot_hint"
+CONF_TIMEOUT_FLOOR = "timeout_floor_ms"
+CONF_TIMEOUT_CEILING = "timeout_ceiling_ms"
+CONF_REMEDIATION_SWITCHES = "remediation_switches"
+CONF_REMEDIATION_OFF_TIME = "remediation_off_time"
+CONF_REMEDIATION_MAX_ATTEMPTS = "remediation_max_attempts"
+CONF_REMEDIATION_COOLDOWN = "remediation_cooldown"
 
 DEFAULT_SCAN_INTERVAL = 300  # 5 minutes
 DEFAULT_THRESHOLD_MS = 1000
+DEFAULT_SWEEP_SUBNETS = ""  # subnet sweep disabled
+DEFAULT_SWEEP_CONCURRENCY = 64
+DEFAULT_SWEEP_RATE = 100  # TCP connects per second
+DEFAULT_SWEEP_HOSTS_PER_CYCLE = 256
+DEFAULT_CYCLE_BUDGET = 120  # seconds; capped at the scan interval
+DEFAULT_PROBE_CONCURRENCY = 16  # speakers checked at once
+DEFAULT_BROWSE_EVERY = 1  # full mDNS browse every N scans
+DEFAULT_PROBE_FRESHNESS = 0  # seconds a probe result may be reused; 0 = never
+DEFAULT_RISK_SCHEDULING = False  # probe by freeze risk
+DEFAULT_REBOOT_HINT = False  # reboot_recommended attribute
+DEFAULT_TIMEOUT_FLOOR = 500  # ms; lower bound of adaptive request timeouts
+DEFAULT_TIMEOUT_CEILING = 3000  # ms; upper bound, used until RTT is known
+DEFAULT_REMEDIATION_OFF_TIME = 10  # seconds without power
+DEFAULT_REMEDIATION_MAX_ATTEMPTS = 3
+DEFAULT_REMEDIATION_COOLDOWN = 3600  # 1 hour
 HTTPS_PROBE_TIMEOUT = 3.0
+
+SERVICE_PROBE = "probe"
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+EVENT_REMEDIATION = f"{DOMAIN}_remediation"
+
+AGENT_API_PATH = f"/api/{DOMAIN}/agent"
@@ -2,113 +2,256 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-import subprocess
-import sys
 import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import replace
 from datetime import timedelta
+from functools import partial
+from ipaddress import IPv4Address, IPv4Network, ip_address
 from typing import Any
 
-import aiohttp
+from homeassistant.components import zeroconf
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
+    CONF_BROWSE_EVERY,
+    CONF_CYCLE_BUDGET,
+    CONF_INTERFACE,
+    CONF_PROBE_CONCURRENCY,
+    CONF_PROBE_FRESHNESS,
+    CONF_REBOOT_HINT,
+    CONF_RISK_SCHEDULING,
     CONF_SCAN_INTERVAL,
+    CONF_SUBNETS,
+    CONF_SWEEP_CONCURRENCY,
+    CONF_SWEEP_HOSTS_PER_CYCLE,
+    CONF_SWEEP_RATE,
+    CONF_SWEEP_SUBNETS,
     CONF_THRESHOLD_MS,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
+    DEFAULT_BROWSE_EVERY,
+    DEFAULT_CYCLE_BUDGET,
+    DEFAULT_PROBE_CONCURRENCY,
+    DEFAULT_PROBE_FRESHNESS,
+    DEFAULT_REBOOT_HINT,
+    DEFAULT_RISK_SCHEDULING,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SWEEP_CONCURRENCY,
+    DEFAULT_SWEEP_HOSTS_PER_CYCLE,
+    DEFAULT_SWEEP_RATE,
+    DEFAULT_SWEEP_SUBNETS,
     DEFAULT_THRESHOLD_MS,
+    DEFAULT_TIMEOUT_CEILING,
+    DEFAULT_TIMEOUT_FLOOR,
     DOMAIN,
-    HTTPS_PROBE_ENDPOINT,
-    HTTPS_PROBE_TIMEOUT,
-    HK_MODEL_PREFIX,
-    PORT_8008,
-    PORT_8443,
-    PROBE_ENDPOINTS,
 )
+from .discovery import (
+    MDNS_SCAN_SECONDS,
+    async_fetch_eureka_info,
+    async_mdns_resolve,
+    normalize_uuid,
+    parse_eureka_details,
+    parse_eureka_identity,
+    run_mdns_scan,
+)
+from .history import LatencyHistory
+from .models import (
+    FreezeRisk,
+    ProbeSample,
+    Speaker,
+    SpeakerDetails,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+from .planner import ProbePlanner
+from .probe import async_probe_speaker, post_response_ms
+from .profiler import CycleProfiler
+from .remediation import RemediationEngine
+from .risk import FreezeRiskModel
+from .sweep import SubnetSweeper, parse_subnets
+from .timeouts import AdaptiveTimeouts
 
 _LOGGER = logging.getLogger(__name__)
 
-PROBE_TIMEOUT = 5.0
-MDNS_SCAN_SECONDS = 8
+# Minimum time between two on-demand probes of the same speaker.
+ON_DEMAND_PROBE_COOLDOWN = 10.0
+# Share of the cycle budget that discovery may use.
+DISCOVERY_BUDGET_SHARE = 0.5
+# Seconds discovery is always given: the mDNS browse plus scanner start-up.
+DISCOVERY_MIN_SECONDS = MDNS_SCAN_SECONDS + 5
+# Agent results older than this many scan intervals are dropped.
+AGENT_RESULT_MAX_INTERVALS = 2
+# Seconds device details from eureka_info are shown after the last response.
+DETAILS_TTL = 3600
+# High-risk speakers are checked this many times per scan interval.
+RISK_PROBE_SPEEDUP = 4
+# Seconds between looks for high-risk speakers due for an extra check.
+RISK_CHECK_INTERVAL = 30
+# Seconds beyond the health threshold the identity check always waits, so a
+# speaker that slowed down is probed and reported frozen, not unreachable.
+IDENTIFY_THRESHOLD_MARGIN = 0.5
+# Seconds the freeze risk model is held in memory before it is saved.
+RISK_SAVE_DELAY = 60
 STORAGE_KEY = f"{DOMAIN}.speakers"
-STORAGE_VERSION = 1
-
-# Standalone mDNS scanner script — runs in a separate process to bypass
-# HA's Zeroconf monkey-patching.
-_SCANNER_SCRIPT = """
-import json, time
-from zeroconf import ServiceBrowser, Zeroconf
-
-PREFIX = "HK_MODEL_PREFIX_PLACEHOLDER"
-
-class L:
-    def __init__(self):
-        self.f = []
-    def add_service(self, zc, t, n):
-        self._h(zc, t, n)
-    def update_service(self, zc, t, n):
-        self._h(zc, t, n)
-    def remove_service(self, zc, t, n):
-        pass
-    def _h(self, zc, t, n):
-        try:
-            i = zc.get_service_info(t, n)
-        except Exception:
-            return
-        if not i:
-            return
-        p = i.properties or {}
-        m = p.get(b"md", b"").decode("utf-8", errors="replace")
-        if not m.startswith(PREFIX):
-            return
-        u = p.get(b"id", b"").decode("utf-8", errors="replace")
-        if not u:
-            return
-        a = i.parsed_addresses()
-        if not a:
-            return
-        if any(s["uuid"] == u for s in self.f):
-            return
-        self.f.append({
-            "name": p.get(b"fn", b"").decode("utf-8", errors="replace"),
-            "ip": a[0], "uuid": u, "model": m,
-        })
-
-zc = Zeroconf()
-l = L()
-b = ServiceBrowser(zc, "_googlecast._tcp.local.", l)
-time.sleep(SCAN_SECONDS_PLACEHOLDER)
-b.cancel()
-zc.close()
-print(json.dumps(l.f))
-""".replace("HK_MODEL_PREFIX_PLACEHOLDER", HK_MODEL_PREFIX).replace(
-    "SCAN_SECONDS_PLACEHOLDER", str(MDNS_SCAN_SECONDS)
-)
+STORAGE_VERSION = 2
+RISK_STORAGE_KEY = f"{DOMAIN}.freeze_risk"
+RISK_STORAGE_VERSION = 1
+HISTORY_FILE = f"{DOMAIN}.history.jsonl"
 
+type SampleListener = Callable[[str, ProbeSample], None]
 
-def _run_mdns_scan() -> list[dict[str, str]]:
-    """Run mDNS scan in a subprocess to get a fresh Zeroconf instance."""
-    result = subprocess.run(
-        [sys.executable, "-c", _SCANNER_SCRIPT],
-        capture_output=True,
-        text=True,
-        timeout=MDNS_SCAN_SECONDS + 10,
-    )
-    if result.returncode != 0:
-        _LOGGER.error("mDNS scanner failed: %s", result.stderr[:500])
-        return []
+
+def _is_default_entry(entry: ConfigEntry) -> bool:
+    """Return True if the entry monitors the default network segment."""
+    return not entry.data.get(CONF_INTERFACE) and not entry.data.get(CONF_SUBNETS)
+
+
+def storage_key(entry: ConfigEntry) -> str:
+    """Return the speaker registry store key of a config entry.
+
+    The default-network entry keeps the key used before multiple entries
+    were supported, so an existing registry is picked up unchanged.
+    """
+    if _is_default_entry(entry):
+        return STORAGE_KEY
+    return f"{STORAGE_KEY}.{entry.entry_id}"
+
+
+def risk_storage_key(entry: ConfigEntry) -> str:
+    """Return the freeze risk model store key of a config entry."""
+    if _is_default_entry(entry):
+        return RISK_STORAGE_KEY
+    return f"{RISK_STORAGE_KEY}.{entry.entry_id}"
+
+
+def history_file(entry: ConfigEntry) -> str:
+    """Return the latency history file name of a config entry."""
+    if _is_default_entry(entry):
+        return HISTORY_FILE
+    return f"{HISTORY_FILE.removesuffix('.jsonl')}.{entry.entry_id}.jsonl"
+
+
+def entry_segment(entry: ConfigEntry) -> list[IPv4Network]:
+    """Return the subnets a config entry monitors, or [] for any address."""
     try:
-        return json.loads(result.stdout)
-    except json.JSONDecodeError:
-        _LOGGER.error("mDNS scanner returned invalid JSON: %s", result.stdout[:200])
+        return parse_subnets(entry.data.get(CONF_SUBNETS, ""))
+    except ValueError:
+        _LOGGER.error("Invalid subnets for %s, monitoring any address", entry.title)
         return []
 
 
+def in_segment(ip: str, segment: list[IPv4Network]) -> bool:
+    """Return True if ``ip`` is in one of the subnets, or there are none."""
+    if not segment:
+        return True
+    try:
+        address = ip_address(ip)
+    except ValueError:
+        return False
+    return isinstance(address, IPv4Address) and any(
+        address in network for network in segment
+    )
+
+
+def _speaker_signature(status: SpeakerStatus) -> tuple[Any, ...]:
+    """Return the values an entity renders for a speaker, for change detection."""
+    return (
+        status.speaker,
+        status.health.healthy,
+        status.health.response_time_ms,
+        status.stale,
+        status.details,
+        # The estimated rate drifts with every check; only a new level or
+        # recommendation is worth a state write.
+        status.risk and (status.risk.level, status.risk.reboot_recommended),
+    )
+
+
+def _probe_response(
+    speaker: Speaker, status: SpeakerStatus | None, rate_limited: bool = False
+) -> dict[str, Any]:
+    """Return the service response entry for an on-demand probe."""
+    if status is None:
+        return {**speaker.as_dict(), "reachable": False, "rate_limited": rate_limited}
+    return {**status.as_dict(), "reachable": True, "rate_limited": rate_limited}
+
+
+class _SingleFlight:
+    """Run at most one operation per key at a time.
+
+    Callers asking for a key whose operation is in flight wait for that
+    operation and share its result or exception. The operation runs as its
+    own task and is cancelled only once every caller waiting for it has been
+    cancelled.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no operations in flight."""
+        # In-flight task per key, with the number of callers waiting for it.
+        self._flights: dict[Hashable, list[Any]] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Return True if an operation for ``key`` is running."""
+        return key in self._flights
+
+    async def run[T](self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of the operation for ``key``, starting it if needed."""
+        flight = self._flights.get(key)
+        if flight is None:
+            task = asyncio.create_task(factory())
+            flight = self._flights[key] = [task, 0]
+
+            def _done(_: asyncio.Task[T]) -> None:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+            task.add_done_callback(_done)
+        task, _ = flight
+        flight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            flight[1] -= 1
+            if not flight[1] and not task.done():
+                # A caller arriving while the task winds down starts afresh
+                # instead of joining a cancelled run.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                task.cancel()
+
+
+class _SpeakerStore(Store[dict[str, list[dict[str, str]]]]):
+    """Speaker registry store with migration of older storage layouts."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, list[dict[str, str]]]:
+        """Migrate the registry to the current storage layout."""
+        if old_major_version == 1:
+            # Version 1 stored a dict of speaker dicts keyed by UUID.
+            speakers = []
+            for uuid, speaker in old_data.items():
+                try:
+                    speakers.append(Speaker.from_dict({"uuid": uuid, **speaker}))
+                except KeyError:
+                    _LOGGER.warning("Dropping malformed stored speaker %s", uuid)
+            return {"speakers": [speaker.as_dict() for speaker in speakers]}
+        return old_data
+
+
 class HKCitationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator that discovers and health-checks HK Citation speakers."""
 
@@ -121,17 +264,70 @@ class HKCitationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Speaker registry — persisted to disk via HA Store so it survives
         # HA restarts. Speakers that stop advertising on mDNS but are still
         # reachable via HTTP will continue to be health-checked.
-        self._speakers: dict[str, dict[str, str]] = {}
-        self._store = Store[dict[str, dict[str, str]]](
-            hass, STORAGE_VERSION, STORAGE_KEY
-        )
+        self._speakers: dict[str, Speaker] = {}
+        self._store = _SpeakerStore(hass, STORAGE_VERSION, storage_key(entry))
+        # Network segment of this entry: the interface mDNS browses on and
+        # the subnets its speakers must be in. Empty means the default.
+        self.interface: str = entry.data.get(CONF_INTERFACE) or ""
+        self.segment = entry_segment(entry)
         self._initial_scan_done = False
+        # Per-speaker signatures of the data last dispatched to entities, used
+        # to notify only the entities whose speaker actually changed.
+        self._published: dict[str, tuple[Any, ...]] = {}
+        self._last_dispatch_success: bool | None = None
+        # Monotonic time of the last on-demand probe per speaker UUID.
+        self._last_on_demand_probe: dict[str, float] = {}
+        self._sweeper = self._build_sweeper()
+        # Latest result per speaker UUID pushed by remote probe agents, with
+        # its monotonic receive time and the reporting agent.
+        self._agent_results: dict[str, tuple[float, str, SpeakerStatus]] = {}
+        # Live probe sample listeners with the speaker UUID they follow, or
+        # None for the whole fleet.
+        self._sample_listeners: list[tuple[str | None, SampleListener]] = []
+        self._remediation = RemediationEngine(self)
+        self.planner = ProbePlanner()
+        self.history = LatencyHistory(
+            hass.config.path(STORAGE_DIR, history_file(entry))
+        )
+        # Speakers whose check did not finish before the last cycle deadline.
+        self._stale: set[str] = set()
+        self.overruns = 0
+        self.discovery_timeouts = 0
+        self.ip_conflicts = 0
+        # (UUID, IP) of registry entries already reported as demoted there.
+        self._conflicts_seen: set[tuple[str, str]] = set()
+        # Cycles since the last full mDNS browse, and the IPs being checked
+        # in the running cycle.
+        self._cycles_since_browse: int | None = None
+        self._cycle_ips: set[str] = set()
+        # Full cycles, discovery runs and host checks in flight, so
+        # concurrent requests for the same work share one run.
+        self._flights = _SingleFlight()
+        # Profiler of the next cycles while the profile service is active.
+        self.profiler: CycleProfiler | None = None
+        # Latest check result per speaker UUID with its monotonic time.
+        self._checked: dict[str, tuple[float, SpeakerStatus]] = {}
+        # Device details per normalized speaker UUID, parsed from the
+        # eureka_info responses of identity checks, with their monotonic time.
+        self._details: dict[str, tuple[float, SpeakerDetails]] = {}
+        # Freezes and healthy hours per uptime window, and the low-risk
+        # speakers whose check was left out of the last cycle.
+        self.risk = FreezeRiskModel()
+        self._risk_store: Store[dict[str, Any]] = Store(
+            hass, RISK_STORAGE_VERSION, risk_storage_key(entry)
+        )
+        self._deferred: set[str] = set()
+        # Speaker checks of cycles and extra high-risk checks in flight at once.
+        self._probe_slots = self._build_probe_slots()
+        # Request timeouts per speaker IP, from its identity check durations.
+        self.timeouts = AdaptiveTimeouts(*self._timeout_bounds())
+        self.last_cycle_seconds: float | None = None
 
         scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
+            name=f"{DOMAIN} ({entry.title})",
             update_interval=timedelta(seconds=scan_interval),
         )
 
@@ -139,43 +335,158 @@ class HKCitationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Load persisted speaker registry from disk."""
         data = await self._store.async_load()
         if data:
-            self._speakers = data
+            self._speakers = {
+                speaker.uuid: speaker
+                for speaker in map(Speaker.from_dict, data["speakers"])
+            }
             _LOGGER.info(
                 "Loaded %d speakers from persistent storage", len(self._speakers)
             )
 
+    async def async_load_risk(self) -> None:
+        """Load the persisted freeze risk model from disk."""
+        if data := await self._risk_store.async_load():
+            self.risk.load(data)
+
+    async def async_save_risk(self) -> None:
+        """Write the freeze risk model to disk now, replacing a delayed save."""
+        await self._risk_store.async_save(self.risk.as_dict())
+
+    async def async_load_history(self) -> None:
+        """Load the persisted latency history from disk."""
+        await self.hass.async_add_executor_job(self.history.load)
+
+    async def async_save_history(self) -> None:
+        """Append new latency history to disk, compacting the log if due.
+
+        A failed write is logged and does not raise: the history stays in
+        memory, and the next compaction writes it out whole.
+        """
+        try:
+            if self.history.needs_compaction:
+                await self.hass.async_add_executor_job(
+                    self.history.rewrite, self.history.snapshot()
+                )
+            elif lines := self.history.drain():
+                await self.hass.async_add_executor_job(self.history.append, lines)
+        except OSError as err:
+            _LOGGER.warning("Could not save latency history: %s", err)
+
     async def _save_speakers(self) -> None:
         """Persist the speaker registry to disk."""
-        await self._store.async_save(dict(self._speakers))
+        await self._store.async_save(
+            {"speakers": [speaker.as_dict() for speaker in self._speakers.values()]}
+        )
 
     @property
     def threshold_ms(self) -> float:
         """Return the configured response time threshold in milliseconds."""
         return self.entry.options.get(CONF_THRESHOLD_MS, DEFAULT_THRESHOLD_MS)
 
+    @property
+    def cycle_budget(self) -> float:
+        """Return the time budget of a cycle in seconds.
+
+        The configured budget is capped at the scan interval, so a cycle
+        always finishes before the next one is due.
+        """
+        budget = self.entry.options.get(CONF_CYCLE_BUDGET, DEFAULT_CYCLE_BUDGET)
+        return min(budget, self.update_interval.total_seconds())
+
+    def _timeout_bounds(self) -> tuple[float, float]:
+        """Return the configured adaptive timeout floor and ceiling in seconds."""
+        options = self.entry.options
+        return (
+            options.get(CONF_TIMEOUT_FLOOR, DEFAULT_TIMEOUT_FLOOR) / 1000,
+            options.get(CONF_TIMEOUT_CEILING, DEFAULT_TIMEOUT_CEILING) / 1000,
+        )
+
     def register_new_speaker_callback(self, callback_fn) -> None:
         """Register a callback to be called when new speakers are discovered."""
         self._new_speaker_callbacks.append(callback_fn)
 
+    def _build_probe_slots(self) -> asyncio.Semaphore:
+        """Create the semaphore limiting concurrent speaker checks."""
+        return asyncio.Semaphore(
+            self.entry.options.get(CONF_PROBE_CONCURRENCY, DEFAULT_PROBE_CONCURRENCY)
+        )
+
+    def _build_sweeper(self) -> SubnetSweeper | None:
+        """Create the subnet sweeper from options, or None if disabled."""
+        options = self.entry.options
+        try:
+            networks = parse_subnets(
+                options.get(CONF_SWEEP_SUBNETS, DEFAULT_SWEEP_SUBNETS)
+            )
+        except ValueError as err:
+            _LOGGER.error("Invalid subnet sweep ranges, sweep disabled: %s", err)
+            return None
+        if not networks:
+            return None
+        return SubnetSweeper(
+            self._session,
+            networks,
+            concurrency=options.get(CONF_SWEEP_CONCURRENCY, DEFAULT_SWEEP_CONCURRENCY),
+            rate=options.get(CONF_SWEEP_RATE, DEFAULT_SWEEP_RATE),
+            hosts_per_cycle=options.get(
+                CONF_SWEEP_HOSTS_PER_CYCLE, DEFAULT_SWEEP_HOSTS_PER_CYCLE
+            ),
+        )
+
     async def _discover_speakers(self) -> None:
-        """Run mDNS scan and merge results into the speaker registry."""
-        found_list = await self.hass.async_add_executor_job(_run_mdns_scan)
+        """Run mDNS scan and subnet sweep, merging results into the registry.
+
+        The full mDNS browse runs every ``browse_every`` cycles; in between,
+        speakers that move are found by resolving their own service name.
+        """
+        browse_every = self.entry.options.get(CONF_BROWSE_EVERY, DEFAULT_BROWSE_EVERY)
+        browse = (
+            self._cycles_since_browse is None
+            or self._cycles_since_browse + 1 >= browse_every
+        )
+        found_list: list[dict[str, str]] = []
+        if browse:
+            found_list = await self.hass.async_add_executor_job(
+                run_mdns_scan, self.interface or None
+            )
+            self._cycles_since_browse = 0
+        else:
+            self._cycles_since_browse += 1
+
+        if self._sweeper is not None:
+            found_uuids = {s["uuid"] for s in found_list}
+            known_ips = {speaker.ip for speaker in self._speakers.values()}
+            known_ips.update(s["ip"] for s in found_list)
+            swept = await self._sweeper.async_sweep(skip_ips=known_ips)
+            found_list.extend(s for s in swept if s["uuid"] not in found_uuids)
+        found_list = [s for s in found_list if self._owns_ip(s["ip"])]
 
         changed = False
-        for s in found_list:
-            uuid = s["uuid"]
-            old = self._speakers.get(uuid)
-            self._speakers[uuid] = s
-            if not old:
-                _LOGGER.info("Discovered speaker: %s at %s", s["name"], s["ip"])
-                changed = True
-            elif old["ip"] != s["ip"]:
-                _LOGGER.info(
-                    "Speaker %s IP changed: %s -> %s", s["name"], old["ip"], s["ip"]
-                )
+        for uuid, speaker in list(self._speakers.items()):
+            if not self._owns_ip(speaker.ip):
+                self._async_release_speaker(uuid)
                 changed = True
+        for found in found_list:
+            s = Speaker.from_dict(found)
+            old = self._speakers.get(s.uuid)
+            if old and not s.service:
+                # Swept speakers keep the service name mDNS reported.
+                s = replace(s, service=old.service)
+            if old == s:
+                continue
+            self._speakers[s.uuid] = s
+            if not old:
+                _LOGGER.info("Discovered speaker: %s at %s", s.name, s.ip)
+            elif old.ip != s.ip:
+                _LOGGER.info("Speaker %s IP changed: %s -> %s", s.name, old.ip, s.ip)
+            changed = True
 
-        if found_list:
+        if not browse:
+            _LOGGER.debug(
+                "mDNS browse skipped this cycle, %d speakers in registry",
+                len(self._speakers),
+            )
+        elif found_list:
             _LOGGER.debug(
                 "mDNS scan found %d speakers (registry total: %d)",
                 len(found_list),
@@ -192,122 +503,263 @@ class HKCitationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if changed:
             await self._save_speakers()
 
-    async def _verify_speaker_reachable(self, ip: str) -> bool:
-        """Quick check if a speaker is reachable on port 8008."""
-        url = f"http://{ip}:{PORT_8008}/setup/eureka_info"
-        try:
-            async with self._session.get(
-                url, timeout=aiohttp.ClientTimeout(total=3)
-            ) as resp:
-                return resp.status == 200
-        except (aiohttp.ClientError, TimeoutError):
-            return False
-
-    async def _probe_speaker(self, ip: str) -> dict[str, Any]:
-        """Probe a speaker's health via port 8008 POST timing and port 8443 HTTPS timeout."""
-        probes = []
-
-        # Port 8008 POST timing probes
-        for endpoint, payload in PROBE_ENDPOINTS:
-            url = f"http://{ip}:{PORT_8008}{endpoint}"
-            try:
-                start = time.monotonic()
-                async with self._session.post(
-                    url,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT),
-                ) as resp:
-                    elapsed_ms = (time.monotonic() - start) * 1000
-                    probes.append(
-                        {
-                            "endpoint": endpoint.split("/")[-1],
-                            "ms": round(elapsed_ms, 1),
-                            "error": "",
-                        }
-                    )
-            except TimeoutError:
-                probes.append(
-                    {
-                        "endpoint": endpoint.split("/")[-1],
-                        "ms": PROBE_TIMEOUT * 1000,
-                        "error": "timed out",
-                    }
-                )
-            except aiohttp.ClientError as err:
-                probes.append(
-                    {
-                        "endpoint": endpoint.split("/")[-1],
-                        "ms": 0,
-                        "error": str(err),
-                    }
-                )
+    async def _async_identify(self, ip: str) -> str | None:
+        """Return the UUID of the Citation answering at ``ip``, or None.
 
-        # Port 8443 HTTPS probe — timeout means frozen
-        https_url = f"https://{ip}:{PORT_8443}{HTTPS_PROBE_ENDPOINT}"
-        try:
-            start = time.monotonic()
-            async with self._session.get(
-                https_url,
-                ssl=False,
-                timeout=aiohttp.ClientTimeout(total=HTTPS_PROBE_TIMEOUT),
-            ) as resp:
-                elapsed_ms = (time.monotonic() - start) * 1000
-                probes.append(
-                    {
-                        "endpoint": "https:8443/eureka_info",
-                        "ms": round(elapsed_ms, 1),
-                        "error": "",
-                    }
+        The eureka_info request doubles as the reachability check, and the
+        device details in its response are cached for the speaker. Its
+        connect timeout adapts to the host's earlier response times, so a
+        host that went offline is given up on quickly. The whole request
+        never ends before the health threshold: a frozen speaker that accepts
+        the connection but answers slowly must reach the probes.
+        """
+        started = time.monotonic()
+        connect_timeout = self.timeouts.timeout(ip)
+        timeout = max(
+            connect_timeout, self.threshold_ms / 1000 + IDENTIFY_THRESHOLD_MARGIN
+        )
+        info = await async_fetch_eureka_info(
+            self._session, ip, timeout, connect_timeout=connect_timeout
+        )
+        if info is None:
+            self.timeouts.record_failure(ip)
+            return None
+        self.timeouts.record(ip, time.monotonic() - started)
+        # Registry speakers are matched by UUID; the model name only matters
+        # when discovery decides whether an unknown host is a Citation.
+        if (identity := parse_eureka_identity(ip, info, require_model=False)) is None:
+            return None
+        self._details[identity["uuid"]] = (time.monotonic(), parse_eureka_details(info))
+        return identity["uuid"]
+
+    def details(self, uuid: str) -> SpeakerDetails | None:
+        """Return a speaker's cached device details, or None if expired."""
+        cached = self._details.get(normalize_uuid(uuid))
+        if cached is None or time.monotonic() - cached[0] > DETAILS_TTL:
+            return None
+        return cached[1]
+
+    async def _probe_speaker(self, speaker: Speaker) -> SpeakerHealth:
+        """Probe a speaker's health, publishing each sample to live listeners.
+
+        The probe planner picks which probes run and learns from the result.
+        """
+        on_sample = None
+        if self._sample_listeners:
+            on_sample = partial(self._async_publish_sample, speaker.uuid)
+        health = await async_probe_speaker(
+            self._session,
+            speaker.ip,
+            self.threshold_ms,
+            on_sample,
+            self.planner.plan(speaker.uuid),
+            connect_timeout=self.timeouts.timeout(speaker.ip),
+        )
+        self.planner.record(speaker.uuid, health, self.threshold_ms)
+        return health
+
+    @callback
+    def async_subscribe_samples(
+        self, listener: SampleListener, uuid: str | None = None
+    ) -> CALLBACK_TYPE:
+        """Call ``listener`` with each probe sample as it completes.
+
+        Only samples of speaker ``uuid`` are delivered, or of every speaker
+        if it is None. Listeners run in the event loop and must not block.
+        Returns a function that removes the listener.
+        """
+        subscription = (uuid, listener)
+        self._sample_listeners.append(subscription)
+
+        @callback
+        def _remove() -> None:
+            self._sample_listeners.remove(subscription)
+
+        return _remove
+
+    @callback
+    def _async_publish_sample(self, uuid: str, sample: ProbeSample) -> None:
+        """Deliver one probe sample to the live listeners following it."""
+        for followed, listener in list(self._sample_listeners):
+            if followed is None or followed == uuid:
+                listener(uuid, sample)
+
+    @property
+    def probe_freshness(self) -> float:
+        """Return the age in seconds up to which a probe result is reused.
+
+        A window not shorter than the scan interval is ignored, so a cycle
+        never replays the previous cycle's results.
+        """
+        freshness = self.entry.options.get(
+            CONF_PROBE_FRESHNESS, DEFAULT_PROBE_FRESHNESS
+        )
+        return freshness if freshness < self.update_interval.total_seconds() else 0
+
+    def _fresh_status(self, uuid: str, max_age: float) -> SpeakerStatus | None:
+        """Return the speaker's latest check result if at most ``max_age`` old."""
+        if max_age <= 0 or (checked := self._checked.get(uuid)) is None:
+            return None
+        checked_at, status = checked
+        return status if time.monotonic() - checked_at <= max_age else None
+
+    @property
+    def risk_scheduling(self) -> bool:
+        """Return True if probe frequency follows the speakers' freeze risk."""
+        return self.entry.options.get(CONF_RISK_SCHEDULING, DEFAULT_RISK_SCHEDULING)
+
+    def _freeze_risk(self, speaker: Speaker) -> FreezeRisk | None:
+        """Return the speaker's freeze risk now, or None if unknown.
+
+        The reboot recommendation is dropped unless the reboot hint is enabled.
+        """
+        details = self.details(speaker.uuid)
+        if details is None or details.booted_at is None:
+            return None
+        risk = self.risk.assess(
+            speaker.uuid, speaker.model, details.booted_at, time.time()
+        )
+        if risk is not None and not self.entry.options.get(
+            CONF_REBOOT_HINT, DEFAULT_REBOOT_HINT
+        ):
+            risk = replace(risk, reboot_recommended=None)
+        return risk
+
+    def _defer_check(self, speaker: Speaker, status: SpeakerStatus | None) -> bool:
+        """Return True if a low-risk speaker's check is left out of this cycle.
+
+        With risk scheduling, a speaker that was healthy at its last check
+        and is at low freeze risk is checked every other cycle.
+        """
+        if (
+            self.risk_scheduling
+            and speaker.uuid not in self._deferred
+            and status is not None
+            and status.speaker == speaker
+            and status.health.healthy
+            and not status.stale
+            and (risk := self._freeze_risk(speaker)) is not None
+            and risk.level == "low"
+        ):
+            self._deferred.add(speaker.uuid)
+            return True
+        self._deferred.discard(speaker.uuid)
+        return False
+
+    @callback
+    def async_start_risk_checks(self) -> CALLBACK_TYPE:
+        """Start the extra checks of high-risk speakers; return the stop function."""
+
+        @callback
+        def _tick(now: Any) -> None:
+            if self.risk_scheduling and not self._flights.in_flight("cycle"):
+                self.entry.async_create_background_task(
+                    self.hass,
+                    self._flights.run("high_risk", self._async_check_high_risk),
+                    f"{DOMAIN} high-risk checks ({self.entry.title})",
                 )
-        except TimeoutError:
-            probes.append(
-                {
-                    "endpoint": "https:8443/eureka_info",
-                    "ms": HTTPS_PROBE_TIMEOUT * 1000,
-                    "error": "frozen (port 8443 timeout)",
-                }
-            )
-        except aiohttp.ClientError as err:
-            probes.append(
-                {
-                    "endpoint": "https:8443/eureka_info",
-                    "ms": 0,
-                    "error": str(err),
-                }
+
+        return async_track_time_interval(
+            self.hass, _tick, timedelta(seconds=RISK_CHECK_INTERVAL)
+        )
+
+    async def _async_check_high_risk(self) -> None:
+        """Check the high-risk speakers due for an extra check.
+
+        Between cycles, healthy speakers in a high-risk uptime window are
+        checked ``RISK_PROBE_SPEEDUP`` times per scan interval, so a freeze
+        is caught and remediated sooner.
+        """
+        if not self.data:
+            return
+        interval = self.update_interval.total_seconds() / RISK_PROBE_SPEEDUP
+        now = time.monotonic()
+        due = [
+            status.speaker
+            for uuid, status in self.data["speakers"].items()
+            if uuid not in self._agent_results
+            and status.health.healthy
+            and status.risk is not None
+            and status.risk.level == "high"
+            and (
+                (checked := self._checked.get(uuid)) is None
+                or now - checked[0] >= interval
             )
+        ]
+        if not due:
+            return
+        _LOGGER.debug("Extra check of %d high-risk speakers", len(due))
 
-        # Evaluate health — unhealthy if any probe fails
-        post_probes = probes[:2]
-        https_probe = probes[2] if len(probes) > 2 else None
-        worst_post_time = max((p["ms"] for p in post_probes), default=0)
-        post_slow = worst_post_time >= self.threshold_ms
-        post_errors = any(p["error"] for p in post_probes)
-        https_failed = https_probe is not None and bool(https_probe["error"])
-
-        healthy = not post_slow and not post_errors and not https_failed
-        worst_time = max((p["ms"] for p in probes), default=0)
-
-        error = ""
-        if https_failed:
-            error = https_probe["error"]
-        elif post_errors:
-            error = next(p["error"] for p in post_probes if p["error"])
-
-        return {
-            "healthy": healthy,
-            "response_time_ms": worst_time,
-            "probes": probes,
-            "error": error,
-        }
+        async def _check(speaker: Speaker) -> SpeakerStatus | None:
+            async with self._probe_slots:
+                return await self._async_check_speaker(speaker)
+
+        statuses = await asyncio.gather(*(_check(speaker) for speaker in due))
+        self._async_publish_statuses(
+            {
+                speaker.uuid: status
+                for speaker, status in zip(due, statuses, strict=True)
+            }
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
-        """Discover speakers and check their health."""
+        """Run a cycle, or join the one already running."""
+        return await self._flights.run("cycle", self._async_run_cycle)
+
+    @callback
+    def async_start_profiling(self, cycles: int) -> CycleProfiler:
+        """Profile the next ``cycles`` cycles, writing to the config directory."""
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.profiler = CycleProfiler(
+            cycles,
+            self.hass.config.path(f"{DOMAIN}_profile_{stamp}_{self.entry.entry_id}"),
+        )
+        return self.profiler
+
+    @callback
+    def async_cancel_profiling(self) -> None:
+        """Stop a requested profile without writing it."""
+        if (profiler := self.profiler) is not None:
+            self.profiler = None
+            profiler.cancel()
+
+    async def _async_run_cycle(self) -> dict[str, Any]:
+        """Run a cycle, profiling it if profiling was requested."""
+        if (profiler := self.profiler) is None:
+            return await self._async_cycle()
+        try:
+            profiler.start_cycle()
+        except ValueError:
+            # Only one cProfile can be active; another entry's cycle or HA's
+            # profiler holds it. This cycle runs unprofiled.
+            _LOGGER.debug("Profiler busy, cycle of %s not profiled", self.name)
+            return await self._async_cycle()
+        try:
+            return await self._async_cycle()
+        finally:
+            if profiler.stop_cycle():
+                self.profiler = None
+                try:
+                    await self.hass.async_add_executor_job(profiler.write)
+                except OSError as err:
+                    _LOGGER.error("Could not write cycle profile: %s", err)
+                else:
+                    _LOGGER.info(
+                        "Wrote cycle profile to %s and allocations to %s",
+                        profiler.profile_path,
+                        profiler.allocations_path,
+                    )
+
+    async def _async_cycle(self) -> dict[str, Any]:
+        """Discover speakers and check their health within the cycle budget."""
+        started = time.monotonic()
+        budget = self.cycle_budget
         # Run mDNS discovery on first poll and periodically to catch new
         # speakers or IP changes. After the initial scan, the registry
         # persists so a missed scan doesn't lose speakers.
         if not self._initial_scan_done:
             try:
-                await self._discover_speakers()
+                await self._async_discover_within(budget * DISCOVERY_BUDGET_SHARE)
             except Exception as err:
                 if not self._speakers:
                     raise UpdateFailed(f"mDNS scan failed: {err}") from err
@@ -319,47 +771,512 @@ class HKCitationCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             # Run discovery in the background — merge any updates
             try:
-                await self._discover_speakers()
+                await self._async_discover_within(budget * DISCOVERY_BUDGET_SHARE)
             except Exception:
                 _LOGGER.debug("mDNS scan failed, using cached speakers", exc_info=True)
 
-        if not self._speakers:
+        agent_speakers = self._fresh_agent_results()
+        if not self._speakers and not agent_speakers:
             _LOGGER.warning("No HK Citation speakers in registry")
             return {"speakers": {}}
 
-        # Remove speakers that are no longer reachable at their known IP
-        stale = []
-        speakers: dict[str, dict[str, Any]] = {}
-        for uuid, speaker_info in self._speakers.items():
-            reachable = await self._verify_speaker_reachable(speaker_info["ip"])
-            if not reachable:
-                _LOGGER.debug(
-                    "Speaker %s at %s not reachable, skipping probes",
-                    speaker_info["name"],
-                    speaker_info["ip"],
-                )
-                # Keep in registry (IP may be temporarily unreachable) but
-                # don't include in data so entity shows unavailable
+        # Checks keep their share of the budget even when discovery took
+        # its minimum time beyond its own share.
+        deadline = max(
+            started + budget,
+            time.monotonic() + budget * (1 - DISCOVERY_BUDGET_SHARE),
+        )
+        # Speakers reported by a remote agent were probed from inside their
+        # own segment and are not probed here.
+        speakers = await self._async_check_speakers(
+            [
+                speaker
+                for uuid, speaker in self._speakers.items()
+                if uuid not in agent_speakers
+            ],
+            deadline,
+        )
+
+        speakers.update(agent_speakers)
+        self._announce_new_speakers(speakers)
+        await self.async_save_history()
+        self.last_cycle_seconds = round(time.monotonic() - started, 1)
+
+        return {"speakers": speakers}
+
+    async def _async_discover_within(self, seconds: float) -> None:
+        """Run discovery, waiting for it at most ``seconds``.
+
+        The wait is never shorter than ``DISCOVERY_MIN_SECONDS``. Discovery
+        that runs out of time is not cancelled, as its scanner subprocess
+        would keep running anyway; it finishes in the background, merging
+        what it found, and the next cycle joins it if it is still running.
+        """
+        discovery = self.entry.async_create_background_task(
+            self.hass,
+            self._flights.run("discovery", self._discover_speakers),
+            f"{DOMAIN} discovery ({self.entry.title})",
+        )
+        try:
+            async with asyncio.timeout(max(seconds, DISCOVERY_MIN_SECONDS)):
+                await asyncio.shield(discovery)
+        except TimeoutError:
+            self.discovery_timeouts += 1
+            raise
+
+    async def _async_check_speakers(
+        self, to_check: list[Speaker], deadline: float
+    ) -> dict[str, SpeakerStatus]:
+        """Check speakers concurrently until the cycle deadline.
+
+        Speakers left unfinished by the previous cycle are checked first. At
+        the deadline the outstanding checks are cancelled; those speakers
+        keep their previous status, marked stale, and go first next cycle.
+        Unreachable speakers stay in the registry (the IP may be temporarily
+        unreachable) but are left out of the result, so their entity shows
+        unavailable.
+        """
+        previous = self.data.get("speakers", {}) if self.data else {}
+        to_check.sort(key=lambda speaker: speaker.uuid not in self._stale)
+        self.planner.start_cycle()
+        # Registry entries sharing an IP after DHCP churn are checked as one
+        # host, so each IP is identified and probed at most once.
+        by_ip: dict[str, list[Speaker]] = {}
+        speakers: dict[str, SpeakerStatus] = {}
+        for speaker in to_check:
+            fresh = self._fresh_status(speaker.uuid, self.probe_freshness)
+            if fresh is not None and fresh.speaker == speaker:
+                speakers[speaker.uuid] = fresh
+            elif self._defer_check(speaker, previous.get(speaker.uuid)):
+                speakers[speaker.uuid] = previous[speaker.uuid]
+            else:
+                by_ip.setdefault(speaker.ip, []).append(speaker)
+        self._cycle_ips = set(by_ip)
+
+        async def _check(ip: str, claimants: list[Speaker]) -> SpeakerStatus | None:
+            async with self._probe_slots:
+                return await self._async_check_host(ip, claimants)
+
+        tasks = {
+            asyncio.create_task(_check(ip, claimants)): claimants
+            for ip, claimants in by_ip.items()
+        }
+        self._stale = set()
+        if not tasks:
+            return speakers
+        _, pending = await asyncio.wait(
+            tasks, timeout=max(deadline - time.monotonic(), 0)
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        self._cycle_ips = set()
+
+        for task in tasks:
+            if not task.cancelled() and (status := task.result()) is not None:
+                speakers[status.speaker.uuid] = status
+        for task, claimants in tasks.items():
+            if not task.cancelled():
                 continue
+            for speaker in claimants:
+                if speaker.uuid in speakers:
+                    continue
+                self._stale.add(speaker.uuid)
+                if (status := previous.get(speaker.uuid)) is not None:
+                    speakers[speaker.uuid] = replace(status, stale=True)
 
-            health = await self._probe_speaker(speaker_info["ip"])
-            speakers[uuid] = {
-                **speaker_info,
-                **health,
-            }
+        if self._stale:
+            self.overruns += 1
+            _LOGGER.warning(
+                "Cycle hit its %.0f s budget with %d of %d speakers unchecked; "
+                "they keep their previous state and go first next cycle",
+                self.cycle_budget,
+                len(self._stale),
+                len(to_check),
+            )
+        return speakers
 
+    def _announce_new_speakers(self, speakers: dict[str, SpeakerStatus]) -> None:
+        """Run the new-speaker callbacks for speakers not seen before."""
         new_uuids = set(speakers.keys()) - self._known_uuids
         if new_uuids:
             self._known_uuids.update(new_uuids)
             for cb in self._new_speaker_callbacks:
                 cb(new_uuids)
 
-        return {"speakers": speakers}
+    def _fresh_agent_results(self) -> dict[str, SpeakerStatus]:
+        """Drop expired agent results and return the remaining statuses."""
+        max_age = self.update_interval.total_seconds() * AGENT_RESULT_MAX_INTERVALS
+        now = time.monotonic()
+        for uuid, (received, agent_id, _) in list(self._agent_results.items()):
+            if now - received > max_age:
+                _LOGGER.debug("Result for %s from agent %s expired", uuid, agent_id)
+                del self._agent_results[uuid]
+        return {uuid: status for uuid, (_, _, status) in self._agent_results.items()}
+
+    @callback
+    def async_merge_agent_results(
+        self, agent_id: str, statuses: list[SpeakerStatus]
+    ) -> None:
+        """Merge a batch of results pushed by a remote probe agent.
+
+        Speakers reported by an agent are not probed locally while their agent
+        result is fresh; only the affected entities are notified.
+        """
+        now = time.monotonic()
+        speakers = dict(self.data.get("speakers", {}) if self.data else {})
+        for status in statuses:
+            self._agent_results[status.speaker.uuid] = (now, agent_id, status)
+            speakers[status.speaker.uuid] = status
+            if (ms := post_response_ms(status.health)) is not None:
+                self.history.add(status.speaker.uuid, time.time(), ms)
+            if self._sample_listeners:
+                for sample in status.health.probes:
+                    self._async_publish_sample(status.speaker.uuid, sample)
+        _LOGGER.debug("Agent %s reported %d speakers", agent_id, len(statuses))
+
+        self.data = {**(self.data or {}), "speakers": speakers}
+        self._announce_new_speakers(speakers)
+        self.async_update_listeners()
+
+    @property
+    def speakers(self) -> dict[str, Speaker]:
+        """Return the speaker registry keyed by UUID."""
+        return dict(self._speakers)
+
+    def has_speaker(self, uuid: str) -> bool:
+        """Return True if the speaker is in this coordinator's registry."""
+        return uuid in self._speakers
+
+    def _owns_ip(self, ip: str) -> bool:
+        """Return True if a speaker at ``ip`` belongs to this entry.
+
+        An entry without subnets takes every address, except those inside
+        another entry's subnets, so no speaker is monitored twice.
+        """
+        if self.segment:
+            return in_segment(ip, self.segment)
+        return not any(
+            in_segment(ip, segment)
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id != self.entry.entry_id
+            and (segment := entry_segment(entry))
+        )
+
+    @callback
+    def _async_release_speaker(self, uuid: str) -> None:
+        """Hand a speaker over to the entry whose segment it is in.
+
+        It leaves this entry's registry, and its entity and device link are
+        removed, so the other entry can create them under its own ID.
+        """
+        speaker = self._speakers.pop(uuid)
+        self._known_uuids.discard(uuid)
+        _LOGGER.info(
+            "Speaker %s at %s belongs to another entry's segment",
+            speaker.name,
+            speaker.ip,
+        )
+        entity_registry = er.async_get(self.hass)
+        if (
+            entity_id := entity_registry.async_get_entity_id(
+                "binary_sensor", DOMAIN, f"{DOMAIN}_{uuid}"
+            )
+        ) is not None and entity_registry.async_get(
+            entity_id
+        ).config_entry_id == self.entry.entry_id:
+            entity_registry.async_remove(entity_id)
+        device_registry = dr.async_get(self.hass)
+        if (device := device_registry.async_get_device({(DOMAIN, uuid)})) is not None:
+            device_registry.async_update_device(
+                device.id, remove_config_entry_id=self.entry.entry_id
+            )
+
+    async def _async_resolve(self, speaker: Speaker) -> str | None:
+        """Return the IP the speaker's mDNS service name resolves to, or None.
+
+        The query runs on Home Assistant's shared Zeroconf instance, so it
+        needs no process of its own and uses Home Assistant's interfaces.
+        """
+        aiozc = await zeroconf.async_get_async_instance(self.hass)
+        return await async_mdns_resolve(aiozc, speaker.service)
+
+    async def _async_check_speaker(self, speaker: Speaker) -> SpeakerStatus | None:
+        """Check and probe one speaker, or None if it cannot be found."""
+        status = await self._async_check_host(speaker.ip, [speaker])
+        if status is None or status.speaker.uuid != speaker.uuid:
+            return None
+        return status
+
+    async def _async_check_host(
+        self, ip: str, claimants: list[Speaker], resolve: bool = True
+    ) -> SpeakerStatus | None:
+        """Identify the speaker at ``ip`` and probe it, or None if none answers.
+
+        ``claimants`` are the registry entries holding ``ip``. Health is only
+        credited to the speaker the host identifies as. If the host does not
+        answer, the claimants' mDNS service names are resolved to find a
+        speaker that moved to a new IP.
+        """
+        uuid = await self._async_identify(ip)
+        if uuid is None:
+            _LOGGER.debug(
+                "%s at %s not reachable, skipping probes",
+                ", ".join(speaker.name for speaker in claimants),
+                ip,
+            )
+            if resolve:
+                return await self._async_follow_moved(ip, claimants)
+            return None
+        speaker = await self._async_resolve_host(ip, uuid, claimants)
+        if speaker is None:
+            return None
+        # A speaker is probed by one caller at a time, so concurrent checks
+        # neither double its load nor skew each other's timings.
+        return await self._flights.run(
+            ("probe", speaker.uuid), partial(self._async_probe_status, speaker)
+        )
+
+    async def _async_probe_status(self, speaker: Speaker) -> SpeakerStatus:
+        """Probe a speaker and record the result.
+
+        With the speaker's boot time known, the result also feeds the freeze
+        risk model.
+        """
+        health = await self._probe_speaker(speaker)
+        if (ms := post_response_ms(health)) is not None:
+            self.history.add(speaker.uuid, time.time(), ms)
+        details = self.details(speaker.uuid)
+        if details is not None and details.booted_at is not None:
+            now = time.time()
+            if self.risk.observe(
+                speaker.uuid, speaker.model, details.booted_at, health.healthy, now
+            ):
+                _LOGGER.info(
+                    "Speaker %s froze after %.1f h of uptime",
+                    speaker.name,
+                    (now - details.booted_at) / 3600,
+                )
+            self._risk_store.async_delay_save(self.risk.as_dict, RISK_SAVE_DELAY)
+        status = SpeakerStatus(
+            speaker, health, details=details, risk=self._freeze_risk(speaker)
+        )
+        self._checked[speaker.uuid] = (time.monotonic(), status)
+        return status
+
+    async def _async_follow_moved(
+        self, ip: str, claimants: list[Speaker]
+    ) -> SpeakerStatus | None:
+        """Resolve unreachable speakers by service name and check them there.
+
+        A speaker that answers its own mDNS query at a new IP is moved there
+        in the registry and checked in the same cycle. If another speaker
+        in this cycle already holds the new IP, that check covers it.
+        """
+        for speaker in claimants:
+            if (moved := await self._async_relocate(speaker)) is None:
+                continue
+            new_ip = moved.ip
+            if new_ip in self._cycle_ips:
+                return None
+            self._cycle_ips.add(new_ip)
+            return await self._async_check_host(new_ip, [moved], resolve=False)
+        return None
+
+    async def _async_relocate(self, speaker: Speaker) -> Speaker | None:
+        """Move a speaker to the IP its service name resolves to.
+
+        Returns the moved registry entry, or None if the speaker has no
+        service name or does not answer at another IP of this entry.
+        """
+        if not speaker.service:
+            return None
+        new_ip = await self._async_resolve(speaker)
+        if new_ip in (None, speaker.ip) or not self._owns_ip(new_ip):
+            return None
+        _LOGGER.info(
+            "Speaker %s IP changed: %s -> %s (resolved)",
+            speaker.name,
+            speaker.ip,
+            new_ip,
+        )
+        moved = replace(speaker, ip=new_ip)
+        self._speakers[moved.uuid] = moved
+        await self._save_speakers()
+        return moved
+
+    async def _async_relocate_demoted(self, demoted: list[Speaker]) -> None:
+        """Re-resolve demoted speakers, so the next cycle finds them."""
+        await asyncio.gather(*(self._async_relocate(speaker) for speaker in demoted))
+
+    async def _async_resolve_host(
+        self, ip: str, uuid: str, claimants: list[Speaker]
+    ) -> Speaker | None:
+        """Return the registry speaker that identified itself at ``ip``.
+
+        Claimants that are not that speaker hold an outdated IP and are
+        demoted: they are left out of this check and show unavailable until
+        they are found again. Those with a service name are re-resolved in
+        the background; the others wait for discovery. A registry speaker
+        found at an IP it did not hold is moved there.
+        """
+        owner = next(
+            (speaker for speaker in claimants if normalize_uuid(speaker.uuid) == uuid),
+            None,
+        )
+        if owner is None:
+            owner = next(
+                (
+                    speaker
+                    for speaker in self._speakers.values()
+                    if normalize_uuid(speaker.uuid) == uuid and self._owns_ip(ip)
+                ),
+                None,
+            )
+            if owner is not None:
+                _LOGGER.info(
+                    "Speaker %s IP changed: %s -> %s", owner.name, owner.ip, ip
+                )
+                owner = replace(owner, ip=ip)
+                self._speakers[owner.uuid] = owner
+                await self._save_speakers()
+
+        demoted = [speaker for speaker in claimants if speaker != owner]
+        # Each conflict is counted and logged once, not every cycle until
+        # the demoted speaker is found again.
+        if new := [s for s in demoted if (s.uuid, ip) not in self._conflicts_seen]:
+            self._conflicts_seen.update((speaker.uuid, ip) for speaker in new)
+            self.ip_conflicts += 1
+            _LOGGER.warning(
+                "Host %s identifies as %s; not crediting its health to %s",
+                ip,
+                owner.name if owner else uuid,
+                ", ".join(speaker.name for speaker in new),
+            )
+        if resolvable := [speaker for speaker in demoted if speaker.service]:
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_relocate_demoted(resolvable),
+                f"{DOMAIN} relocate demoted speakers ({self.entry.title})",
+            )
+        return owner
+
+    async def async_probe_speakers(self, uuids: set[str]) -> dict[str, dict[str, Any]]:
+        """Probe the given speakers now, outside the regular cycle.
+
+        No discovery is run. Results are merged into ``coordinator.data`` and
+        only the affected entities are notified. A speaker checked within the
+        probe freshness window is not probed; that result is returned. A
+        speaker probed on demand less than ``ON_DEMAND_PROBE_COOLDOWN``
+        seconds ago is not probed again; its latest published result is
+        returned instead. A speaker already being probed is not probed twice;
+        the running probe's result is shared.
+        """
+        now = time.monotonic()
+        current: dict[str, SpeakerStatus] = (
+            self.data.get("speakers", {}) if self.data else {}
+        )
+        results: dict[str, dict[str, Any]] = {}
+        to_probe: list[Speaker] = []
+        for uuid in uuids:
+            if (speaker := self._speakers.get(uuid)) is None:
+                continue
+            if (fresh := self._fresh_status(uuid, self.probe_freshness)) is not None:
+                results[uuid] = _probe_response(speaker, fresh)
+                continue
+            last = self._last_on_demand_probe.get(uuid)
+            if last is not None and now - last < ON_DEMAND_PROBE_COOLDOWN:
+                status = current.get(uuid)
+                results[uuid] = _probe_response(speaker, status, rate_limited=True)
+                continue
+            self._last_on_demand_probe[uuid] = now
+            to_probe.append(speaker)
+
+        if not to_probe:
+            return results
+
+        statuses = await asyncio.gather(
+            *(self._async_check_speaker(speaker) for speaker in to_probe)
+        )
+        for speaker, status in zip(to_probe, statuses, strict=True):
+            results[speaker.uuid] = _probe_response(speaker, status)
+        self._async_publish_statuses(
+            {
+                speaker.uuid: status
+                for speaker, status in zip(to_probe, statuses, strict=True)
+            }
+        )
+        return results
+
+    async def async_reprobe_speaker(self, speaker: Speaker) -> SpeakerStatus | None:
+        """Probe one speaker now and publish the result, for remediation.
+
+        The registry entry is preferred, as the speaker may have come back
+        from a power cycle with a new IP that discovery already picked up.
+        """
+        speaker = self._speakers.get(speaker.uuid, speaker)
+        status = await self._async_check_speaker(speaker)
+        self._async_publish_statuses({speaker.uuid: status})
+        return status
+
+    @callback
+    def _async_publish_statuses(
+        self, statuses: dict[str, SpeakerStatus | None]
+    ) -> None:
+        """Merge out-of-cycle results into the data and notify their entities.
+
+        A None status marks the speaker unreachable.
+        """
+        speakers = dict(self.data.get("speakers", {}) if self.data else {})
+        for uuid, status in statuses.items():
+            if status is None:
+                speakers.pop(uuid, None)
+            else:
+                speakers[uuid] = status
+        self.data = {**(self.data or {}), "speakers": speakers}
+        self._announce_new_speakers(speakers)
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners whose speaker data changed since the last dispatch.
+
+        Entities register with their speaker UUID as listener context. When
+        coordinator availability flips every listener is notified, otherwise
+        only listeners for speakers whose signature changed (or that appeared
+        or disappeared) are called. Listeners without a context always run.
+        """
+        speakers = self.data.get("speakers", {}) if self.data else {}
+        signatures = {
+            uuid: _speaker_signature(speaker) for uuid, speaker in speakers.items()
+        }
+        changed: set[str] | None = None
+        if self.last_update_success == self._last_dispatch_success:
+            changed = {
+                uuid
+                for uuid in signatures.keys() | self._published.keys()
+                if signatures.get(uuid) != self._published.get(uuid)
+            }
+        self._published = signatures
+        self._last_dispatch_success = self.last_update_success
+
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or context in changed:
+                update_callback()
+
+        # Every path that publishes speaker data ends here, so this is where
+        # newly frozen speakers are handed to the remediation engine.
+        self._remediation.async_check(speakers)
 
     @callback
     def update_interval_from_options(self) -> None:
-        """Update the scan interval from config entry options."""
+        """Apply the scan interval, sweep and timeout config entry options."""
         scan_interval = self.entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
         self.update_interval = timedelta(seconds=scan_interval)
+        self._sweeper = self._build_sweeper()
+        self._probe_slots = self._build_probe_slots()
+        floor, ceiling = self._timeout_bounds()
+        self.timeouts.floor, self.timeouts.ceiling = floor, max(ceiling, floor)
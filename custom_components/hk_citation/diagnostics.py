@@ -0,0 +1,35 @@
+"""Diagnostics support for HK Citation Health Monitor."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .coordinator import HKCitationCoordinator
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: HKCitationCoordinator = entry.runtime_data
+    speakers = coordinator.data.get("speakers", {}) if coordinator.data else {}
+    return {
+        "options": dict(entry.options),
+        "speakers": {uuid: status.as_dict() for uuid, status in speakers.items()},
+        "probe_plan": coordinator.planner.as_dict(),
+        "freeze_risk": coordinator.risk.as_dict(),
+        "timeouts": coordinator.timeouts.as_dict(),
+        "cycle": {
+            "budget_seconds": coordinator.cycle_budget,
+            "last_duration_seconds": coordinator.last_cycle_seconds,
+            "overruns": coordinator.overruns,
+            "discovery_timeouts": coordinator.discovery_timeouts,
+            "ip_conflicts": coordinator.ip_conflicts,
+            "stale_speakers": sorted(
+                uuid for uuid, status in speakers.items() if status.stale
+            ),
+        },
+    }
@@ -0,0 +1,223 @@
+"""Speaker discovery for HK Citation Health Monitor.
+
+Finds speakers by mDNS browsing, re-resolves known speakers by their mDNS
+service instance name and identifies hosts from their
+``/setup/eureka_info`` response. This module does not depend on Home
+Assistant; the resolver is handed the Zeroconf instance to query on.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import subprocess
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .const import HK_MODEL_PREFIX, PORT_8008
+from .models import SpeakerDetails
+
+if TYPE_CHECKING:
+    from zeroconf.asyncio import AsyncZeroconf
+
+_LOGGER = logging.getLogger(__name__)
+
+MDNS_SCAN_SECONDS = 8
+MDNS_RESOLVE_TIMEOUT = 1.0
+MDNS_SERVICE_TYPE = "_googlecast._tcp.local."
+EUREKA_INFO_TIMEOUT = 3.0
+# Besides the identity, the groups with firmware, uptime and network details
+# are requested, so the same response also fills in the device details.
+EUREKA_INFO_PARAMS = {"params": "name,device_info,build_info,net,wifi"}
+# Booted-at times are rounded to this many seconds, so request latency does
+# not make the value change between checks.
+BOOTED_AT_RESOLUTION = 60
+
+# Standalone mDNS scanner script — runs in a separate process to bypass
+# HA's Zeroconf monkey-patching.
+_SCANNER_SCRIPT = (
+    """
+import json, sys, time
+from zeroconf import InterfaceChoice, ServiceBrowser, Zeroconf
+
+PREFIX = "HK_MODEL_PREFIX_PLACEHOLDER"
+
+class L:
+    def __init__(self):
+        self.f = []
+    def add_service(self, zc, t, n):
+        self._h(zc, t, n)
+    def update_service(self, zc, t, n):
+        self._h(zc, t, n)
+    def remove_service(self, zc, t, n):
+        pass
+    def _h(self, zc, t, n):
+        try:
+            i = zc.get_service_info(t, n)
+        except Exception:
+            return
+        if not i:
+            return
+        p = i.properties or {}
+        m = p.get(b"md", b"").decode("utf-8", errors="replace")
+        if not m.startswith(PREFIX):
+            return
+        u = p.get(b"id", b"").decode("utf-8", errors="replace")
+        if not u:
+            return
+        a = i.parsed_addresses()
+        if not a:
+            return
+        if any(s["uuid"] == u for s in self.f):
+            return
+        self.f.append({
+            "name": p.get(b"fn", b"").decode("utf-8", errors="replace"),
+            "ip": a[0], "uuid": u, "model": m, "service": n,
+        })
+
+zc = Zeroconf(interfaces=sys.argv[1:] or InterfaceChoice.All)
+l = L()
+b = ServiceBrowser(zc, "SERVICE_TYPE_PLACEHOLDER", l)
+time.sleep(SCAN_SECONDS_PLACEHOLDER)
+b.cancel()
+zc.close()
+print(json.dumps(l.f))
+""".replace("HK_MODEL_PREFIX_PLACEHOLDER", HK_MODEL_PREFIX)
+    .replace("SCAN_SECONDS_PLACEHOLDER", str(MDNS_SCAN_SECONDS))
+    .replace("SERVICE_TYPE_PLACEHOLDER", MDNS_SERVICE_TYPE)
+)
+
+
+def run_mdns_scan(interface: str | None = None) -> list[dict[str, str]]:
+    """Run mDNS scan in a subprocess to get a fresh Zeroconf instance.
+
+    ``interface`` is the IPv4 address of the local interface to browse on;
+    by default all interfaces are used.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", _SCANNER_SCRIPT, *([interface] if interface else [])],
+        capture_output=True,
+        text=True,
+        timeout=MDNS_SCAN_SECONDS + 10,
+    )
+    if result.returncode != 0:
+        _LOGGER.error("mDNS scanner failed: %s", result.stderr[:500])
+        return []
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError:
+        _LOGGER.error("mDNS scanner returned invalid JSON: %s", result.stdout[:200])
+        return []
+
+
+async def async_mdns_resolve(aiozc: AsyncZeroconf, service: str) -> str | None:
+    """Resolve one speaker's mDNS service instance name to its current IP.
+
+    The name is queried directly on the given Zeroconf instance instead of
+    browsing for every instance of the service type. Returns None if the
+    speaker does not answer within ``MDNS_RESOLVE_TIMEOUT`` seconds.
+    """
+    # Imported here so the agent and the CLI run with aiohttp alone.
+    from zeroconf import IPVersion
+    from zeroconf.asyncio import AsyncServiceInfo
+
+    info = AsyncServiceInfo(MDNS_SERVICE_TYPE, service)
+    if not await info.async_request(aiozc.zeroconf, MDNS_RESOLVE_TIMEOUT * 1000):
+        return None
+    addresses = info.parsed_addresses(IPVersion.V4Only)
+    return addresses[0] if addresses else None
+
+
+def normalize_uuid(value: str) -> str:
+    """Return a UUID in the dash-less lowercase form used by mDNS TXT records."""
+    return value.replace("-", "").lower()
+
+
+def parse_eureka_identity(
+    ip: str, info: dict[str, Any], require_model: bool = True
+) -> dict[str, str] | None:
+    """Return the speaker in mDNS scanner format, or None if not a Citation.
+
+    With ``require_model`` false, a host is identified by its ``ssdp_udn``
+    alone, for hosts already known to be Citations whose firmware may report
+    a different model name.
+    """
+    device_info = info.get("device_info") or {}
+    model = device_info.get("model_name") or info.get("model_name") or ""
+    uuid = device_info.get("ssdp_udn") or info.get("ssdp_udn") or ""
+    if not uuid or (require_model and not model.startswith(HK_MODEL_PREFIX)):
+        return None
+    return {
+        "name": info.get("name", ""),
+        "ip": ip,
+        "uuid": normalize_uuid(uuid),
+        "model": model,
+    }
+
+
+def parse_eureka_details(
+    info: dict[str, Any], now: float | None = None
+) -> SpeakerDetails:
+    """Return the device details found in an eureka_info response."""
+    device_info = info.get("device_info") or {}
+    build_info = info.get("build_info") or {}
+    net = info.get("net") or {}
+    wifi = info.get("wifi") or {}
+    booted_at = None
+    uptime = device_info.get("uptime", info.get("uptime"))
+    if isinstance(uptime, int | float):
+        booted_at = (
+            ((now or time.time()) - uptime)
+            // BOOTED_AT_RESOLUTION
+            * BOOTED_AT_RESOLUTION
+        )
+    signal_level = wifi.get("signal_level")
+    return SpeakerDetails(
+        sw_version=str(
+            build_info.get("cast_build_revision")
+            or info.get("cast_build_revision")
+            or ""
+        ),
+        booted_at=booted_at,
+        mac_address=str(device_info.get("mac_address") or net.get("mac_address") or ""),
+        ssid=str(wifi.get("ssid") or ""),
+        signal_level=signal_level if isinstance(signal_level, int) else None,
+    )
+
+
+async def async_fetch_identity(
+    session: aiohttp.ClientSession, ip: str
+) -> dict[str, str] | None:
+    """Read eureka_info and return the speaker if the host is a Citation."""
+    if (info := await async_fetch_eureka_info(session, ip)) is None:
+        return None
+    return parse_eureka_identity(ip, info)
+
+
+async def async_fetch_eureka_info(
+    session: aiohttp.ClientSession,
+    ip: str,
+    timeout: float = EUREKA_INFO_TIMEOUT,
+    connect_timeout: float | None = None,
+) -> dict[str, Any] | None:
+    """Read a host's eureka_info response, or None if it does not answer.
+
+    ``timeout`` bounds the whole request and ``connect_timeout``, if given,
+    the TCP connect alone, in seconds.
+    """
+    url = f"http://{ip}:{PORT_8008}/setup/eureka_info"
+    try:
+        async with session.get(
+            url,
+            params=EUREKA_INFO_PARAMS,
+            timeout=aiohttp.ClientTimeout(total=timeout, sock_connect=connect_timeout),
+        ) as resp:
+            if resp.status != 200:
+                return None
+            info = await resp.json(content_type=None)
+    except (aiohttp.ClientError, TimeoutError, ValueError):
+        return None
+    return info if isinstance(info, dict) else None
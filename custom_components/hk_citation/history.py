@@ -0,0 +1,193 @@
+"""Downsampled latency history for HK Citation Health Monitor.
+
+Each speaker's response times are kept raw for a short window and rolled up
+into 1-minute and 1-hour buckets with fixed retention. The history persists
+as an append-only JSON-lines log: every save appends only the samples and
+buckets added since the last one, and the log is rewritten compactly when it
+is loaded or has grown well past the retained data. Like the probe module,
+this module does not depend on Home Assistant.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from statistics import fmean
+from typing import Any
+
+from .models import LatencyBucket
+
+# Seconds of raw samples kept; must exceed the largest bucket span.
+RAW_RETENTION = 2 * 3600
+# Span and retention in seconds of each bucket resolution.
+RESOLUTIONS: dict[str, tuple[int, int]] = {
+    "minute": (60, 7 * 86400),
+    "hour": (3600, 365 * 86400),
+}
+# Rewrite the log once it holds this many times the retained records.
+COMPACT_RATIO = 2
+COMPACT_MIN_RECORDS = 1000
+
+_RAW = "s"
+_KINDS = {"minute": "m", "hour": "h"}
+_RESOLUTION_BY_KIND = {kind: resolution for resolution, kind in _KINDS.items()}
+
+
+def _rollup(start: float, values: list[float]) -> LatencyBucket:
+    """Return the bucket statistics of a non-empty list of latencies."""
+    ordered = sorted(values)
+    p95 = ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)]
+    return LatencyBucket(
+        start=start,
+        count=len(ordered),
+        min=ordered[0],
+        mean=round(fmean(ordered), 1),
+        p95=p95,
+        max=ordered[-1],
+    )
+
+
+@dataclass(slots=True)
+class _SpeakerHistory:
+    """Raw samples and buckets of one speaker, oldest first."""
+
+    raw: deque[tuple[float, float]] = field(default_factory=deque)
+    buckets: dict[str, deque[LatencyBucket]] = field(
+        default_factory=lambda: {resolution: deque() for resolution in RESOLUTIONS}
+    )
+
+    def prune(self, now: float) -> None:
+        """Drop samples and buckets past their retention."""
+        while self.raw and self.raw[0][0] < now - RAW_RETENTION:
+            self.raw.popleft()
+        for resolution, (_, retention) in RESOLUTIONS.items():
+            buckets = self.buckets[resolution]
+            while buckets and buckets[0].start < now - retention:
+                buckets.popleft()
+
+    def __len__(self) -> int:
+        return len(self.raw) + sum(map(len, self.buckets.values()))
+
+
+class LatencyHistory:
+    """Per-speaker latency history backed by an append-only log file."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialize an empty history persisted at ``path``."""
+        self._path = Path(path)
+        self._speakers: dict[str, _SpeakerHistory] = {}
+        # Log lines added since the last save.
+        self._pending: list[str] = []
+        # Records currently in the log file.
+        self._logged = 0
+
+    def add(self, uuid: str, timestamp: float, ms: float) -> None:
+        """Record a response time, closing any buckets the sample moves past."""
+        history = self._speakers.setdefault(uuid, _SpeakerHistory())
+        if history.raw:
+            last = history.raw[-1][0]
+            for resolution, (span, _) in RESOLUTIONS.items():
+                previous = last // span * span
+                if timestamp // span * span > previous:
+                    values = [
+                        value
+                        for sample_time, value in history.raw
+                        if previous <= sample_time < previous + span
+                    ]
+                    bucket = _rollup(previous, values)
+                    history.buckets[resolution].append(bucket)
+                    self._log(_KINDS[resolution], uuid, *bucket.as_dict().values())
+        history.raw.append((timestamp, ms))
+        self._log(_RAW, uuid, timestamp, ms)
+        history.prune(timestamp)
+
+    def _log(self, kind: str, uuid: str, *values: Any) -> None:
+        self._pending.append(json.dumps([kind, uuid, *values]))
+
+    def samples(self, uuid: str) -> list[dict[str, float]]:
+        """Return a speaker's raw samples from the short window."""
+        if (history := self._speakers.get(uuid)) is None:
+            return []
+        return [{"time": ts, "ms": ms} for ts, ms in history.raw]
+
+    def buckets(self, uuid: str, resolution: str) -> list[LatencyBucket]:
+        """Return a speaker's buckets at ``resolution``, oldest first."""
+        if (history := self._speakers.get(uuid)) is None:
+            return []
+        return list(history.buckets[resolution])
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Return True if the log has grown well past the retained records."""
+        retained = sum(map(len, self._speakers.values()))
+        return self._logged > COMPACT_RATIO * max(retained, COMPACT_MIN_RECORDS)
+
+    def drain(self) -> list[str]:
+        """Return and clear the log lines added since the last save."""
+        pending, self._pending = self._pending, []
+        return pending
+
+    def snapshot(self) -> list[str]:
+        """Return log lines for the whole retained history."""
+        self._pending = []
+        lines = []
+        for uuid, history in self._speakers.items():
+            for resolution, buckets in history.buckets.items():
+                lines.extend(
+                    json.dumps([_KINDS[resolution], uuid, *bucket.as_dict().values()])
+                    for bucket in buckets
+                )
+            lines.extend(json.dumps([_RAW, uuid, ts, ms]) for ts, ms in history.raw)
+        return lines
+
+    def append(self, lines: list[str]) -> None:
+        """Append log lines to the file. Blocking."""
+        if not lines:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("a", encoding="utf-8") as log:
+            log.write("\n".join(lines) + "\n")
+        self._logged += len(lines)
+
+    def rewrite(self, lines: list[str]) -> None:
+        """Atomically replace the file with the given log lines. Blocking."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self._path.with_suffix(self._path.suffix + ".tmp")
+        with temp.open("w", encoding="utf-8") as log:
+            log.writelines(line + "\n" for line in lines)
+        os.replace(temp, self._path)
+        self._logged = len(lines)
+
+    def load(self) -> None:
+        """Read the log, drop expired records and rewrite it compactly. Blocking.
+
+        Unparsable lines, such as one cut short by a crash, are skipped.
+        """
+        try:
+            log = self._path.open(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with log:
+            for line in log:
+                try:
+                    kind, uuid, *values = json.loads(line)
+                    history = self._speakers.setdefault(uuid, _SpeakerHistory())
+                    if kind == _RAW:
+                        ts, ms = values
+                        history.raw.append((float(ts), float(ms)))
+                    else:
+                        history.buckets[_RESOLUTION_BY_KIND[kind]].append(
+                            LatencyBucket(*values)
+                        )
+                except (ValueError, TypeError, KeyError):
+                    continue
+
+        now = time.time()
+        for history in self._speakers.values():
+            history.prune(now)
+        self.rewrite(self.snapshot())
@@ -0,0 +1,176 @@
+"""Data model for HK Citation Health Monitor."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class Speaker:
+    """Identity of a discovered speaker, as kept in the registry."""
+
+    uuid: str
+    name: str
+    ip: str
+    model: str
+    # mDNS service instance name, empty if the speaker was not found by mDNS.
+    service: str = ""
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the storage representation of the speaker."""
+        data = {
+            "uuid": self.uuid,
+            "name": self.name,
+            "ip": self.ip,
+            "model": self.model,
+        }
+        if self.service:
+            data["service"] = self.service
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Speaker:
+        """Build a speaker from its storage or mDNS scanner representation."""
+        return cls(
+            uuid=data["uuid"],
+            name=data["name"],
+            ip=data["ip"],
+            model=data.get("model", ""),
+            service=data.get("service", ""),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ProbeSample:
+    """Timing of a single probe request."""
+
+    endpoint: str
+    ms: float
+    error: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the sample as a plain dict."""
+        return {"endpoint": self.endpoint, "ms": self.ms, "error": self.error}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ProbeSample:
+        """Build a sample from its plain dict representation."""
+        return cls(data["endpoint"], data["ms"], data.get("error", ""))
+
+
+@dataclass(slots=True, frozen=True)
+class SpeakerHealth:
+    """Result of one health check of a speaker."""
+
+    healthy: bool
+    response_time_ms: float
+    probes: tuple[ProbeSample, ...]
+    error: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the health result as a plain dict."""
+        return {
+            "healthy": self.healthy,
+            "response_time_ms": self.response_time_ms,
+            "probes": [probe.as_dict() for probe in self.probes],
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpeakerHealth:
+        """Build a health result from its plain dict representation."""
+        return cls(
+            healthy=data["healthy"],
+            response_time_ms=data["response_time_ms"],
+            probes=tuple(map(ProbeSample.from_dict, data.get("probes", ()))),
+            error=data.get("error", ""),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class SpeakerDetails:
+    """Device details parsed from a speaker's eureka_info response.
+
+    ``booted_at`` is the Unix time of the last boot, derived from the
+    reported uptime, so it stays the same from one check to the next.
+    """
+
+    sw_version: str = ""
+    booted_at: float | None = None
+    mac_address: str = ""
+    ssid: str = ""
+    signal_level: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the details as a plain dict."""
+        return {
+            "sw_version": self.sw_version,
+            "booted_at": self.booted_at,
+            "mac_address": self.mac_address,
+            "ssid": self.ssid,
+            "signal_level": self.signal_level,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class FreezeRisk:
+    """Freeze risk of a speaker at its current uptime.
+
+    ``reboot_recommended`` is None while the reboot hint is disabled.
+    """
+
+    # "high", "normal" or "low", relative to the fleet's average freeze rate.
+    level: str
+    freezes_per_day: float
+    reboot_recommended: bool | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class SpeakerStatus:
+    """Latest health of a speaker, published in ``coordinator.data``.
+
+    The speaker is the registry object itself, so publishing a status does
+    not copy the speaker's identity fields. A stale status is an earlier
+    result republished because the speaker's check did not finish in time.
+    Neither the stale flag, the device details nor the freeze risk are part
+    of the dict representation.
+    """
+
+    speaker: Speaker
+    health: SpeakerHealth
+    stale: bool = False
+    details: SpeakerDetails | None = None
+    risk: FreezeRisk | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the status as a flat dict of identity and health."""
+        return {**self.speaker.as_dict(), **self.health.as_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SpeakerStatus:
+        """Build a status from its flat dict representation."""
+        return cls(Speaker.from_dict(data), SpeakerHealth.from_dict(data))
+
+
+@dataclass(slots=True, frozen=True)
+class LatencyBucket:
+    """Latency statistics of one speaker over a fixed time span."""
+
+    start: float
+    count: int
+    min: float
+    mean: float
+    p95: float
+    max: float
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket as a plain dict."""
+        return {
+            "start": self.start,
+            "count": self.count,
+            "min": self.min,
+            "mean": self.mean,
+            "p95": self.p95,
+            "max": self.max,
+        }
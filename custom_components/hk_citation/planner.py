@@ -0,0 +1,160 @@
+"""Probe-plan optimizer for HK Citation Health Monitor.
+
+Different freeze states show up on different probes. The planner records
+which probes failed in each confirmed freeze and what each probe costs, and
+on routine cycles of a healthy speaker runs only the cheapest set of probes
+that would have caught every recorded freeze. Like the probe module, it does
+not depend on Home Assistant.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import SpeakerHealth
+from .probe import PROBE_NAMES, sample_failed
+
+# A speaker runs the full probe set at least every this many cycles.
+FULL_PLAN_EVERY = 6
+# Confirmed freezes remembered per speaker and for the fleet.
+FREEZE_HISTORY = 50
+# Weight of the newest sample in the moving average of probe cost.
+COST_SMOOTHING = 0.2
+
+
+@dataclass(slots=True)
+class _PlanStats:
+    """Probe costs and freeze detections, for one speaker or the fleet."""
+
+    # Moving average of each probe's duration in milliseconds.
+    cost_ms: dict[str, float] = field(default_factory=dict)
+    # Set of failing probes of each confirmed freeze, newest last.
+    freezes: deque[frozenset[str]] = field(
+        default_factory=lambda: deque(maxlen=FREEZE_HISTORY)
+    )
+    # Number of confirmed freezes each probe was the first to detect.
+    first_detections: Counter[str] = field(default_factory=Counter)
+
+    def record(self, name: str, ms: float) -> None:
+        """Fold one probe duration into the cost average."""
+        old = self.cost_ms.get(name)
+        self.cost_ms[name] = ms if old is None else old + COST_SMOOTHING * (ms - old)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dict."""
+        return {
+            "cost_ms": {name: round(ms, 1) for name, ms in self.cost_ms.items()},
+            "freezes": len(self.freezes),
+            "first_detections": dict(self.first_detections),
+        }
+
+
+@dataclass(slots=True)
+class _SpeakerPlan:
+    """Planner state of one speaker."""
+
+    stats: _PlanStats = field(default_factory=_PlanStats)
+    healthy: bool | None = None
+    # Cycles since the full probe set last ran.
+    partial_cycles: int = 0
+    # Cycle of the last recorded result.
+    cycle: int | None = None
+
+
+class ProbePlanner:
+    """Choose which probes to run for a speaker, and in what order."""
+
+    def __init__(self) -> None:
+        """Initialize the planner."""
+        self._fleet = _PlanStats()
+        self._speakers: dict[str, _SpeakerPlan] = {}
+        self._cycle = 0
+
+    def start_cycle(self) -> None:
+        """Start a new cycle for counting partial runs."""
+        self._cycle += 1
+
+    def _cost(self, stats: _PlanStats, name: str) -> float:
+        """Return a probe's expected cost, from the speaker or fleet average."""
+        return stats.cost_ms.get(name, self._fleet.cost_ms.get(name, 0.0))
+
+    def _cover(self, stats: _PlanStats) -> list[str]:
+        """Return a cheap set of probes that failed in every recorded freeze.
+
+        Greedy weighted set cover: repeatedly take the probe that detects
+        the most not yet covered freezes per millisecond of cost.
+        """
+        uncovered = [freeze for freeze in stats.freezes if freeze]
+        cover: list[str] = []
+        while uncovered:
+            best = max(
+                (name for name in PROBE_NAMES if name not in cover),
+                key=lambda name: (
+                    sum(name in freeze for freeze in uncovered)
+                    / (self._cost(stats, name) + 1.0)
+                ),
+            )
+            if not any(best in freeze for freeze in uncovered):
+                break
+            cover.append(best)
+            uncovered = [freeze for freeze in uncovered if best not in freeze]
+        return cover
+
+    def plan(self, uuid: str) -> tuple[str, ...]:
+        """Return the probes to run for a speaker this cycle, in order.
+
+        The full set runs unless the speaker was healthy last cycle and ran
+        the full set less than ``FULL_PLAN_EVERY`` cycles ago, or while no
+        freeze has been recorded for it or the fleet. The full set is
+        ordered with the covering probes first, then by cost.
+        """
+        state = self._speakers.setdefault(uuid, _SpeakerPlan())
+        stats = state.stats if state.stats.freezes else self._fleet
+        cover = self._cover(stats)
+        rest = sorted(
+            (name for name in PROBE_NAMES if name not in cover),
+            key=lambda name: self._cost(stats, name),
+        )
+        if cover and state.healthy and state.partial_cycles < FULL_PLAN_EVERY - 1:
+            return tuple(cover)
+        return (*cover, *rest)
+
+    def record(self, uuid: str, health: SpeakerHealth, threshold_ms: float) -> None:
+        """Update costs and freeze history from a speaker's probe result.
+
+        Probes outside the cycles, such as on-demand ones, teach costs and
+        freezes too, but a speaker's partial runs are counted once per cycle.
+        """
+        state = self._speakers.setdefault(uuid, _SpeakerPlan())
+        for sample in health.probes:
+            state.stats.record(sample.endpoint, sample.ms)
+            self._fleet.record(sample.endpoint, sample.ms)
+
+        if not health.healthy and state.healthy is not False:
+            failed = [
+                sample.endpoint
+                for sample in health.probes
+                if sample_failed(sample, threshold_ms)
+            ]
+            for stats in (state.stats, self._fleet):
+                stats.freezes.append(frozenset(failed))
+                if failed:
+                    stats.first_detections[failed[0]] += 1
+
+        if len(health.probes) >= len(PROBE_NAMES):
+            state.partial_cycles = 0
+        elif state.cycle != self._cycle:
+            state.partial_cycles += 1
+        state.cycle = self._cycle
+        state.healthy = health.healthy
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return fleet and per-speaker statistics for diagnostics."""
+        return {
+            "fleet": self._fleet.as_dict(),
+            "speakers": {
+                uuid: state.stats.as_dict() for uuid, state in self._speakers.items()
+            },
+        }
@@ -0,0 +1,212 @@
+"""Speaker health probes for HK Citation Health Monitor.
+
+This module does not depend on Home Assistant, so the same probe logic runs
+in the coordinator, the standalone probe agent and the command-line prober.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Mapping,
+    Sequence,
+)
+from functools import partial
+
+import aiohttp
+
+from .const import (
+    HTTPS_PROBE_ENDPOINT,
+    HTTPS_PROBE_TIMEOUT,
+    PORT_8008,
+    PORT_8443,
+    PROBE_ENDPOINTS,
+)
+from .discovery import async_fetch_identity
+from .models import ProbeSample, Speaker, SpeakerHealth, SpeakerStatus
+
+PROBE_TIMEOUT = 5.0
+HTTPS_PROBE_NAME = "https:8443/eureka_info"
+
+
+async def _async_post_probe(
+    session: aiohttp.ClientSession,
+    ip: str,
+    connect_timeout: float | None,
+    endpoint: str,
+    payload: dict[str, str],
+) -> ProbeSample:
+    """Time one port 8008 POST probe."""
+    url = f"http://{ip}:{PORT_8008}{endpoint}"
+    name = endpoint.split("/")[-1]
+    try:
+        start = time.monotonic()
+        async with session.post(
+            url,
+            json=payload,
+            timeout=aiohttp.ClientTimeout(
+                total=PROBE_TIMEOUT, sock_connect=connect_timeout
+            ),
+        ):
+            elapsed_ms = (time.monotonic() - start) * 1000
+            return ProbeSample(name, round(elapsed_ms, 1))
+    except TimeoutError:
+        return ProbeSample(name, PROBE_TIMEOUT * 1000, "timed out")
+    except aiohttp.ClientError as err:
+        return ProbeSample(name, 0, str(err))
+
+
+async def _async_https_probe(
+    session: aiohttp.ClientSession, ip: str, connect_timeout: float | None
+) -> ProbeSample:
+    """Run the port 8443 HTTPS probe — timeout means frozen."""
+    https_url = f"https://{ip}:{PORT_8443}{HTTPS_PROBE_ENDPOINT}"
+    try:
+        start = time.monotonic()
+        async with session.get(
+            https_url,
+            ssl=False,
+            timeout=aiohttp.ClientTimeout(
+                total=HTTPS_PROBE_TIMEOUT, sock_connect=connect_timeout
+            ),
+        ):
+            elapsed_ms = (time.monotonic() - start) * 1000
+            return ProbeSample(HTTPS_PROBE_NAME, round(elapsed_ms, 1))
+    except TimeoutError:
+        return ProbeSample(
+            HTTPS_PROBE_NAME,
+            HTTPS_PROBE_TIMEOUT * 1000,
+            "frozen (port 8443 timeout)",
+        )
+    except aiohttp.ClientError as err:
+        return ProbeSample(HTTPS_PROBE_NAME, 0, str(err))
+
+
+_PROBES: dict[
+    str, Callable[[aiohttp.ClientSession, str, float | None], Awaitable[ProbeSample]]
+] = {
+    endpoint.split("/")[-1]: partial(
+        _async_post_probe, endpoint=endpoint, payload=payload
+    )
+    for endpoint, payload in PROBE_ENDPOINTS
+}
+_PROBES[HTTPS_PROBE_NAME] = _async_https_probe
+
+# Every probe, in the default order: port 8008 POST timing probes, then 8443.
+PROBE_NAMES: tuple[str, ...] = tuple(_PROBES)
+
+
+def sample_failed(sample: ProbeSample, threshold_ms: float) -> bool:
+    """Return True if a single probe sample indicates a frozen speaker."""
+    if sample.error:
+        return True
+    return sample.endpoint != HTTPS_PROBE_NAME and sample.ms >= threshold_ms
+
+
+def post_response_ms(health: SpeakerHealth) -> float | None:
+    """Return the slowest successful port 8008 POST probe, or None if none ran.
+
+    Unlike ``response_time_ms``, this does not depend on which probes the
+    plan ran, so it is the value kept in the latency history.
+    """
+    return max(
+        (
+            sample.ms
+            for sample in health.probes
+            if sample.endpoint != HTTPS_PROBE_NAME and not sample.error
+        ),
+        default=None,
+    )
+
+
+async def async_probe_speaker(
+    session: aiohttp.ClientSession,
+    ip: str,
+    threshold_ms: float,
+    on_sample: Callable[[ProbeSample], None] | None = None,
+    plan: Sequence[str] = PROBE_NAMES,
+    connect_timeout: float | None = None,
+) -> SpeakerHealth:
+    """Probe a speaker's health via port 8008 POST timing and port 8443 HTTPS timeout.
+
+    Probes run one after another in ``plan`` order. If ``plan`` leaves
+    probes out and one of its probes fails, the left-out probes run as well,
+    so a suspected freeze is always confirmed by the full set. ``on_sample``
+    is called with each sample as soon as its probe finishes.
+    ``connect_timeout`` only bounds connection setup; the read timeouts are
+    fixed, as a slow or missing response is what marks a freeze.
+    """
+    probes: list[ProbeSample] = []
+    order = list(plan)
+    index = 0
+    while index < len(order):
+        sample = await _PROBES[order[index]](session, ip, connect_timeout)
+        index += 1
+        probes.append(sample)
+        if on_sample is not None:
+            on_sample(sample)
+        if sample_failed(sample, threshold_ms) and len(order) < len(PROBE_NAMES):
+            order.extend(name for name in PROBE_NAMES if name not in order)
+
+    return evaluate_health(probes, threshold_ms)
+
+
+def evaluate_health(probes: list[ProbeSample], threshold_ms: float) -> SpeakerHealth:
+    """Evaluate health from probe samples — unhealthy if any probe fails."""
+    post_probes = [p for p in probes if p.endpoint != HTTPS_PROBE_NAME]
+    https_probe = next((p for p in probes if p.endpoint == HTTPS_PROBE_NAME), None)
+    worst_post_time = max((p.ms for p in post_probes), default=0)
+    post_slow = worst_post_time >= threshold_ms
+    post_errors = any(p.error for p in post_probes)
+    https_failed = https_probe is not None and bool(https_probe.error)
+
+    healthy = not post_slow and not post_errors and not https_failed
+    worst_time = max((p.ms for p in probes), default=0)
+
+    error = ""
+    if https_failed:
+        error = https_probe.error
+    elif post_errors:
+        error = next(p.error for p in post_probes if p.error)
+
+    return SpeakerHealth(
+        healthy=healthy,
+        response_time_ms=worst_time,
+        probes=tuple(probes),
+        error=error,
+    )
+
+
+async def async_probe_ips(
+    session: aiohttp.ClientSession,
+    ips: Iterable[str],
+    threshold_ms: float,
+    concurrency: int,
+    identities: Mapping[str, dict[str, str]] | None = None,
+) -> AsyncIterator[tuple[str, SpeakerStatus | None]]:
+    """Identify and probe many hosts concurrently, yielding as each finishes.
+
+    At most ``concurrency`` hosts are in flight at once. The eureka_info
+    request that identifies a host doubles as its reachability check; hosts
+    that do not answer or are not Citations yield None. Hosts in
+    ``identities`` were just identified (by a subnet sweep) and are probed
+    without reading eureka_info again.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    identities = identities or {}
+
+    async def _probe(ip: str) -> tuple[str, SpeakerStatus | None]:
+        async with semaphore:
+            identity = identities.get(ip) or await async_fetch_identity(session, ip)
+            if identity is None:
+                return ip, None
+            health = await async_probe_speaker(session, ip, threshold_ms)
+            return ip, SpeakerStatus(Speaker.from_dict(identity), health)
+
+    for next_result in asyncio.as_completed([_probe(ip) for ip in ips]):
+        yield await next_result
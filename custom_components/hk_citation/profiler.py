@@ -0,0 +1,84 @@
+"""Opt-in profiling of coordinator cycles for HK Citation Health Monitor.
+
+A ``CycleProfiler`` runs cProfile over a number of coordinator cycles and
+compares tracemalloc snapshots taken before the first and after the last of
+them. Since Python 3.12 cProfile records every thread of the interpreter, so
+a profile holds the cycle's executor jobs, such as parsing the mDNS scanner
+output, along with whatever else Home Assistant ran during the cycle. Like
+the probe module, this module does not depend on Home Assistant.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import tracemalloc
+from pathlib import Path
+
+# Allocation sites listed in the summary, largest growth first.
+TOP_ALLOCATIONS = 25
+
+
+class CycleProfiler:
+    """Profile the next ``cycles`` cycles and write the results to files."""
+
+    def __init__(self, cycles: int, path_prefix: str) -> None:
+        """Initialize a profiler writing to files starting with ``path_prefix``."""
+        self.remaining = cycles
+        self.profile_path = f"{path_prefix}.prof"
+        self.allocations_path = f"{path_prefix}.allocations.txt"
+        self._profile = cProfile.Profile()
+        self._owns_tracemalloc = False
+        self._cancelled = False
+        self._before: tracemalloc.Snapshot | None = None
+        self._after: tracemalloc.Snapshot | None = None
+
+    def start_cycle(self) -> None:
+        """Start profiling a cycle, taking the first allocation snapshot.
+
+        Raises ValueError if another profiler is active.
+        """
+        self._profile.enable()
+        if self._before is None:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+            self._before = tracemalloc.take_snapshot()
+
+    def stop_cycle(self) -> bool:
+        """Stop profiling a cycle; return True once the last one is done."""
+        self._profile.disable()
+        if self._cancelled:
+            return False
+        self.remaining -= 1
+        if self.remaining > 0:
+            return False
+        # Another profiler that started tracemalloc may have stopped it.
+        if tracemalloc.is_tracing():
+            self._after = tracemalloc.take_snapshot()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+        return True
+
+    def cancel(self) -> None:
+        """Stop profiling without writing, releasing cProfile and tracemalloc.
+
+        A cycle still running stops its profile and never reports done.
+        """
+        self._cancelled = True
+        self._profile.disable()
+        if self._owns_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._owns_tracemalloc = False
+
+    def write(self) -> None:
+        """Write the profile and the top allocations summary. Blocking."""
+        pstats.Stats(self._profile).dump_stats(self.profile_path)
+
+        lines = ["Allocation growth over the profiled cycles, largest first:"]
+        if self._before is not None and self._after is not None:
+            growth = self._after.compare_to(self._before, "lineno")
+            lines.extend(str(stat) for stat in growth[:TOP_ALLOCATIONS])
+        else:
+            lines.append("No snapshots: tracemalloc was stopped during profiling.")
+        Path(self.allocations_path).write_text("\n".join(lines) + "\n")
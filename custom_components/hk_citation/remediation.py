@@ -0,0 +1,223 @@
+"""Automatic power-cycle recovery of frozen HK Citation speakers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_OFF, SERVICE_TURN_ON
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    CONF_REMEDIATION_COOLDOWN,
+    CONF_REMEDIATION_MAX_ATTEMPTS,
+    CONF_REMEDIATION_OFF_TIME,
+    CONF_REMEDIATION_SWITCHES,
+    DEFAULT_REMEDIATION_COOLDOWN,
+    DEFAULT_REMEDIATION_MAX_ATTEMPTS,
+    DEFAULT_REMEDIATION_OFF_TIME,
+    DOMAIN,
+    EVENT_REMEDIATION,
+)
+from .models import Speaker, SpeakerStatus
+
+if TYPE_CHECKING:
+    from .coordinator import HKCitationCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between re-probes while waiting for a power-cycled speaker.
+REPROBE_INTERVAL = 5.0
+# Seconds after power is restored before an attempt counts as failed.
+RECOVERY_TIMEOUT = 180.0
+# Wait before the second attempt; doubled for each further attempt.
+RETRY_BACKOFF = 30.0
+# Seconds before a suspected freeze is confirmed by a second probe, so one
+# slow response does not cut a speaker's power.
+CONFIRM_DELAY = 10.0
+# Seconds after an unhealthy check during which a speaker that stops
+# answering altogether is treated as frozen.
+UNREACHABLE_WINDOW = 900.0
+
+OUTCOME_RECOVERED = "recovered"
+OUTCOME_RETRYING = "retrying"
+OUTCOME_FAILED = "failed"
+OUTCOME_SWITCH_ERROR = "switch_error"
+
+
+class RemediationEngine:
+    """Power-cycle frozen speakers through their linked switch.
+
+    A speaker with a linked switch that is reported unhealthy, or that
+    stops answering within ``UNREACHABLE_WINDOW`` seconds of an unhealthy
+    check, is probed again after ``CONFIRM_DELAY`` seconds. If it is still
+    frozen or unreachable, the switch is turned off for the configured off
+    time and on again, then the speaker is re-probed every
+    ``REPROBE_INTERVAL`` seconds until it answers healthy. Failed attempts
+    are retried with exponential backoff up to the configured maximum. A
+    speaker is not power-cycled again within the cooldown of the last run.
+    Every attempt fires an ``hk_citation_remediation`` event with its timings.
+    """
+
+    def __init__(self, coordinator: HKCitationCoordinator) -> None:
+        """Initialize the engine."""
+        self._coordinator = coordinator
+        self._running: dict[str, asyncio.Task[None]] = {}
+        # Monotonic start time of the last power cycle per speaker UUID.
+        self._last_run: dict[str, float] = {}
+        # Monotonic time of the last unhealthy check per speaker UUID.
+        self._last_unhealthy: dict[str, float] = {}
+
+    @property
+    def _options(self) -> dict[str, Any]:
+        return self._coordinator.entry.options
+
+    @callback
+    def async_check(self, speakers: dict[str, SpeakerStatus]) -> None:
+        """Start remediation for frozen speakers that have a linked switch.
+
+        ``speakers`` is the full published data; a speaker missing from it
+        did not answer its last check.
+        """
+        switches: dict[str, str] = self._options.get(CONF_REMEDIATION_SWITCHES, {})
+        if not switches:
+            return
+        cooldown = self._options.get(
+            CONF_REMEDIATION_COOLDOWN, DEFAULT_REMEDIATION_COOLDOWN
+        )
+        now = time.monotonic()
+        for uuid, switch in switches.items():
+            if (status := speakers.get(uuid)) is not None:
+                if status.stale:
+                    continue
+                if status.health.healthy:
+                    self._last_unhealthy.pop(uuid, None)
+                    continue
+                self._last_unhealthy[uuid] = now
+                speaker = status.speaker
+            else:
+                # A hung speaker stops answering on port 8008 altogether.
+                last = self._last_unhealthy.get(uuid)
+                if last is None or now - last > UNREACHABLE_WINDOW:
+                    continue
+                if (speaker := self._coordinator.speakers.get(uuid)) is None:
+                    continue
+            if uuid in self._running:
+                continue
+            last = self._last_run.get(uuid)
+            if last is not None and now - last < cooldown:
+                continue
+            task = self._coordinator.entry.async_create_background_task(
+                self._coordinator.hass,
+                self._async_remediate(speaker, switch),
+                f"{DOMAIN} remediation {uuid}",
+            )
+            if not task.done():
+                self._running[uuid] = task
+
+    async def _async_confirm_frozen(self, speaker: Speaker) -> bool:
+        """Probe a suspected frozen speaker again; return True if it still is."""
+        await asyncio.sleep(CONFIRM_DELAY)
+        status = await self._coordinator.async_reprobe_speaker(speaker)
+        if status is not None and status.health.healthy:
+            _LOGGER.info(
+                "Speaker %s answered healthy again, not power-cycling it",
+                speaker.name,
+            )
+            return False
+        return True
+
+    async def _async_remediate(self, speaker: Speaker, switch: str) -> None:
+        """Confirm the freeze, then power-cycle until recovery or out of attempts."""
+        max_attempts = self._options.get(
+            CONF_REMEDIATION_MAX_ATTEMPTS, DEFAULT_REMEDIATION_MAX_ATTEMPTS
+        )
+        try:
+            if not await self._async_confirm_frozen(speaker):
+                return
+            started = self._last_run[speaker.uuid] = time.monotonic()
+            _LOGGER.warning(
+                "Speaker %s is frozen, power-cycling it via %s", speaker.name, switch
+            )
+            for attempt in range(1, max_attempts + 1):
+                timings = await self._async_attempt(speaker, switch)
+                if timings is None:
+                    outcome = OUTCOME_SWITCH_ERROR
+                elif timings["time_to_recover"] is not None:
+                    outcome = OUTCOME_RECOVERED
+                elif attempt < max_attempts:
+                    outcome = OUTCOME_RETRYING
+                else:
+                    outcome = OUTCOME_FAILED
+                self._fire_event(
+                    speaker,
+                    switch,
+                    attempt=attempt,
+                    max_attempts=max_attempts,
+                    outcome=outcome,
+                    elapsed=round(time.monotonic() - started, 1),
+                    **(timings or {}),
+                )
+                if outcome != OUTCOME_RETRYING:
+                    break
+                await asyncio.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
+        finally:
+            self._running.pop(speaker.uuid, None)
+
+        if outcome == OUTCOME_RECOVERED:
+            _LOGGER.info("Speaker %s recovered after power cycle", speaker.name)
+        else:
+            _LOGGER.error(
+                "Speaker %s did not recover after %d power cycles",
+                speaker.name,
+                attempt,
+            )
+
+    async def _async_attempt(
+        self, speaker: Speaker, switch: str
+    ) -> dict[str, Any] | None:
+        """Power-cycle once and re-probe; return timings, or None on switch error."""
+        hass = self._coordinator.hass
+        off_time = self._options.get(
+            CONF_REMEDIATION_OFF_TIME, DEFAULT_REMEDIATION_OFF_TIME
+        )
+        try:
+            await hass.services.async_call(
+                "switch", SERVICE_TURN_OFF, {ATTR_ENTITY_ID: switch}, blocking=True
+            )
+            await asyncio.sleep(off_time)
+            await hass.services.async_call(
+                "switch", SERVICE_TURN_ON, {ATTR_ENTITY_ID: switch}, blocking=True
+            )
+        except HomeAssistantError as err:
+            _LOGGER.error(
+                "Power-cycling %s via %s failed: %s", speaker.name, switch, err
+            )
+            return None
+
+        powered_on = time.monotonic()
+        reprobes = 0
+        time_to_recover: float | None = None
+        while time.monotonic() - powered_on < RECOVERY_TIMEOUT:
+            await asyncio.sleep(REPROBE_INTERVAL)
+            reprobes += 1
+            status = await self._coordinator.async_reprobe_speaker(speaker)
+            if status is not None and status.health.healthy:
+                time_to_recover = round(time.monotonic() - powered_on, 1)
+                break
+        return {
+            "off_time": off_time,
+            "reprobes": reprobes,
+            "time_to_recover": time_to_recover,
+        }
+
+    @callback
+    def _fire_event(self, speaker: Speaker, switch: str, **data: Any) -> None:
+        """Fire a remediation event for one attempt."""
+        self._coordinator.hass.bus.async_fire(
+            EVENT_REMEDIATION,
+            {"uuid": speaker.uuid, "name": speaker.name, "switch": switch, **data},
+        )
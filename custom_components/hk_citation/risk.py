@@ -0,0 +1,172 @@
+"""Uptime-based freeze risk model for HK Citation Health Monitor.
+
+Freezes correlate with time since boot. The model splits uptime into
+windows and counts, per window, the confirmed freezes and the hours
+speakers were observed healthy in it, for each speaker, each model and the
+whole fleet. The freeze rate of a speaker's current window is estimated
+from its own counts, shrunk towards its model's, which are in turn shrunk
+towards the fleet's, so sparse data falls back to the broader estimate. Like
+the probe module, this module does not depend on Home Assistant.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import FreezeRisk
+
+# Upper uptime bounds in hours of the windows; the last window is open.
+UPTIME_WINDOWS_H = (6, 12, 24, 48, 72, 120, 168, 240, 336, 504, 720)
+# Healthy hours of pseudo-observation at the broader level's rate added to
+# each window's counts.
+PRIOR_HOURS = 48.0
+# Fleet freezes needed before any speaker is rated.
+MIN_FREEZES = 3
+# A window is high risk at this multiple of the fleet's average rate, and
+# low risk at or below the lower multiple.
+HIGH_RISK_RATIO = 2.0
+LOW_RISK_RATIO = 0.5
+# Gaps between two checks longer than this count as this many hours, so
+# downtime of Home Assistant does not inflate the exposure.
+MAX_GAP_H = 1.0
+
+
+def uptime_window(uptime_h: float) -> int:
+    """Return the index of the uptime window ``uptime_h`` hours falls in."""
+    return bisect_right(UPTIME_WINDOWS_H, max(uptime_h, 0.0))
+
+
+@dataclass(slots=True)
+class _Counts:
+    """Freezes and healthy hours per uptime window, at one level."""
+
+    freezes: list[int] = field(
+        default_factory=lambda: [0] * (len(UPTIME_WINDOWS_H) + 1)
+    )
+    hours: list[float] = field(
+        default_factory=lambda: [0.0] * (len(UPTIME_WINDOWS_H) + 1)
+    )
+
+    def rate(self, window: int, prior: float) -> float:
+        """Return the smoothed freezes per hour in a window."""
+        return (self.freezes[window] + prior * PRIOR_HOURS) / (
+            self.hours[window] + PRIOR_HOURS
+        )
+
+    @property
+    def average(self) -> float:
+        """Return the freezes per hour over all windows."""
+        hours = sum(self.hours)
+        return sum(self.freezes) / hours if hours else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts as a JSON-serializable dict."""
+        return {"freezes": self.freezes, "hours": [round(h, 2) for h in self.hours]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> _Counts:
+        """Build counts from their dict, ignoring a different window layout."""
+        counts = cls()
+        if (
+            len(data.get("freezes", ()))
+            == len(counts.freezes)
+            == len(data.get("hours", ()))
+        ):
+            counts.freezes = [int(value) for value in data["freezes"]]
+            counts.hours = [float(value) for value in data["hours"]]
+        return counts
+
+
+class FreezeRiskModel:
+    """Estimate each speaker's freeze risk from its uptime."""
+
+    def __init__(self) -> None:
+        """Initialize an empty model."""
+        self._fleet = _Counts()
+        self._models: dict[str, _Counts] = {}
+        self._speakers: dict[str, _Counts] = {}
+        # Time and health of each speaker's last observation.
+        self._last: dict[str, tuple[float, bool]] = {}
+
+    def observe(
+        self, uuid: str, model: str, booted_at: float, healthy: bool, now: float
+    ) -> bool:
+        """Record a check result; return True if it is a new freeze.
+
+        The time since a healthy previous check counts as exposure in the
+        current uptime window, and a healthy to frozen transition as a
+        freeze in it.
+        """
+        last = self._last.get(uuid)
+        self._last[uuid] = (now, healthy)
+        if last is None or not last[1] or now <= last[0]:
+            return False
+        window = uptime_window((now - booted_at) / 3600)
+        hours = min((now - last[0]) / 3600, MAX_GAP_H)
+        levels = (
+            self._fleet,
+            self._models.setdefault(model, _Counts()),
+            self._speakers.setdefault(uuid, _Counts()),
+        )
+        for counts in levels:
+            counts.hours[window] += hours
+            if not healthy:
+                counts.freezes[window] += 1
+        return not healthy
+
+    def _rate(self, uuid: str, model: str, window: int) -> float:
+        """Return the speaker's smoothed freezes per hour in a window."""
+        rate = self._fleet.rate(window, self._fleet.average)
+        if (counts := self._models.get(model)) is not None:
+            rate = counts.rate(window, rate)
+        if (counts := self._speakers.get(uuid)) is not None:
+            rate = counts.rate(window, rate)
+        return rate
+
+    def assess(
+        self, uuid: str, model: str, booted_at: float, now: float
+    ) -> FreezeRisk | None:
+        """Return the speaker's current freeze risk, or None without data.
+
+        A reboot is recommended when the speaker is in a high-risk window
+        and a freshly booted speaker would be at lower risk.
+        """
+        average = self._fleet.average
+        if sum(self._fleet.freezes) < MIN_FREEZES or not average:
+            return None
+        window = uptime_window((now - booted_at) / 3600)
+        rate = self._rate(uuid, model, window)
+        if rate >= HIGH_RISK_RATIO * average:
+            level = "high"
+        elif rate <= LOW_RISK_RATIO * average:
+            level = "low"
+        else:
+            level = "normal"
+        return FreezeRisk(
+            level=level,
+            freezes_per_day=round(rate * 24, 3),
+            reboot_recommended=level == "high" and self._rate(uuid, model, 0) < rate,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the model's counts as a JSON-serializable dict."""
+        return {
+            "windows_h": list(UPTIME_WINDOWS_H),
+            "fleet": self._fleet.as_dict(),
+            "models": {model: c.as_dict() for model, c in self._models.items()},
+            "speakers": {uuid: c.as_dict() for uuid, c in self._speakers.items()},
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore counts saved with ``as_dict``."""
+        self._fleet = _Counts.from_dict(data.get("fleet", {}))
+        self._models = {
+            model: _Counts.from_dict(counts)
+            for model, counts in data.get("models", {}).items()
+        }
+        self._speakers = {
+            uuid: _Counts.from_dict(counts)
+            for uuid, counts in data.get("speakers", {}).items()
+        }
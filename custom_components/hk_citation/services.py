@@ -0,0 +1,124 @@
+"""Services for HK Citation Health Monitor."""
+
+from __future__ import annotations
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import ATTR_CYCLES, DOMAIN, SERVICE_PROBE, SERVICE_PROFILE
+from .coordinator import HKCitationCoordinator
+
+UNIQUE_ID_PREFIX = f"{DOMAIN}_"
+
+PROFILE_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CYCLES, default=1): vol.All(int, vol.Range(min=1, max=20))}
+)
+
+
+def _async_referenced_uuids(hass: HomeAssistant, call: ServiceCall) -> set[str]:
+    """Return the speaker UUIDs referenced by a service call's targets."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+
+    device_ids = set(selected.referenced_devices)
+    uuids: set[str] = set()
+    for entity_id in selected.referenced | selected.indirectly_referenced:
+        entry = entity_registry.async_get(entity_id)
+        if entry is None or entry.platform != DOMAIN:
+            continue
+        if entry.unique_id.startswith(UNIQUE_ID_PREFIX):
+            uuids.add(entry.unique_id.removeprefix(UNIQUE_ID_PREFIX))
+        elif entry.device_id:
+            device_ids.add(entry.device_id)
+
+    for device_id in device_ids:
+        if (device := device_registry.async_get(device_id)) is None:
+            continue
+        uuids.update(
+            identifier for domain, identifier in device.identifiers if domain == DOMAIN
+        )
+    return uuids
+
+
+def _async_coordinators(hass: HomeAssistant) -> list[HKCitationCoordinator]:
+    """Return the coordinators of all loaded config entries."""
+    return [
+        entry.runtime_data for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ]
+
+
+async def _async_handle_probe(call: ServiceCall) -> ServiceResponse:
+    """Probe the targeted speakers immediately and return the results."""
+    hass = call.hass
+    uuids = _async_referenced_uuids(hass, call)
+    if not uuids:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_speakers_targeted"
+        )
+
+    speakers: dict[str, dict] = {}
+    for coordinator in _async_coordinators(hass):
+        owned = {uuid for uuid in uuids if coordinator.has_speaker(uuid)}
+        if owned:
+            speakers.update(await coordinator.async_probe_speakers(owned))
+
+    if not speakers:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="no_speakers_targeted"
+        )
+    return {"speakers": speakers}
+
+
+async def _async_handle_profile(call: ServiceCall) -> ServiceResponse:
+    """Profile the next cycles of every loaded entry.
+
+    Returns the files each entry's profile and allocation summary will be
+    written to once its cycles have run.
+    """
+    coordinators = _async_coordinators(call.hass)
+    if not coordinators:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="not_loaded"
+        )
+    if any(coordinator.profiler is not None for coordinator in coordinators):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="profiling_active"
+        )
+
+    files: dict[str, dict[str, str]] = {}
+    for coordinator in coordinators:
+        profiler = coordinator.async_start_profiling(call.data[ATTR_CYCLES])
+        files[coordinator.entry.entry_id] = {
+            "profile": profiler.profile_path,
+            "allocations": profiler.allocations_path,
+        }
+    return {"entries": files}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROBE,
+        _async_handle_probe,
+        schema=cv.make_entity_service_schema({}),
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,144 @@
+"""Subnet sweep discovery for HK Citation Health Monitor.
+
+Used alongside mDNS on networks where multicast does not cross VLANs.
+Hosts in the configured CIDR ranges are checked with a plain TCP connect to
+port 8008; hosts that accept are confirmed as Citations by reading
+``/setup/eureka_info``. Each sweep covers at most ``hosts_per_cycle`` hosts and
+the next sweep resumes where the previous one stopped, so large ranges are
+covered incrementally.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import ipaddress
+import logging
+import time
+from collections.abc import Collection
+
+import aiohttp
+
+from .const import PORT_8008
+from .discovery import async_fetch_identity
+
+_LOGGER = logging.getLogger(__name__)
+
+SWEEP_CONNECT_TIMEOUT = 0.5
+
+
+def parse_subnets(value: str) -> list[ipaddress.IPv4Network]:
+    """Parse a comma-separated list of IPv4 CIDR ranges.
+
+    Raises ValueError if any entry is not a valid IPv4 network.
+    """
+    networks = []
+    for part in value.split(","):
+        if part := part.strip():
+            network = ipaddress.ip_network(part, strict=False)
+            if not isinstance(network, ipaddress.IPv4Network):
+                raise ValueError(f"{part} is not an IPv4 network")
+            networks.append(network)
+    return networks
+
+
+class SubnetSweeper:
+    """Resumable, rate-limited sweep of CIDR ranges for Citation speakers."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        networks: list[ipaddress.IPv4Network],
+        concurrency: int,
+        rate: float,
+        hosts_per_cycle: int,
+    ) -> None:
+        """Initialize the sweeper."""
+        self._session = session
+        self._networks = networks
+        self._sizes = [self._host_count(network) for network in networks]
+        self._total = sum(self._sizes)
+        self._concurrency = concurrency
+        self._interval = 1 / rate
+        self._hosts_per_cycle = hosts_per_cycle
+        self._cursor = 0
+        self._next_slot = 0.0
+
+    @staticmethod
+    def _host_count(network: ipaddress.IPv4Network) -> int:
+        """Return the number of usable host addresses in a network."""
+        if network.prefixlen >= 31:
+            return network.num_addresses
+        return network.num_addresses - 2
+
+    def _host_at(self, index: int) -> str:
+        """Return the host at a position in the concatenated host list."""
+        for network, size in zip(self._networks, self._sizes, strict=True):
+            if index < size:
+                offset = index if network.prefixlen >= 31 else index + 1
+                return str(network.network_address + offset)
+            index -= size
+        raise IndexError(index)
+
+    async def _throttle(self) -> None:
+        """Wait for the next connect slot allowed by the rate limit."""
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _port_open(self, ip: str) -> bool:
+        """Return True if the host accepts TCP connections on port 8008."""
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, PORT_8008), SWEEP_CONNECT_TIMEOUT
+            )
+        except (OSError, TimeoutError):
+            return False
+        writer.close()
+        # The port answered; a reset while closing does not change that.
+        with contextlib.suppress(OSError):
+            await writer.wait_closed()
+        return True
+
+    async def _identify(self, ip: str) -> dict[str, str] | None:
+        """Read eureka_info and return the speaker if the host is a Citation."""
+        return await async_fetch_identity(self._session, ip)
+
+    async def async_sweep(self, skip_ips: Collection[str] = ()) -> list[dict[str, str]]:
+        """Sweep the next slice of the configured ranges.
+
+        Hosts in ``skip_ips`` (speakers already known at that address) are
+        passed over without a connect. Returns the Citations found, in the
+        same format as the mDNS scanner.
+        """
+        if not self._total:
+            return []
+
+        count = min(self._hosts_per_cycle, self._total)
+        start = self._cursor
+        self._cursor = (start + count) % self._total
+        hosts = (self._host_at((start + i) % self._total) for i in range(count))
+
+        found: list[dict[str, str]] = []
+
+        async def _worker() -> None:
+            # Workers share the host generator, so a slice of any size costs
+            # ``concurrency`` tasks rather than one task per host.
+            for ip in hosts:
+                if ip in skip_ips:
+                    continue
+                await self._throttle()
+                if await self._port_open(ip) and (speaker := await self._identify(ip)):
+                    found.append(speaker)
+
+        await asyncio.gather(*(_worker() for _ in range(self._concurrency)))
+        _LOGGER.debug(
+            "Subnet sweep checked hosts %d-%d of %d, found %d speakers",
+            start,
+            start + count - 1,
+            self._total,
+            len(found),
+        )
+        return found
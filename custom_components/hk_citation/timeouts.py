@@ -0,0 +1,79 @@
+"""Per-host adaptive request timeouts for HK Citation Health Monitor.
+
+Each host's timeout follows its observed response times the way TCP's
+retransmission timeout does (RFC 6298): a smoothed round-trip time plus four
+times its mean deviation, doubled after every failed request and clamped to
+a floor and a ceiling. A dead host is then given up on within a few multiples
+of its usual response time instead of a fixed number of seconds. Like the
+probe module, this module does not depend on Home Assistant.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+# RFC 6298 gains of the smoothed round-trip time and of its deviation, and
+# the deviation multiplier.
+ALPHA = 1 / 8
+BETA = 1 / 4
+K = 4
+# Failed requests after which the backoff stops doubling.
+MAX_BACKOFF_DOUBLINGS = 6
+
+
+@dataclass(slots=True)
+class _Estimate:
+    """Round-trip statistics of one host, in seconds."""
+
+    srtt: float
+    rttvar: float
+    backoff: int = 0
+
+
+class AdaptiveTimeouts:
+    """Track response times per host and derive its request timeout."""
+
+    def __init__(self, floor: float, ceiling: float) -> None:
+        """Initialize with timeout bounds in seconds."""
+        self.floor = floor
+        self.ceiling = max(ceiling, floor)
+        self._hosts: dict[str, _Estimate] = {}
+
+    def timeout(self, host: str) -> float:
+        """Return the timeout in seconds for the next request to ``host``.
+
+        A host without a response time yet gets the ceiling.
+        """
+        estimate = self._hosts.get(host)
+        if estimate is None:
+            return self.ceiling
+        rto = (estimate.srtt + K * estimate.rttvar) * 2**estimate.backoff
+        return min(max(rto, self.floor), self.ceiling)
+
+    def record(self, host: str, seconds: float) -> None:
+        """Record the response time of a successful request."""
+        estimate = self._hosts.get(host)
+        if estimate is None:
+            self._hosts[host] = _Estimate(seconds, seconds / 2)
+            return
+        estimate.rttvar += BETA * (abs(estimate.srtt - seconds) - estimate.rttvar)
+        estimate.srtt += ALPHA * (seconds - estimate.srtt)
+        estimate.backoff = 0
+
+    def record_failure(self, host: str) -> None:
+        """Back off after a failed request, so a slow link is not cut short."""
+        if (estimate := self._hosts.get(host)) is not None:
+            estimate.backoff = min(estimate.backoff + 1, MAX_BACKOFF_DOUBLINGS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return each host's statistics and timeout in milliseconds."""
+        return {
+            host: {
+                "srtt_ms": round(estimate.srtt * 1000, 1),
+                "rttvar_ms": round(estimate.rttvar * 1000, 1),
+                "backoff": estimate.backoff,
+                "timeout_ms": round(self.timeout(host) * 1000, 1),
+            }
+            for host, estimate in self._hosts.items()
+        }
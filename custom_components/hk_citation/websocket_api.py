@@ -0,0 +1,165 @@
+"""Websocket API for HK Citation Health Monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+from .history import RESOLUTIONS
+from .models import ProbeSample
+from .services import UNIQUE_ID_PREFIX
+
+WS_SUBSCRIBE_PROBES = f"{DOMAIN}/subscribe_probes"
+WS_HISTORY = f"{DOMAIN}/history"
+# Samples buffered per subscriber; older samples are dropped once full.
+DEFAULT_SUBSCRIBER_QUEUE = 256
+MAX_SUBSCRIBER_QUEUE = 4096
+# Minimum seconds between two batches sent to one subscriber.
+SAMPLE_BATCH_INTERVAL = 0.25
+
+
+@callback
+def _async_resolve_uuid(hass: HomeAssistant, msg: dict[str, Any]) -> str | None:
+    """Return the speaker UUID a subscription follows, or None for all."""
+    if "entity_id" not in msg:
+        return msg.get("uuid")
+    entry = er.async_get(hass).async_get(msg["entity_id"])
+    if (
+        entry is None
+        or entry.platform != DOMAIN
+        or not entry.unique_id.startswith(UNIQUE_ID_PREFIX)
+    ):
+        raise vol.Invalid(f"{msg['entity_id']} is not an HK Citation speaker")
+    return entry.unique_id.removeprefix(UNIQUE_ID_PREFIX)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_SUBSCRIBE_PROBES,
+        vol.Exclusive("uuid", "speaker"): str,
+        vol.Exclusive("entity_id", "speaker"): str,
+        vol.Optional("max_queue", default=DEFAULT_SUBSCRIBER_QUEUE): vol.All(
+            int, vol.Range(min=1, max=MAX_SUBSCRIBER_QUEUE)
+        ),
+    }
+)
+@callback
+def ws_subscribe_probes(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream probe samples to the client as each probe completes.
+
+    Samples are buffered in a bounded queue per subscriber and sent in
+    batches, at most one every ``SAMPLE_BATCH_INTERVAL`` seconds. When a
+    subscriber falls behind, the oldest samples are dropped and the number
+    dropped is reported with the next batch. The coordinators only append
+    to the queue, so a slow client never holds up a probe cycle.
+    """
+    try:
+        uuid = _async_resolve_uuid(hass, msg)
+    except vol.Invalid as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+
+    queue: deque[dict[str, Any]] = deque(maxlen=msg["max_queue"])
+    pending = asyncio.Event()
+    dropped = 0
+
+    @callback
+    def _async_on_sample(speaker_uuid: str, sample: ProbeSample) -> None:
+        nonlocal dropped
+        if len(queue) == queue.maxlen:
+            dropped += 1
+        queue.append({"uuid": speaker_uuid, "time": time.time(), **sample.as_dict()})
+        pending.set()
+
+    async def _async_send_batches() -> None:
+        nonlocal dropped
+        while True:
+            await pending.wait()
+            pending.clear()
+            samples = list(queue)
+            queue.clear()
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"], {"samples": samples, "dropped": dropped}
+                )
+            )
+            dropped = 0
+            await asyncio.sleep(SAMPLE_BATCH_INTERVAL)
+
+    unsubscribers = [
+        entry.runtime_data.async_subscribe_samples(_async_on_sample, uuid)
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ]
+    sender = hass.async_create_background_task(
+        _async_send_batches(), f"{DOMAIN} probe stream {msg['id']}"
+    )
+
+    @callback
+    def _async_unsubscribe() -> None:
+        sender.cancel()
+        for unsubscribe in unsubscribers:
+            unsubscribe()
+
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_HISTORY,
+        vol.Exclusive("uuid", "speaker"): str,
+        vol.Exclusive("entity_id", "speaker"): str,
+        vol.Optional("resolution", default="hour"): vol.In(["raw", *RESOLUTIONS]),
+    }
+)
+@callback
+def ws_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a speaker's latency history at the requested resolution."""
+    try:
+        uuid = _async_resolve_uuid(hass, msg)
+    except vol.Invalid as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+    if uuid is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_INVALID_FORMAT, "uuid or entity_id required"
+        )
+        return
+
+    resolution = msg["resolution"]
+    for entry in hass.config_entries.async_loaded_entries(DOMAIN):
+        history = entry.runtime_data.history
+        if resolution == "raw":
+            points = history.samples(uuid)
+        else:
+            points = [bucket.as_dict() for bucket in history.buckets(uuid, resolution)]
+        if points:
+            break
+    else:
+        points = []
+    connection.send_result(
+        msg["id"], {"uuid": uuid, "resolution": resolution, "history": points}
+    )
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_probes)
+    websocket_api.async_register_command(hass, ws_history)
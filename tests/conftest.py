@@ -1,5 +1,8 @@
 """Global fixtures for HK Citation tests."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 
@@ -7,3 +10,11 @@ import pytest
 def auto_enable_custom_integrations(enable_custom_integrations):
     """Enable custom integrations in all tests."""
     yield
+
+
+@pytest.fixture(autouse=True)
+def history_file(tmp_path: Path):
+    """Keep the latency history log out of the shared test config directory."""
+    path = tmp_path / "hk_citation.history.jsonl"
+    with patch("custom_components.hk_citation.coordinator.HISTORY_FILE", str(path)):
+        yield path
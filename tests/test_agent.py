@@ -0,0 +1,167 @@
+"""Tests for HK Citation remote probe agents."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.hk_citation import agent
+from custom_components.hk_citation.const import (
+    AGENT_API_PATH,
+    CONF_SCAN_INTERVAL,
+    CONF_THRESHOLD_MS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD_MS,
+    DOMAIN,
+)
+from custom_components.hk_citation.models import (
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+
+OFFICE = Speaker(
+    uuid="uuid-office",
+    name="Office speaker",
+    ip="10.0.20.31",
+    model="HK Citation 300",
+)
+HEALTHY = SpeakerHealth(
+    healthy=True,
+    response_time_ms=12.0,
+    probes=(ProbeSample("reboot", 12.0),),
+)
+COORDINATOR = "custom_components.hk_citation.coordinator.HKCitationCoordinator"
+PROBE = "custom_components.hk_citation.probe"
+
+
+async def _setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+        unique_id=DOMAIN,
+    )
+    entry.add_to_hass(hass)
+    with patch(f"{COORDINATOR}._async_update_data", return_value={"speakers": {}}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def test_agent_push_over_loopback(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test that an agent on loopback pushes results that become entities."""
+    await _setup_integration(hass)
+    client = await hass_client_no_auth()
+    url = str(client.make_url("/"))
+
+    await agent.async_push(
+        client.session,
+        url,
+        hass_access_token,
+        "vlan20",
+        [SpeakerStatus(OFFICE, HEALTHY)],
+    )
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.office_speaker_health")
+    assert state is not None
+    assert state.state == STATE_ON
+    assert state.attributes["ip_address"] == OFFICE.ip
+
+    frozen = SpeakerHealth(False, 3000.0, (ProbeSample("reboot", 3000.0),))
+    await agent.async_push(
+        client.session,
+        url,
+        hass_access_token,
+        "vlan20",
+        [SpeakerStatus(OFFICE, frozen)],
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.office_speaker_health").state == STATE_OFF
+
+
+async def test_agent_push_requires_auth(
+    hass: HomeAssistant, hass_client_no_auth: ClientSessionGenerator
+) -> None:
+    """Test that the agent endpoint rejects unauthenticated pushes."""
+    await _setup_integration(hass)
+    client = await hass_client_no_auth()
+
+    with pytest.raises(aiohttp.ClientResponseError) as err:
+        await agent.async_push(
+            client.session,
+            str(client.make_url("/")),
+            "not-a-token",
+            "vlan20",
+            [SpeakerStatus(OFFICE, HEALTHY)],
+        )
+    assert err.value.status == HTTPStatus.UNAUTHORIZED
+
+
+async def test_agent_endpoint_rejects_invalid_payload(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test that malformed agent payloads are rejected."""
+    await _setup_integration(hass)
+    client = await hass_client()
+
+    resp = await client.post(
+        AGENT_API_PATH, json={"agent_id": "vlan20", "speakers": [{"uuid": "x"}]}
+    )
+    assert resp.status == HTTPStatus.BAD_REQUEST
+
+
+async def test_agent_speakers_not_probed_locally(hass: HomeAssistant) -> None:
+    """Test that a speaker with a fresh agent result is not probed by HA."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    coordinator._speakers[OFFICE.uuid] = OFFICE
+    coordinator.async_merge_agent_results("vlan20", [SpeakerStatus(OFFICE, HEALTHY)])
+
+    probe = AsyncMock()
+    with (
+        patch(
+            "custom_components.hk_citation.coordinator.run_mdns_scan",
+            return_value=[],
+        ),
+        patch(f"{COORDINATOR}._async_check_speaker", probe),
+    ):
+        data = await coordinator._async_update_data()
+
+    probe.assert_not_called()
+    assert data["speakers"][OFFICE.uuid].health == HEALTHY
+
+
+async def test_agent_collect() -> None:
+    """Test that the agent reports only hosts that identify as Citations."""
+
+    async def _identity(session: Any, ip: str) -> dict[str, str] | None:
+        return OFFICE.as_dict() if ip == OFFICE.ip else None
+
+    with (
+        patch(f"{PROBE}.async_fetch_identity", side_effect=_identity),
+        patch(f"{PROBE}.async_probe_speaker", AsyncMock(return_value=HEALTHY)) as probe,
+    ):
+        statuses = await agent.async_collect(
+            AsyncMock(), [OFFICE.ip, "10.0.20.99"], DEFAULT_THRESHOLD_MS
+        )
+
+    assert statuses == [SpeakerStatus(OFFICE, HEALTHY)]
+    probe.assert_awaited_once()
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import dataclasses
 from unittest.mock import patch
 
-from homeassistant.const import STATE_ON, STATE_OFF
+from homeassistant.const import STATE_OFF, STATE_ON, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr, entity_registry as er
-
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.hk_citation.binary_sensor import HKCitationHealthSensor
 from custom_components.hk_citation.const import (
     CONF_SCAN_INTERVAL,
     CONF_THRESHOLD_MS,
@@ -17,33 +19,49 @@ from custom_components.hk_citation.const import (
     DEFAULT_THRESHOLD_MS,
     DOMAIN,
 )
+from custom_components.hk_citation.models import (
+    FreezeRisk,
+    ProbeSample,
+    Speaker,
+    SpeakerDetails,
+    SpeakerHealth,
+    SpeakerStatus,
+)
 
 MOCK_COORDINATOR_DATA = {
     "speakers": {
-        "uuid-kitchen": {
-            "name": "Kitchen speaker",
-            "ip": "192.168.4.30",
-            "uuid": "uuid-kitchen",
-            "model": "HK Citation One",
-            "healthy": True,
-            "response_time_ms": 50.0,
-            "probes": [
-                {"endpoint": "get_app_device_id", "ms": 45.0, "error": ""},
-                {"endpoint": "reboot", "ms": 50.0, "error": ""},
-            ],
-        },
-        "uuid-hallway": {
-            "name": "Hallway speaker",
-            "ip": "192.168.4.33",
-            "uuid": "uuid-hallway",
-            "model": "HK Citation One",
-            "healthy": False,
-            "response_time_ms": 3106.0,
-            "probes": [
-                {"endpoint": "get_app_device_id", "ms": 38.0, "error": ""},
-                {"endpoint": "reboot", "ms": 3106.0, "error": ""},
-            ],
-        },
+        "uuid-kitchen": SpeakerStatus(
+            Speaker(
+                uuid="uuid-kitchen",
+                name="Kitchen speaker",
+                ip="192.168.4.30",
+                model="HK Citation One",
+            ),
+            SpeakerHealth(
+                healthy=True,
+                response_time_ms=50.0,
+                probes=(
+                    ProbeSample("get_app_device_id", 45.0),
+                    ProbeSample("reboot", 50.0),
+                ),
+            ),
+        ),
+        "uuid-hallway": SpeakerStatus(
+            Speaker(
+                uuid="uuid-hallway",
+                name="Hallway speaker",
+                ip="192.168.4.33",
+                model="HK Citation One",
+            ),
+            SpeakerHealth(
+                healthy=False,
+                response_time_ms=3106.0,
+                probes=(
+                    ProbeSample("get_app_device_id", 38.0),
+                    ProbeSample("reboot", 3106.0),
+                ),
+            ),
+        ),
     }
 }
 
@@ -103,3 +121,130 @@ async def test_binary_sensor_device_info(
     assert device is not None
     assert device.manufacturer == "Harman Kardon"
     assert device.model == "HK Citation One"
+
+
+async def test_state_writes_per_cycle(hass: HomeAssistant) -> None:
+    """Count state writes per cycle: only changed speakers are written."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    writes: list[str] = []
+    original = HKCitationHealthSensor.async_write_ha_state
+
+    def _count_write(self: HKCitationHealthSensor) -> None:
+        writes.append(self._uuid)
+        original(self)
+
+    with patch.object(HKCitationHealthSensor, "async_write_ha_state", _count_write):
+        # Unchanged cycle: nothing to write.
+        data = {"speakers": dict(MOCK_COORDINATOR_DATA["speakers"])}
+        coordinator.async_set_updated_data(data)
+        assert writes == []
+
+        # One speaker recovers: only its entity is written.
+        hallway = data["speakers"]["uuid-hallway"]
+        data = {"speakers": dict(data["speakers"])}
+        data["speakers"]["uuid-hallway"] = dataclasses.replace(
+            hallway,
+            health=dataclasses.replace(
+                hallway.health, healthy=True, response_time_ms=60.0
+            ),
+        )
+        coordinator.async_set_updated_data(data)
+        assert writes == ["uuid-hallway"]
+
+        # A speaker dropping out of the data is a change too.
+        writes.clear()
+        data = {"speakers": dict(data["speakers"])}
+        del data["speakers"]["uuid-kitchen"]
+        coordinator.async_set_updated_data(data)
+        assert writes == ["uuid-kitchen"]
+
+    state = hass.states.get("binary_sensor.hallway_speaker_health")
+    assert state.state == STATE_ON
+    assert (
+        hass.states.get("binary_sensor.kitchen_speaker_health").state
+        == STATE_UNAVAILABLE
+    )
+
+
+async def test_failed_cycle_writes_all_speakers(hass: HomeAssistant) -> None:
+    """A coordinator failure flips availability, so every entity is written."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    writes: list[str] = []
+    original = HKCitationHealthSensor.async_write_ha_state
+
+    def _count_write(self: HKCitationHealthSensor) -> None:
+        writes.append(self._uuid)
+        original(self)
+
+    with patch.object(HKCitationHealthSensor, "async_write_ha_state", _count_write):
+        coordinator.async_set_update_error(Exception("boom"))
+
+    assert sorted(writes) == ["uuid-hallway", "uuid-kitchen"]
+
+
+async def test_device_details_from_eureka_info(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test that device details become attributes and the firmware version."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    kitchen = MOCK_COORDINATOR_DATA["speakers"]["uuid-kitchen"]
+    details = SpeakerDetails(
+        sw_version="1.56.500000",
+        booted_at=1_700_000_040.0,
+        mac_address="AA:BB:CC:DD:EE:FF",
+        ssid="home",
+        signal_level=-52,
+    )
+    data = {"speakers": dict(MOCK_COORDINATOR_DATA["speakers"])}
+    data["speakers"]["uuid-kitchen"] = dataclasses.replace(kitchen, details=details)
+    coordinator.async_set_updated_data(data)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.kitchen_speaker_health")
+    assert state.attributes["booted_at"] == "2023-11-14T22:14:00+00:00"
+    assert state.attributes["wifi_signal_dbm"] == -52
+    er_entry = entity_registry.async_get("binary_sensor.kitchen_speaker_health")
+    assert device_registry.async_get(er_entry.device_id).sw_version == "1.56.500000"
+
+    # Only a changed version is written to the device registry.
+    with patch.object(dr.DeviceRegistry, "async_update_device") as update:
+        data = {"speakers": dict(data["speakers"])}
+        data["speakers"]["uuid-kitchen"] = dataclasses.replace(
+            data["speakers"]["uuid-kitchen"],
+            details=dataclasses.replace(details, signal_level=-60),
+        )
+        coordinator.async_set_updated_data(data)
+    update.assert_not_called()
+
+
+async def test_freeze_risk_attributes(hass: HomeAssistant) -> None:
+    """Test that the freeze risk and reboot hint become attributes."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    data = {"speakers": dict(MOCK_COORDINATOR_DATA["speakers"])}
+    data["speakers"]["uuid-kitchen"] = dataclasses.replace(
+        data["speakers"]["uuid-kitchen"], risk=FreezeRisk("high", 0.5)
+    )
+    coordinator.async_set_updated_data(data)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.kitchen_speaker_health")
+    assert state.attributes["freeze_risk"] == "high"
+    assert state.attributes["freezes_per_day"] == 0.5
+    assert "reboot_recommended" not in state.attributes
+
+    data = {"speakers": dict(data["speakers"])}
+    data["speakers"]["uuid-kitchen"] = dataclasses.replace(
+        data["speakers"]["uuid-kitchen"],
+        risk=FreezeRisk("high", 0.5, reboot_recommended=True),
+    )
+    coordinator.async_set_updated_data(data)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.kitchen_speaker_health")
+    assert state.attributes["reboot_recommended"] is True
@@ -0,0 +1,116 @@
+"""Tests for the HK Citation command-line prober."""
+
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from custom_components.hk_citation import cli
+from custom_components.hk_citation.models import ProbeSample, SpeakerHealth
+
+KITCHEN = {
+    "name": "Kitchen speaker",
+    "ip": "192.168.4.30",
+    "uuid": "aaa-bbb-ccc",
+    "model": "HK Citation One",
+}
+HEALTHY = SpeakerHealth(True, 40.0, (ProbeSample("reboot", 40.0),))
+FROZEN = SpeakerHealth(False, 3000.0, (ProbeSample("reboot", 3000.0),))
+PROBE = "custom_components.hk_citation.probe"
+
+
+async def _run(argv: list[str], health: SpeakerHealth) -> tuple[int, list[dict]]:
+    """Run the CLI against mocked speakers and return exit status and lines."""
+
+    async def _identity(session: Any, ip: str) -> dict[str, str] | None:
+        return {**KITCHEN, "ip": ip} if ip.startswith("192.168.4.") else None
+
+    out = io.StringIO()
+    with (
+        patch(f"{PROBE}.async_fetch_identity", side_effect=_identity),
+        patch(f"{PROBE}.async_probe_speaker", AsyncMock(return_value=health)),
+        patch.object(cli, "run_mdns_scan", return_value=[KITCHEN]) as mdns,
+    ):
+        status = await cli.async_run(cli.build_parser().parse_args(argv), out)
+    if argv:
+        mdns.assert_not_called()
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+async def test_cli_discovers_via_mdns() -> None:
+    """Test that without IPs the fleet is discovered and probed."""
+    status, lines = await _run([], HEALTHY)
+
+    assert status == 0
+    assert len(lines) == 1
+    assert lines[0]["uuid"] == "aaa-bbb-ccc"
+    assert lines[0]["healthy"] is True
+    assert lines[0]["reachable"] is True
+    assert "time" in lines[0]
+
+
+async def test_cli_streams_json_lines_for_ips() -> None:
+    """Test one JSON line per host, including unreachable ones."""
+    status, lines = await _run(["192.168.4.30", "192.168.4.31", "10.9.9.9"], HEALTHY)
+
+    assert status == 1
+    by_ip = {line["ip"]: line for line in lines}
+    assert set(by_ip) == {"192.168.4.30", "192.168.4.31", "10.9.9.9"}
+    assert by_ip["10.9.9.9"] == {
+        "time": by_ip["10.9.9.9"]["time"],
+        "ip": "10.9.9.9",
+        "reachable": False,
+    }
+
+
+async def test_cli_exit_status_unhealthy() -> None:
+    """Test that a frozen speaker fails a single run."""
+    status, lines = await _run(["192.168.4.30"], FROZEN)
+
+    assert status == 1
+    assert lines[0]["healthy"] is False
+
+
+async def test_cli_sweep_identities_not_fetched_again() -> None:
+    """Test that hosts found by a subnet sweep are probed without re-identifying."""
+    with (
+        patch.object(
+            cli.SubnetSweeper, "async_sweep", AsyncMock(return_value=[KITCHEN])
+        ) as sweep,
+        patch(f"{PROBE}.async_fetch_identity") as identity,
+        patch(f"{PROBE}.async_probe_speaker", AsyncMock(return_value=HEALTHY)),
+    ):
+        args = cli.build_parser().parse_args(["--subnet", "192.168.4.0/24"])
+        status = await cli.async_run(args, io.StringIO())
+
+    assert status == 0
+    sweep.assert_awaited_once()
+    identity.assert_not_called()
+
+
+def test_entry_points_run_without_zeroconf_or_home_assistant() -> None:
+    """Test that the agent and the CLI start with neither package importable."""
+    code = (
+        "import runpy, sys\n"
+        "for name in ('zeroconf', 'homeassistant'):\n"
+        "    sys.modules[name] = None\n"
+        "sys.argv = ['prog', '--help']\n"
+        "for module in ('hk_citation', 'hk_citation.agent'):\n"
+        "    try:\n"
+        "        runpy.run_module(module, run_name='__main__', alter_sys=True)\n"
+        "    except SystemExit as err:\n"
+        "        assert not err.code, err.code\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(cli.__file__).parents[1],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
@@ -1,41 +1,107 @@
 """Tests for HK Citation config flow."""
 
+from unittest.mock import patch
+
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hk_citation.const import (
+    CONF_INTERFACE,
+    CONF_PROBE_FRESHNESS,
+    CONF_REMEDIATION_COOLDOWN,
+    CONF_REMEDIATION_MAX_ATTEMPTS,
+    CONF_REMEDIATION_OFF_TIME,
+    CONF_REMEDIATION_SWITCHES,
     CONF_SCAN_INTERVAL,
+    CONF_SUBNETS,
+    CONF_SWEEP_SUBNETS,
     CONF_THRESHOLD_MS,
+    CONF_TIMEOUT_CEILING,
+    CONF_TIMEOUT_FLOOR,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_THRESHOLD_MS,
     DOMAIN,
 )
+from custom_components.hk_citation.models import Speaker
 
 
 async def test_user_flow_creates_entry(hass: HomeAssistant) -> None:
-    """Test that the user flow creates a config entry with no user input."""
+    """Test that the user flow creates the default-network entry."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
     )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "user"
+
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert result["title"] == "HK Citation Health Monitor"
-    assert result["data"] == {}
+    assert result["data"] == {CONF_INTERFACE: "", CONF_SUBNETS: ""}
+    assert result["result"].unique_id == DOMAIN
+
+
+async def test_default_network_only_once(hass: HomeAssistant) -> None:
+    """Test that the default network can only be configured once."""
+    MockConfigEntry(domain=DOMAIN, data={}, unique_id=DOMAIN).add_to_hass(hass)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(result["flow_id"], {})
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
 
 
-async def test_single_instance_only(hass: HomeAssistant) -> None:
-    """Test that only one instance can be configured."""
+async def test_user_flow_segment_entry(hass: HomeAssistant) -> None:
+    """Test that further entries can each monitor a network segment."""
+    MockConfigEntry(domain=DOMAIN, data={}, unique_id=DOMAIN).add_to_hass(hass)
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
     )
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_INTERFACE: "10.0.4", CONF_SUBNETS: "10.0.4.0/33"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {
+        CONF_INTERFACE: "invalid_interface",
+        CONF_SUBNETS: "invalid_subnets",
+    }
+
+    with patch("custom_components.hk_citation.async_setup_entry", return_value=True):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"],
+            {CONF_INTERFACE: "10.0.4.2", CONF_SUBNETS: "10.0.4.0/22"},
+        )
     assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert result["title"] == "HK Citation 10.0.4.0/22"
+    assert result["data"] == {CONF_INTERFACE: "10.0.4.2", CONF_SUBNETS: "10.0.4.0/22"}
+
 
+async def test_user_flow_rejects_overlapping_segments(hass: HomeAssistant) -> None:
+    """Test that no two entries monitor the same addresses."""
+    MockConfigEntry(domain=DOMAIN, data={}, unique_id=DOMAIN).add_to_hass(hass)
+    MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_INTERFACE: "", CONF_SUBNETS: "10.0.0.0/16"},
+        unique_id="|10.0.0.0/16",
+    ).add_to_hass(hass)
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": SOURCE_USER}
     )
-    assert result["type"] is FlowResultType.ABORT
-    assert result["reason"] == "already_configured"
+
+    for user_input in (
+        {CONF_SUBNETS: "10.0.4.0/22"},
+        # A second entry without subnets would overlap the default one.
+        {CONF_INTERFACE: "10.0.4.2"},
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input
+        )
+        assert result["type"] is FlowResultType.FORM
+        assert result["errors"] == {CONF_SUBNETS: "overlapping_segment"}
 
 
 async def test_options_flow_shows_form(hass: HomeAssistant) -> None:
@@ -78,3 +144,128 @@ async def test_options_flow_updates_values(hass: HomeAssistant) -> None:
     assert result["type"] is FlowResultType.CREATE_ENTRY
     assert entry.options[CONF_SCAN_INTERVAL] == 120
     assert entry.options[CONF_THRESHOLD_MS] == 2000
+
+
+async def test_options_flow_rejects_invalid_subnets(hass: HomeAssistant) -> None:
+    """Test that invalid subnet sweep ranges are rejected."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SCAN_INTERVAL: 120,
+            CONF_THRESHOLD_MS: 2000,
+            CONF_SWEEP_SUBNETS: "10.0.4.0/22, not-a-subnet",
+        },
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_SWEEP_SUBNETS: "invalid_subnets"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_SCAN_INTERVAL: 120,
+            CONF_THRESHOLD_MS: 2000,
+            CONF_SWEEP_SUBNETS: "10.0.4.0/22",
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_SWEEP_SUBNETS] == "10.0.4.0/22"
+
+
+async def test_options_flow_rejects_floor_above_ceiling(hass: HomeAssistant) -> None:
+    """Test that a timeout floor above the ceiling is rejected."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_TIMEOUT_FLOOR: 4000, CONF_TIMEOUT_CEILING: 3000},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_TIMEOUT_FLOOR: "timeout_floor_above_ceiling"}
+
+
+async def test_options_flow_rejects_freshness_not_below_interval(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a probe freshness as long as the scan interval is rejected."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 120, CONF_PROBE_FRESHNESS: 120},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_PROBE_FRESHNESS: "freshness_not_below_interval"}
+
+
+async def test_options_flow_links_remediation_switches(hass: HomeAssistant) -> None:
+    """Test that a loaded entry offers a switch link for each known speaker."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.hk_citation.coordinator.HKCitationCoordinator._async_update_data",
+        return_value={"speakers": {}},
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    kitchen = Speaker("uuid-kitchen", "Kitchen speaker", "192.168.4.30", "")
+    entry.runtime_data._speakers[kitchen.uuid] = kitchen
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_SCAN_INTERVAL: 120, CONF_THRESHOLD_MS: 2000},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "remediation"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_REMEDIATION_OFF_TIME: 15,
+            CONF_REMEDIATION_MAX_ATTEMPTS: 2,
+            CONF_REMEDIATION_COOLDOWN: 1800,
+            "Kitchen speaker": "switch.kitchen_plug",
+        },
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_SCAN_INTERVAL] == 120
+    assert entry.options[CONF_REMEDIATION_OFF_TIME] == 15
+    assert entry.options[CONF_REMEDIATION_SWITCHES] == {
+        kitchen.uuid: "switch.kitchen_plug"
+    }
@@ -2,21 +2,45 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import time
+from dataclasses import replace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch, sentinel
 
 import aiohttp
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.hk_citation.const import (
+    CONF_BROWSE_EVERY,
+    CONF_CYCLE_BUDGET,
+    CONF_INTERFACE,
+    CONF_PROBE_CONCURRENCY,
+    CONF_PROBE_FRESHNESS,
+    CONF_RISK_SCHEDULING,
     CONF_SCAN_INTERVAL,
+    CONF_SUBNETS,
     CONF_THRESHOLD_MS,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_THRESHOLD_MS,
     DOMAIN,
 )
-from custom_components.hk_citation.coordinator import HKCitationCoordinator
+from custom_components.hk_citation.coordinator import (
+    RISK_PROBE_SPEEDUP,
+    STORAGE_KEY,
+    HKCitationCoordinator,
+    _SingleFlight,
+)
+from custom_components.hk_citation.models import (
+    FreezeRisk,
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
 
 FAKE_SPEAKER = {
     "name": "Kitchen speaker",
@@ -32,14 +56,17 @@ FAKE_CHROMECAST = {
     "model": "Chromecast",
 }
 
-HEALTHY_PROBE_RESULT = {
-    "healthy": True,
-    "response_time_ms": 150.0,
-    "probes": [
-        {"endpoint": "get_app_device_id", "ms": 100.0, "error": ""},
-        {"endpoint": "reboot", "ms": 150.0, "error": ""},
-    ],
-}
+COORDINATOR = "custom_components.hk_citation.coordinator"
+MDNS_SCAN = f"{COORDINATOR}.run_mdns_scan"
+
+HEALTHY_PROBE_RESULT = SpeakerHealth(
+    healthy=True,
+    response_time_ms=150.0,
+    probes=(
+        ProbeSample("get_app_device_id", 100.0),
+        ProbeSample("reboot", 150.0),
+    ),
+)
 
 
 def _make_entry(hass: HomeAssistant) -> MockConfigEntry:
@@ -62,11 +89,8 @@ async def test_coordinator_discovers_speakers(hass: HomeAssistant) -> None:
     coordinator = HKCitationCoordinator(hass, entry)
 
     with (
-        patch.object(
-            coordinator,
-            "_discover_speakers_sync",
-            return_value=[FAKE_SPEAKER],
-        ),
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
         patch.object(
             coordinator,
             "_probe_speaker",
@@ -77,31 +101,27 @@ async def test_coordinator_discovers_speakers(hass: HomeAssistant) -> None:
 
     assert "speakers" in data
     assert "aaa-bbb-ccc" in data["speakers"]
-    speaker = data["speakers"]["aaa-bbb-ccc"]
-    assert speaker["name"] == "Kitchen speaker"
-    assert speaker["ip"] == "192.168.4.30"
-    assert speaker["uuid"] == "aaa-bbb-ccc"
-    assert speaker["model"] == "HK Citation One"
-    assert speaker["healthy"] is True
+    status = data["speakers"]["aaa-bbb-ccc"]
+    assert status.speaker.name == "Kitchen speaker"
+    assert status.speaker.ip == "192.168.4.30"
+    assert status.speaker.uuid == "aaa-bbb-ccc"
+    assert status.speaker.model == "HK Citation One"
+    assert status.health.healthy is True
 
 
 async def test_coordinator_filters_non_hk_speakers(hass: HomeAssistant) -> None:
     """Test that non-HK speakers from mDNS are filtered out.
 
-    The filtering happens inside _discover_speakers_sync, so we simulate
+    The filtering happens inside the mDNS scanner subprocess, so we simulate
     that it already filtered by returning an empty list when only a Chromecast
-    is on the network. We also verify the sync method's logic separately.
+    is on the network.
     """
     entry = _make_entry(hass)
     coordinator = HKCitationCoordinator(hass, entry)
 
-    # _discover_speakers_sync only returns HK speakers, so a Chromecast
+    # run_mdns_scan only returns HK speakers, so a Chromecast
     # would never be in the returned list.
-    with patch.object(
-        coordinator,
-        "_discover_speakers_sync",
-        return_value=[],
-    ):
+    with patch(MDNS_SCAN, return_value=[]):
         data = await coordinator._async_update_data()
 
     assert data["speakers"] == {}
@@ -112,11 +132,7 @@ async def test_coordinator_handles_empty_scan(hass: HomeAssistant) -> None:
     entry = _make_entry(hass)
     coordinator = HKCitationCoordinator(hass, entry)
 
-    with patch.object(
-        coordinator,
-        "_discover_speakers_sync",
-        return_value=[],
-    ):
+    with patch(MDNS_SCAN, return_value=[]):
         data = await coordinator._async_update_data()
 
     assert data == {"speakers": {}}
@@ -137,20 +153,20 @@ async def test_healthy_speaker_both_probes_fast(hass: HomeAssistant) -> None:
     mock_session.post = MagicMock(return_value=mock_response)
     coordinator._session = mock_session
 
-    with patch.object(
-        coordinator,
-        "_discover_speakers_sync",
-        return_value=[FAKE_SPEAKER],
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
     ):
         data = await coordinator._async_update_data()
 
-    speaker = data["speakers"]["aaa-bbb-ccc"]
-    assert speaker["healthy"] is True
-    assert len(speaker["probes"]) == 2
-    assert speaker["probes"][0]["endpoint"] == "get_app_device_id"
-    assert speaker["probes"][1]["endpoint"] == "reboot"
-    assert speaker["probes"][0]["error"] == ""
-    assert speaker["probes"][1]["error"] == ""
+    health = data["speakers"]["aaa-bbb-ccc"].health
+    assert health.healthy is True
+    assert len(health.probes) == 3
+    assert health.probes[0].endpoint == "get_app_device_id"
+    assert health.probes[1].endpoint == "reboot"
+    assert health.probes[2].endpoint == "https:8443/eureka_info"
+    assert health.probes[0].error == ""
+    assert health.probes[1].error == ""
 
 
 async def test_frozen_speaker_one_probe_slow(hass: HomeAssistant) -> None:
@@ -177,20 +193,19 @@ async def test_frozen_speaker_one_probe_slow(hass: HomeAssistant) -> None:
     mock_session.post = MagicMock(side_effect=side_effect)
     coordinator._session = mock_session
 
-    with patch.object(
-        coordinator,
-        "_discover_speakers_sync",
-        return_value=[FAKE_SPEAKER],
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
     ):
         data = await coordinator._async_update_data()
 
-    speaker = data["speakers"]["aaa-bbb-ccc"]
-    assert speaker["healthy"] is False
-    assert len(speaker["probes"]) == 2
+    health = data["speakers"]["aaa-bbb-ccc"].health
+    assert health.healthy is False
+    assert len(health.probes) == 3
     # First probe should be fine
-    assert speaker["probes"][0]["error"] == ""
+    assert health.probes[0].error == ""
     # Second probe should show timeout
-    assert speaker["probes"][1]["error"] == "timed out"
+    assert health.probes[1].error == "timed out"
 
 
 async def test_unreachable_speaker_connection_error(hass: HomeAssistant) -> None:
@@ -204,20 +219,19 @@ async def test_unreachable_speaker_connection_error(hass: HomeAssistant) -> None
     )
     coordinator._session = mock_session
 
-    with patch.object(
-        coordinator,
-        "_discover_speakers_sync",
-        return_value=[FAKE_SPEAKER],
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
     ):
         data = await coordinator._async_update_data()
 
-    speaker = data["speakers"]["aaa-bbb-ccc"]
-    assert speaker["healthy"] is False
-    assert len(speaker["probes"]) == 2
-    assert speaker["probes"][0]["error"] != ""
-    assert speaker["probes"][1]["error"] != ""
-    assert speaker["probes"][0]["ms"] == 0
-    assert speaker["probes"][1]["ms"] == 0
+    health = data["speakers"]["aaa-bbb-ccc"].health
+    assert health.healthy is False
+    assert len(health.probes) == 3
+    assert health.probes[0].error != ""
+    assert health.probes[1].error != ""
+    assert health.probes[0].ms == 0
+    assert health.probes[1].ms == 0
 
 
 async def test_new_speaker_callback(hass: HomeAssistant) -> None:
@@ -226,14 +240,13 @@ async def test_new_speaker_callback(hass: HomeAssistant) -> None:
     coordinator = HKCitationCoordinator(hass, entry)
 
     callback_calls: list[set[str]] = []
-    coordinator.register_new_speaker_callback(lambda uuids: callback_calls.append(uuids))
+    coordinator.register_new_speaker_callback(
+        lambda uuids: callback_calls.append(uuids)
+    )
 
     with (
-        patch.object(
-            coordinator,
-            "_discover_speakers_sync",
-            return_value=[FAKE_SPEAKER],
-        ),
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
         patch.object(
             coordinator,
             "_probe_speaker",
@@ -248,3 +261,614 @@ async def test_new_speaker_callback(hass: HomeAssistant) -> None:
         # Second scan — same speaker, callback should NOT fire again
         await coordinator._async_update_data()
         assert len(callback_calls) == 1
+
+
+async def test_cycle_budget_marks_unfinished_speakers_stale(
+    hass: HomeAssistant,
+) -> None:
+    """Test that speakers unchecked at the deadline keep their state as stale."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_CYCLE_BUDGET: 0.2}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    fast = Speaker.from_dict(FAKE_SPEAKER)
+    slow = Speaker("slow-uuid", "Hallway speaker", "192.168.4.33", "")
+    coordinator._speakers = {slow.uuid: slow, fast.uuid: fast}
+    coordinator.data = {
+        "speakers": {slow.uuid: SpeakerStatus(slow, HEALTHY_PROBE_RESULT)}
+    }
+    checked: list[str] = []
+    hang = asyncio.Event()
+
+    async def _check(ip: str, claimants: list[Speaker]) -> SpeakerStatus:
+        (speaker,) = claimants
+        checked.append(speaker.uuid)
+        if speaker is slow:
+            await hang.wait()
+        return SpeakerStatus(speaker, HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[]),
+        patch.object(coordinator, "_async_check_host", side_effect=_check),
+    ):
+        data = await coordinator._async_update_data()
+
+        assert data["speakers"][fast.uuid].stale is False
+        assert data["speakers"][slow.uuid].stale is True
+        assert coordinator.overruns == 1
+
+        # The stale speaker is checked first in the next cycle.
+        checked.clear()
+        hang.set()
+        coordinator.data = data
+        data = await coordinator._async_update_data()
+
+    assert checked == [slow.uuid, fast.uuid]
+    assert data["speakers"][slow.uuid].stale is False
+    assert coordinator.overruns == 1
+
+
+async def test_discovery_limited_to_budget_share(hass: HomeAssistant) -> None:
+    """Test that a hanging discovery is abandoned and probing still runs."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_CYCLE_BUDGET: 0.2}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    speaker = Speaker.from_dict(FAKE_SPEAKER)
+    coordinator._speakers = {speaker.uuid: speaker}
+
+    with (
+        patch(f"{COORDINATOR}.DISCOVERY_MIN_SECONDS", 0.1),
+        patch.object(
+            coordinator, "_discover_speakers", side_effect=asyncio.Event().wait
+        ),
+        patch.object(
+            coordinator,
+            "_async_check_host",
+            return_value=SpeakerStatus(speaker, HEALTHY_PROBE_RESULT),
+        ),
+    ):
+        data = await coordinator._async_update_data()
+
+    assert coordinator.discovery_timeouts == 1
+    assert data["speakers"][speaker.uuid].stale is False
+
+
+async def test_discovery_gets_minimum_time_on_small_budget(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a small budget does not cut the first discovery short."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_CYCLE_BUDGET: 0.2}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+
+    def _slow_scan(interface: str | None = None) -> list[dict[str, str]]:
+        # Longer than half the budget, shorter than the discovery minimum.
+        time.sleep(0.3)
+        return [FAKE_SPEAKER]
+
+    with (
+        patch(f"{COORDINATOR}.DISCOVERY_MIN_SECONDS", 1.0),
+        patch(MDNS_SCAN, _slow_scan),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", return_value=HEALTHY_PROBE_RESULT),
+    ):
+        data = await coordinator._async_update_data()
+
+    assert coordinator.discovery_timeouts == 0
+    assert "aaa-bbb-ccc" in data["speakers"]
+
+
+async def test_segment_entry_keeps_own_speakers(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that an entry limited to a segment discovers and stores its own."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_INTERFACE: "192.168.4.2", CONF_SUBNETS: "192.168.4.0/24"},
+        options={},
+        unique_id="192.168.4.2|192.168.4.0/24",
+    )
+    entry.add_to_hass(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    elsewhere = {**FAKE_SPEAKER, "uuid": "ggg-hhh-iii", "ip": "10.0.4.30"}
+
+    with patch(MDNS_SCAN, return_value=[FAKE_SPEAKER, elsewhere]) as mdns:
+        await coordinator._discover_speakers()
+        await hass.async_block_till_done()
+
+    mdns.assert_called_once_with("192.168.4.2")
+    assert set(coordinator.speakers) == {"aaa-bbb-ccc"}
+    assert STORAGE_KEY not in hass_storage
+    stored = hass_storage[f"{STORAGE_KEY}.{entry.entry_id}"]["data"]
+    assert stored == {"speakers": [FAKE_SPEAKER]}
+
+
+async def test_default_entry_leaves_segment_speakers(hass: HomeAssistant) -> None:
+    """Test that the default entry hands speakers over to a segment entry."""
+    default = _make_entry(hass)
+    segment = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_INTERFACE: "", CONF_SUBNETS: "10.0.4.0/22"},
+        options={},
+        unique_id="|10.0.4.0/22",
+    )
+    segment.add_to_hass(hass)
+    elsewhere = {**FAKE_SPEAKER, "uuid": "ggg-hhh-iii", "ip": "10.0.4.30"}
+    coordinator = HKCitationCoordinator(hass, default)
+    # Stored before the segment entry was added, with its entity.
+    coordinator._speakers = {"ggg-hhh-iii": Speaker.from_dict(elsewhere)}
+    entity_registry = er.async_get(hass)
+    entity_registry.async_get_or_create(
+        "binary_sensor",
+        DOMAIN,
+        "hk_citation_ggg-hhh-iii",
+        config_entry=default,
+    )
+    other = HKCitationCoordinator(hass, segment)
+
+    with patch(MDNS_SCAN, return_value=[FAKE_SPEAKER, elsewhere]):
+        await coordinator._discover_speakers()
+        await other._discover_speakers()
+        await hass.async_block_till_done()
+
+    assert set(coordinator.speakers) == {"aaa-bbb-ccc"}
+    assert set(other.speakers) == {"ggg-hhh-iii"}
+    assert (
+        entity_registry.async_get_entity_id(
+            "binary_sensor", DOMAIN, "hk_citation_ggg-hhh-iii"
+        )
+        is None
+    )
+
+
+async def test_shared_ip_probed_once_for_its_owner(hass: HomeAssistant) -> None:
+    """Test that registry entries sharing an IP lead to one probe of its owner."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    kitchen = Speaker.from_dict(FAKE_SPEAKER)
+    # DHCP gave the hallway speaker's old address to the kitchen speaker.
+    hallway = Speaker("ggg-hhh-iii", "Hallway speaker", kitchen.ip, "")
+    moved = Speaker("jjj-kkk-lll", "Office speaker", "192.168.4.50", "")
+    coordinator._speakers = {s.uuid: s for s in (kitchen, hallway, moved)}
+    hosts = {kitchen.ip: "aaabbbccc", "192.168.4.50": None, "192.168.4.51": None}
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[]),
+        patch.object(coordinator, "_async_identify", side_effect=hosts.get),
+        patch.object(coordinator, "_probe_speaker", probe),
+    ):
+        data = await coordinator._async_update_data()
+        probe.assert_awaited_once_with(kitchen)
+        assert set(data["speakers"]) == {kitchen.uuid}
+        assert coordinator.ip_conflicts == 1
+
+        # The office speaker answers at an address the registry gave the
+        # hallway speaker, and is moved there.
+        hallway = replace(hallway, ip="192.168.4.51")
+        coordinator._speakers[hallway.uuid] = hallway
+        hosts["192.168.4.51"] = "jjjkkklll"
+        probe.reset_mock()
+        data = await coordinator._async_update_data()
+
+    assert coordinator.speakers[moved.uuid].ip == "192.168.4.51"
+    assert set(data["speakers"]) == {kitchen.uuid, moved.uuid}
+    assert probe.await_count == 2
+
+
+async def test_demoted_speaker_re_resolved_and_conflict_reported_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a demoted speaker is re-resolved and its conflict counted once."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    kitchen = Speaker.from_dict(FAKE_SPEAKER)
+    service = "Citation-One-ggghhhiii._googlecast._tcp.local."
+    hallway = Speaker("ggg-hhh-iii", "Hallway speaker", kitchen.ip, "", service)
+    swept = Speaker("jjj-kkk-lll", "Office speaker", kitchen.ip, "")
+    coordinator._speakers = {s.uuid: s for s in (kitchen, hallway, swept)}
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+        patch.object(coordinator, "_async_resolve", return_value=None) as resolve,
+    ):
+        await coordinator._async_update_data()
+        await hass.async_block_till_done()
+        await coordinator._async_update_data()
+        await hass.async_block_till_done()
+        assert coordinator.ip_conflicts == 1
+        # Only the speaker with a service name can be re-resolved.
+        assert resolve.await_args_list == [((hallway,),), ((hallway,),)]
+
+        resolve.return_value = "192.168.4.60"
+        await coordinator._async_update_data()
+        await hass.async_block_till_done()
+
+    assert coordinator.speakers[hallway.uuid].ip == "192.168.4.60"
+    assert coordinator.speakers[swept.uuid].ip == kitchen.ip
+
+
+async def test_unreachable_speaker_resolved_by_service_name(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a moved speaker is found by its service name in the same cycle."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_BROWSE_EVERY: 3}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    service = "Citation-One-aaabbbccc._googlecast._tcp.local."
+    found = {**FAKE_SPEAKER, "service": service}
+    hosts = {"192.168.4.30": "aaabbbccc"}
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[found]) as mdns,
+        patch(
+            f"{COORDINATOR}.zeroconf.async_get_async_instance",
+            return_value=sentinel.aiozc,
+        ),
+        patch(
+            f"{COORDINATOR}.async_mdns_resolve", return_value="192.168.4.77"
+        ) as resolve,
+        patch.object(coordinator, "_async_identify", side_effect=hosts.get),
+        patch.object(coordinator, "_probe_speaker", probe),
+    ):
+        await coordinator._async_update_data()
+        resolve.assert_not_called()
+
+        # DHCP moves the speaker; the next cycle does not browse.
+        hosts = {"192.168.4.77": "aaabbbccc"}
+        coordinator._async_identify.side_effect = hosts.get
+        data = await coordinator._async_update_data()
+
+    mdns.assert_called_once()
+    resolve.assert_awaited_once_with(sentinel.aiozc, service)
+    assert coordinator.speakers["aaa-bbb-ccc"].ip == "192.168.4.77"
+    assert data["speakers"]["aaa-bbb-ccc"].speaker.ip == "192.168.4.77"
+    assert probe.await_count == 2
+
+
+async def test_caller_after_cancellation_starts_new_run() -> None:
+    """Test that a run being cancelled is not joined by a new caller."""
+    flights = _SingleFlight()
+    started = asyncio.Event()
+    stopped = asyncio.Event()
+
+    async def _operation() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # Winds down for a while, like a probe closing its connections.
+            await asyncio.sleep(0.01)
+            stopped.set()
+            raise
+        return "done"
+
+    first = asyncio.create_task(flights.run("key", _operation))
+    await started.wait()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    async def _quick() -> str:
+        return "fresh"
+
+    assert await flights.run("key", _quick) == "fresh"
+    await stopped.wait()
+
+
+async def test_concurrent_requests_share_one_run(hass: HomeAssistant) -> None:
+    """Test that concurrent cycles and probes of a speaker run only once."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    speaker = Speaker.from_dict(FAKE_SPEAKER)
+    coordinator._speakers = {speaker.uuid: speaker}
+    release = asyncio.Event()
+
+    async def _probe(speaker: Speaker) -> SpeakerHealth:
+        await release.wait()
+        return HEALTHY_PROBE_RESULT
+
+    probe = AsyncMock(side_effect=_probe)
+    mdns = MagicMock(return_value=[FAKE_SPEAKER])
+    with (
+        patch(MDNS_SCAN, mdns),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+    ):
+        cycles = [
+            asyncio.create_task(coordinator._async_update_data()) for _ in range(2)
+        ]
+        while not probe.await_count:
+            await asyncio.sleep(0.01)
+        # An on-demand check while the cycle probes the speaker joins it.
+        on_demand = asyncio.create_task(coordinator._async_check_speaker(speaker))
+        await asyncio.sleep(0.01)
+        release.set()
+        first, second = await asyncio.gather(*cycles)
+        status = await on_demand
+
+    assert first is second
+    assert status == first["speakers"][speaker.uuid]
+    mdns.assert_called_once()
+    probe.assert_awaited_once()
+
+
+async def test_fresh_result_reused(hass: HomeAssistant) -> None:
+    """Test that a result within the freshness window is not probed again."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_PROBE_FRESHNESS: 60}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    speaker = Speaker.from_dict(FAKE_SPEAKER)
+    coordinator._speakers = {speaker.uuid: speaker}
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+    ):
+        response = await coordinator.async_probe_speakers({speaker.uuid})
+        data = await coordinator._async_update_data()
+
+    probe.assert_awaited_once()
+    assert response[speaker.uuid]["healthy"] is True
+    assert data["speakers"][speaker.uuid].health == HEALTHY_PROBE_RESULT
+
+
+async def test_freshness_of_a_scan_interval_not_reused_by_cycles(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a freshness window as long as the scan interval is ignored."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_PROBE_FRESHNESS: DEFAULT_SCAN_INTERVAL}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+    ):
+        await coordinator._async_update_data()
+        await coordinator._async_update_data()
+
+    assert probe.await_count == 2
+
+
+async def test_identify_caches_device_details(hass: HomeAssistant) -> None:
+    """Test that the identity check's eureka_info response fills the details."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    info = {
+        "name": "Kitchen speaker",
+        "device_info": {
+            "model_name": "HK Citation One",
+            "ssdp_udn": "AAA-BBB-CCC",
+            "uptime": 3600.0,
+            "mac_address": "AA:BB:CC:DD:EE:FF",
+        },
+        "build_info": {"cast_build_revision": "1.56.500000"},
+        "wifi": {"ssid": "home", "signal_level": -52},
+    }
+
+    with patch(f"{COORDINATOR}.async_fetch_eureka_info", return_value=info):
+        assert await coordinator._async_identify("192.168.4.30") == "aaabbbccc"
+
+    details = coordinator.details("aaa-bbb-ccc")
+    assert details.sw_version == "1.56.500000"
+    assert details.mac_address == "AA:BB:CC:DD:EE:FF"
+    assert details.signal_level == -52
+    assert time.time() - 3660 <= details.booted_at <= time.time() - 3600
+
+
+async def test_identify_accepts_other_model_name(hass: HomeAssistant) -> None:
+    """Test that a registry speaker is identified by its UUID alone."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    info = {"name": "Kitchen speaker", "device_info": {"ssdp_udn": "AAA-BBB-CCC"}}
+
+    with patch(f"{COORDINATOR}.async_fetch_eureka_info", return_value=info):
+        assert await coordinator._async_identify("192.168.4.30") == "aaabbbccc"
+
+
+async def test_low_risk_speaker_checked_every_other_cycle(
+    hass: HomeAssistant,
+) -> None:
+    """Test that risk scheduling leaves a healthy low-risk speaker every other cycle."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_RISK_SCHEDULING: True}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+        patch.object(coordinator, "_freeze_risk", return_value=FreezeRisk("low", 0.01)),
+    ):
+        for expected_probes in (1, 1, 2, 2):
+            coordinator.data = await coordinator._async_update_data()
+            assert probe.await_count == expected_probes
+            assert coordinator.data["speakers"]["aaa-bbb-ccc"].health.healthy
+
+
+async def test_high_risk_speaker_checked_between_cycles(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a high-risk speaker gets extra checks once they are due."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    probe = AsyncMock(return_value=HEALTHY_PROBE_RESULT)
+
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+        patch.object(coordinator, "_freeze_risk", return_value=FreezeRisk("high", 1.0)),
+    ):
+        coordinator.data = await coordinator._async_update_data()
+        await coordinator._async_check_high_risk()
+        probe.assert_awaited_once()
+
+        checked_at, status = coordinator._checked["aaa-bbb-ccc"]
+        interval = DEFAULT_SCAN_INTERVAL / RISK_PROBE_SPEEDUP
+        coordinator._checked["aaa-bbb-ccc"] = (checked_at - interval, status)
+        await coordinator._async_check_high_risk()
+
+    assert probe.await_count == 2
+    assert coordinator.data["speakers"]["aaa-bbb-ccc"].risk.level == "high"
+
+
+async def test_identify_timeout_adapts_to_response_time(hass: HomeAssistant) -> None:
+    """Test that identity checks time out after a few response times."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    fetch = AsyncMock(return_value={"name": "Kitchen speaker"})
+
+    with patch(f"{COORDINATOR}.async_fetch_eureka_info", fetch):
+        await coordinator._async_identify("192.168.4.30")
+        # Unknown hosts get the ceiling.
+        assert fetch.await_args.args[2] == 3.0
+        assert fetch.await_args.kwargs["connect_timeout"] == 3.0
+        await coordinator._async_identify("192.168.4.30")
+        # A fast host must connect within the floor, but may answer until
+        # just past the health threshold.
+        assert fetch.await_args.kwargs["connect_timeout"] == 0.5
+        assert fetch.await_args.args[2] == DEFAULT_THRESHOLD_MS / 1000 + 0.5
+
+        fetch.return_value = None
+        assert await coordinator._async_identify("192.168.4.30") is None
+
+    assert coordinator.timeouts.as_dict()["192.168.4.30"]["backoff"] == 1
+
+
+async def test_slow_speaker_reported_frozen_not_unavailable(
+    hass: HomeAssistant,
+) -> None:
+    """Test that a speaker answering slower than usual still gets probed."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    speaker = Speaker.from_dict(FAKE_SPEAKER)
+    coordinator._speakers = {speaker.uuid: speaker}
+    for _ in range(10):
+        coordinator.timeouts.record(speaker.ip, 0.002)
+    info = {
+        "name": "Kitchen speaker",
+        "device_info": {"model_name": "HK Citation One", "ssdp_udn": "aaa-bbb-ccc"},
+    }
+
+    async def _slow_fetch(
+        session: Any, ip: str, timeout: float, connect_timeout: float
+    ) -> Any:
+        # The frozen speaker now takes 1.2 s to answer eureka_info.
+        return info if timeout > 1.2 else None
+
+    frozen = replace(HEALTHY_PROBE_RESULT, healthy=False, response_time_ms=1200.0)
+    with (
+        patch(MDNS_SCAN, return_value=[]),
+        patch(f"{COORDINATOR}.async_fetch_eureka_info", _slow_fetch),
+        patch.object(coordinator, "_probe_speaker", return_value=frozen),
+    ):
+        data = await coordinator._async_update_data()
+
+    assert data["speakers"][speaker.uuid].health.healthy is False
+
+
+async def test_history_records_post_probes_only(hass: HomeAssistant) -> None:
+    """Test that the history keeps the POST probes' time, whatever the plan."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    https_only = SpeakerHealth(
+        healthy=True,
+        response_time_ms=900.0,
+        probes=(ProbeSample("https:8443/eureka_info", 900.0),),
+    )
+    failed = SpeakerHealth(
+        healthy=False,
+        response_time_ms=0.0,
+        probes=(
+            ProbeSample("get_app_device_id", 0.0, "connection reset"),
+            ProbeSample("reboot", 120.0),
+        ),
+    )
+    probe = AsyncMock(side_effect=[HEALTHY_PROBE_RESULT, https_only, failed])
+
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", probe),
+    ):
+        for _ in range(3):
+            await coordinator._async_update_data()
+
+    samples = coordinator.history.samples("aaa-bbb-ccc")
+    assert [sample["ms"] for sample in samples] == [150.0, 120.0]
+
+
+async def test_history_write_error_does_not_fail_cycle(hass: HomeAssistant) -> None:
+    """Test that a full disk loses history writes, not the health cycle."""
+    entry = _make_entry(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+
+    with (
+        patch(MDNS_SCAN, return_value=[FAKE_SPEAKER]),
+        patch.object(coordinator, "_async_identify", return_value="aaabbbccc"),
+        patch.object(coordinator, "_probe_speaker", return_value=HEALTHY_PROBE_RESULT),
+        patch.object(
+            coordinator.history, "append", side_effect=OSError("No space left")
+        ),
+    ):
+        data = await coordinator._async_update_data()
+
+    assert data["speakers"]["aaa-bbb-ccc"].health.healthy
+
+
+async def test_high_risk_checks_share_probe_concurrency(
+    hass: HomeAssistant,
+) -> None:
+    """Test that extra high-risk checks respect the probe concurrency."""
+    entry = _make_entry(hass)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_PROBE_CONCURRENCY: 2}
+    )
+    coordinator = HKCitationCoordinator(hass, entry)
+    risk = FreezeRisk("high", 1.0)
+    speakers = [
+        Speaker(f"uuid-{n}", f"Speaker {n}", f"192.168.4.{n}", "") for n in range(6)
+    ]
+    coordinator.data = {
+        "speakers": {
+            s.uuid: SpeakerStatus(s, HEALTHY_PROBE_RESULT, risk=risk) for s in speakers
+        }
+    }
+    running = peak = 0
+
+    async def _check(speaker: Speaker) -> SpeakerStatus:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return SpeakerStatus(speaker, HEALTHY_PROBE_RESULT, risk=risk)
+
+    with patch.object(coordinator, "_async_check_speaker", side_effect=_check):
+        await coordinator._async_check_high_risk()
+
+    assert peak == 2
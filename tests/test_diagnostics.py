@@ -0,0 +1,71 @@
+"""Tests for HK Citation diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+from pytest_homeassistant_custom_component.typing import ClientSessionGenerator
+
+from custom_components.hk_citation.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_THRESHOLD_MS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD_MS,
+    DOMAIN,
+)
+from custom_components.hk_citation.models import (
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+
+KITCHEN = Speaker(
+    uuid="uuid-kitchen",
+    name="Kitchen speaker",
+    ip="192.168.4.30",
+    model="HK Citation One",
+)
+FROZEN = SpeakerHealth(
+    healthy=False,
+    response_time_ms=3000.0,
+    probes=(ProbeSample("reboot", 3000.0),),
+)
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test that diagnostics include speaker data and probe-plan statistics."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+        unique_id=DOMAIN,
+    )
+    entry.add_to_hass(hass)
+    data = {"speakers": {KITCHEN.uuid: SpeakerStatus(KITCHEN, FROZEN)}}
+    with patch(
+        "custom_components.hk_citation.coordinator.HKCitationCoordinator._async_update_data",
+        return_value=data,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    entry.runtime_data.planner.record(KITCHEN.uuid, FROZEN, DEFAULT_THRESHOLD_MS)
+
+    diagnostics = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+
+    assert diagnostics["speakers"][KITCHEN.uuid]["healthy"] is False
+    plan = diagnostics["probe_plan"]
+    assert plan["fleet"]["first_detections"] == {"reboot": 1}
+    assert plan["speakers"][KITCHEN.uuid]["cost_ms"] == {"reboot": 3000.0}
+    assert diagnostics["cycle"]["overruns"] == 0
+    assert diagnostics["cycle"]["budget_seconds"] == 120
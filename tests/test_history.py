@@ -0,0 +1,110 @@
+"""Tests for the HK Citation latency history."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hk_citation.const import DOMAIN
+from custom_components.hk_citation.history import (
+    COMPACT_MIN_RECORDS,
+    COMPACT_RATIO,
+    LatencyHistory,
+)
+from custom_components.hk_citation.models import LatencyBucket
+
+UUID = "uuid-kitchen"
+# Start of the current hour, so loading keeps everything.
+HOUR = time.time() // 3600 * 3600
+
+
+def test_minute_rollup() -> None:
+    """Test that moving past a minute closes its bucket."""
+    history = LatencyHistory("unused")
+    for offset, ms in ((0, 40.0), (10, 20.0), (20, 30.0), (59, 1000.0)):
+        history.add(UUID, HOUR + offset, ms)
+    assert history.buckets(UUID, "minute") == []
+
+    history.add(UUID, HOUR + 65, 25.0)
+    assert history.buckets(UUID, "minute") == [
+        LatencyBucket(start=HOUR, count=4, min=20.0, mean=272.5, p95=1000.0, max=1000.0)
+    ]
+    assert history.buckets(UUID, "hour") == []
+    assert len(history.samples(UUID)) == 5
+
+
+def test_hour_rollup_and_raw_retention() -> None:
+    """Test hourly buckets and that raw samples only cover a short window."""
+    history = LatencyHistory("unused")
+    for step in range(12 * 3):
+        history.add(UUID, HOUR + step * 300, 40.0 + step)
+
+    hours = history.buckets(UUID, "hour")
+    assert [bucket.start for bucket in hours] == [HOUR, HOUR + 3600]
+    assert hours[0].count == 12
+    assert hours[0].min == 40.0
+    assert hours[0].max == 51.0
+    assert len(history.buckets(UUID, "minute")) == 35
+    # Raw samples older than two hours are dropped.
+    assert history.samples(UUID)[0]["time"] >= HOUR + 35 * 300 - 2 * 3600
+
+
+def test_incremental_save_and_load(tmp_path: Path) -> None:
+    """Test that saves only append new records and that loading restores them."""
+    path = tmp_path / "history.jsonl"
+    history = LatencyHistory(path)
+    history.add(UUID, HOUR, 40.0)
+    history.add(UUID, HOUR + 30, 60.0)
+    history.append(history.drain())
+    history.add(UUID, HOUR + 90, 50.0)
+    new_lines = history.drain()
+    assert len(new_lines) == 2  # the sample and the closed minute
+    history.append(new_lines)
+    # A line cut short by a crash is skipped on load.
+    with path.open("a") as log:
+        log.write('["s", "uuid-kit')
+
+    restored = LatencyHistory(path)
+    restored.load()
+
+    assert restored.samples(UUID) == history.samples(UUID)
+    assert restored.buckets(UUID, "minute") == history.buckets(UUID, "minute")
+    assert len(path.read_text().splitlines()) == 4
+    # Closing the open minute after a restart does not duplicate buckets.
+    restored.add(UUID, HOUR + 150, 45.0)
+    assert [b.start for b in restored.buckets(UUID, "minute")] == [HOUR, HOUR + 60]
+
+
+def test_compaction_due(tmp_path: Path) -> None:
+    """Test that the log is due for compaction once it outgrows the data."""
+    history = LatencyHistory(tmp_path / "history.jsonl")
+    history.add(UUID, HOUR, 40.0)
+    history.append(history.drain())
+    assert not history.needs_compaction
+
+    history.append(["[]"] * COMPACT_RATIO * COMPACT_MIN_RECORDS)
+    assert history.needs_compaction
+    history.rewrite(history.snapshot())
+    assert not history.needs_compaction
+    assert len((tmp_path / "history.jsonl").read_text().splitlines()) == 1
+
+
+async def test_history_survives_reload(hass: HomeAssistant, history_file: Path) -> None:
+    """Test that the integration saves history on unload and loads it on setup."""
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={}, unique_id=DOMAIN)
+    entry.add_to_hass(hass)
+    update = "custom_components.hk_citation.coordinator.HKCitationCoordinator._async_update_data"
+    with patch(update, return_value={"speakers": {}}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        entry.runtime_data.history.add(UUID, HOUR, 40.0)
+        await hass.config_entries.async_unload(entry.entry_id)
+        assert history_file.exists()
+
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    assert entry.runtime_data.history.samples(UUID) == [{"time": HOUR, "ms": 40.0}]
@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
+import pytest
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
-
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.hk_citation.const import (
     CONF_SCAN_INTERVAL,
+    CONF_SUBNETS,
     CONF_THRESHOLD_MS,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_THRESHOLD_MS,
     DOMAIN,
 )
+from custom_components.hk_citation.coordinator import RISK_STORAGE_KEY, STORAGE_KEY
 
 MOCK_DATA = {"speakers": {}}
 
@@ -55,3 +65,54 @@ async def test_unload_entry(hass: HomeAssistant) -> None:
         await hass.async_block_till_done()
     assert result is True
     assert entry.state is ConfigEntryState.NOT_LOADED
+
+
+async def test_remove_entry_deletes_its_storage(
+    hass: HomeAssistant, hass_storage: dict[str, Any], history_file: Path
+) -> None:
+    """Test that removing a segment entry deletes its registry and history."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SUBNETS: "10.0.4.0/22"},
+        options={},
+        unique_id="|10.0.4.0/22",
+    )
+    entry.add_to_hass(hass)
+    key = f"{STORAGE_KEY}.{entry.entry_id}"
+    hass_storage[key] = {"version": 2, "key": key, "data": {"speakers": []}}
+    history = history_file.with_name(f"hk_citation.history.{entry.entry_id}.jsonl")
+    history.write_text("")
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in hass_storage
+    assert not history.exists()
+
+
+async def test_unload_flushes_freeze_risk(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that the freeze risk model is saved on unload, not after removal."""
+    entry = await _setup_entry(hass)
+    coordinator = entry.runtime_data
+    coordinator.risk.observe("uuid-kitchen", "HK Citation One", 0.0, True, 10.0)
+    coordinator.risk.observe("uuid-kitchen", "HK Citation One", 0.0, False, 20.0)
+    coordinator._risk_store.async_delay_save(coordinator.risk.as_dict, 60)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert sum(hass_storage[RISK_STORAGE_KEY]["data"]["fleet"]["freezes"]) == 1
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=61))
+    await hass.async_block_till_done()
+    assert RISK_STORAGE_KEY not in hass_storage
+
+
+async def test_yaml_config_rejected(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that YAML configuration is reported as unsupported."""
+    assert await async_setup_component(hass, DOMAIN, {DOMAIN: {"scan_interval": 60}})
+    assert "does not support YAML setup" in caplog.text
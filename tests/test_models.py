@@ -0,0 +1,163 @@
+"""Tests for the HK Citation data model."""
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hk_citation.const import DOMAIN
+from custom_components.hk_citation.coordinator import (
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    HKCitationCoordinator,
+)
+from custom_components.hk_citation.models import (
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+
+SPEAKER_DICT = {
+    "uuid": "aaa-bbb-ccc",
+    "name": "Kitchen speaker",
+    "ip": "192.168.4.30",
+    "model": "HK Citation One",
+}
+
+
+def test_speaker_round_trip() -> None:
+    """Test that a speaker survives serialization to the storage format."""
+    speaker = Speaker.from_dict(SPEAKER_DICT)
+    assert speaker.as_dict() == SPEAKER_DICT
+    assert Speaker.from_dict(speaker.as_dict()) == speaker
+
+
+def test_models_are_slotted() -> None:
+    """Test that model instances carry no per-instance __dict__."""
+    sample = ProbeSample("reboot", 50.0)
+    health = SpeakerHealth(True, 50.0, (sample,))
+    status = SpeakerStatus(Speaker.from_dict(SPEAKER_DICT), health)
+    for obj in (sample, health, status, status.speaker):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_status_as_dict_matches_legacy_layout() -> None:
+    """Test that a status flattens to the old merged-dict layout."""
+    health = SpeakerHealth(
+        healthy=False,
+        response_time_ms=3000.0,
+        probes=(ProbeSample("https:8443/eureka_info", 3000.0, "frozen"),),
+        error="frozen",
+    )
+    status = SpeakerStatus(Speaker.from_dict(SPEAKER_DICT), health)
+    assert status.as_dict() == {
+        **SPEAKER_DICT,
+        "healthy": False,
+        "response_time_ms": 3000.0,
+        "probes": [
+            {"endpoint": "https:8443/eureka_info", "ms": 3000.0, "error": "frozen"}
+        ],
+        "error": "frozen",
+    }
+
+
+def _legacy_cycle(registry: dict[str, dict[str, str]]) -> list[dict[str, Any]]:
+    """Build one cycle of results the way the dict-based coordinator did."""
+    return [
+        {
+            **speaker,
+            "healthy": True,
+            "response_time_ms": 50.0,
+            "probes": [
+                {"endpoint": "get_app_device_id", "ms": 45.0, "error": ""},
+                {"endpoint": "reboot", "ms": 50.0, "error": ""},
+                {"endpoint": "https:8443/eureka_info", "ms": 30.0, "error": ""},
+            ],
+            "error": "",
+        }
+        for speaker in registry.values()
+    ]
+
+
+def _typed_cycle(registry: dict[str, Speaker]) -> list[SpeakerStatus]:
+    """Build one cycle of results with the typed model."""
+    return [
+        SpeakerStatus(
+            speaker,
+            SpeakerHealth(
+                healthy=True,
+                response_time_ms=50.0,
+                probes=(
+                    ProbeSample("get_app_device_id", 45.0),
+                    ProbeSample("reboot", 50.0),
+                    ProbeSample("https:8443/eureka_info", 30.0),
+                ),
+            ),
+        )
+        for speaker in registry.values()
+    ]
+
+
+def _allocated(func, *args) -> int:
+    """Return the bytes still allocated by the result of func(*args)."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = func(*args)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    assert result
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def test_benchmark_cycle_allocations() -> None:
+    """Benchmark: a typed cycle allocates less than the dict-based one."""
+    count = 500
+    legacy_registry = {
+        f"uuid-{i}": {
+            **SPEAKER_DICT,
+            "uuid": f"uuid-{i}",
+            "ip": f"10.0.{i // 256}.{i % 256}",
+        }
+        for i in range(count)
+    }
+    typed_registry = {
+        uuid: Speaker.from_dict(speaker) for uuid, speaker in legacy_registry.items()
+    }
+
+    legacy_bytes = _allocated(_legacy_cycle, legacy_registry)
+    typed_bytes = _allocated(_typed_cycle, typed_registry)
+
+    # Per-speaker results must shrink by at least a third.
+    assert typed_bytes < legacy_bytes * 2 / 3, (typed_bytes, legacy_bytes)
+
+
+async def test_migrate_v1_storage(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that a version 1 registry is migrated on load."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "aaa-bbb-ccc": dict(SPEAKER_DICT),
+            "broken": {"name": "No IP"},
+        },
+    }
+    entry = MockConfigEntry(domain=DOMAIN, data={}, options={})
+    entry.add_to_hass(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+
+    await coordinator.async_load_speakers()
+
+    assert coordinator._speakers == {"aaa-bbb-ccc": Speaker.from_dict(SPEAKER_DICT)}
+
+    await coordinator._save_speakers()
+    assert hass_storage[STORAGE_KEY]["version"] == STORAGE_VERSION
+    assert hass_storage[STORAGE_KEY]["data"] == {"speakers": [SPEAKER_DICT]}
@@ -0,0 +1,118 @@
+"""Tests for the HK Citation probe-plan optimizer."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from custom_components.hk_citation import probe
+from custom_components.hk_citation.const import DEFAULT_THRESHOLD_MS
+from custom_components.hk_citation.models import ProbeSample
+from custom_components.hk_citation.planner import FULL_PLAN_EVERY, ProbePlanner
+from custom_components.hk_citation.probe import (
+    HTTPS_PROBE_NAME,
+    PROBE_NAMES,
+    async_probe_speaker,
+    evaluate_health,
+)
+
+APP_ID = "get_app_device_id"
+REBOOT = "reboot"
+
+
+def _health(**ms: float) -> Any:
+    """Return a health result with the given probe durations or failures."""
+    samples = []
+    for name in PROBE_NAMES:
+        key = "https" if name == HTTPS_PROBE_NAME else name
+        if key in ms:
+            value = ms[key]
+            error = "frozen (port 8443 timeout)" if value < 0 else ""
+            samples.append(ProbeSample(name, abs(value), error))
+    return evaluate_health(samples, DEFAULT_THRESHOLD_MS)
+
+
+def test_full_plan_without_history() -> None:
+    """Test that every probe runs until a freeze has been recorded."""
+    planner = ProbePlanner()
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    assert planner.plan("a") == PROBE_NAMES
+
+
+def test_routine_plan_covers_recorded_freezes() -> None:
+    """Test that healthy cycles run only the probes that caught freezes."""
+    planner = ProbePlanner()
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    # Frozen: only the HTTPS probe failed.
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=-3000), 1000)
+    # While frozen, the full set runs, covering probe first.
+    assert planner.plan("a")[0] == HTTPS_PROBE_NAME
+    assert set(planner.plan("a")) == set(PROBE_NAMES)
+
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    for _ in range(FULL_PLAN_EVERY - 1):
+        planner.start_cycle()
+        assert planner.plan("a") == (HTTPS_PROBE_NAME,)
+        planner.record("a", _health(https=50), 1000)
+        # An on-demand probe in the same cycle does not count as a cycle.
+        planner.record("a", _health(https=50), 1000)
+    # Periodic full run.
+    assert set(planner.plan("a")) == set(PROBE_NAMES)
+
+
+def test_cover_prefers_cheap_probe() -> None:
+    """Test that of two probes catching the same freezes, the cheaper runs."""
+    planner = ProbePlanner()
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    planner.record("a", _health(get_app_device_id=30, reboot=4000, https=-3000), 1000)
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    # reboot averages well above the HTTPS probe's cost.
+    assert planner.plan("a") == (HTTPS_PROBE_NAME,)
+
+    stats = planner.as_dict()
+    assert stats["fleet"]["freezes"] == 1
+    assert stats["speakers"]["a"]["first_detections"] == {REBOOT: 1}
+
+
+def test_new_speaker_uses_fleet_history() -> None:
+    """Test that a speaker without freezes of its own plans from the fleet's."""
+    planner = ProbePlanner()
+    planner.record("a", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    planner.record("a", _health(get_app_device_id=30, reboot=2500, https=50), 1000)
+    planner.record("b", _health(get_app_device_id=30, reboot=40, https=50), 1000)
+    assert planner.plan("b") == (REBOOT,)
+
+
+async def test_partial_plan_escalates_on_failure() -> None:
+    """Test that a failing probe in a partial plan runs the rest of the set."""
+    calls: list[str] = []
+
+    def _fake(name: str, ms: float, error: str = "") -> Any:
+        async def _probe(
+            session: Any, ip: str, connect_timeout: float | None
+        ) -> ProbeSample:
+            calls.append(name)
+            return ProbeSample(name, ms, error)
+
+        return _probe
+
+    fakes = {
+        APP_ID: _fake(APP_ID, 30),
+        REBOOT: _fake(REBOOT, 40),
+        HTTPS_PROBE_NAME: _fake(HTTPS_PROBE_NAME, 3000, "frozen (port 8443 timeout)"),
+    }
+    with patch.dict(probe._PROBES, fakes):
+        health = await async_probe_speaker(
+            None, "10.0.0.1", 1000, plan=(HTTPS_PROBE_NAME,)
+        )
+    assert calls == [HTTPS_PROBE_NAME, APP_ID, REBOOT]
+    assert not health.healthy
+
+    calls.clear()
+    fakes[HTTPS_PROBE_NAME] = _fake(HTTPS_PROBE_NAME, 50)
+    with patch.dict(probe._PROBES, fakes):
+        health = await async_probe_speaker(
+            None, "10.0.0.1", 1000, plan=(HTTPS_PROBE_NAME,)
+        )
+    assert calls == [HTTPS_PROBE_NAME]
+    assert health.healthy
@@ -0,0 +1,182 @@
+"""Tests for HK Citation automatic remediation."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_mock_service,
+)
+
+from custom_components.hk_citation.const import (
+    CONF_REMEDIATION_MAX_ATTEMPTS,
+    CONF_REMEDIATION_OFF_TIME,
+    CONF_REMEDIATION_SWITCHES,
+    CONF_SCAN_INTERVAL,
+    CONF_THRESHOLD_MS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD_MS,
+    DOMAIN,
+    EVENT_REMEDIATION,
+)
+from custom_components.hk_citation.models import (
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+
+KITCHEN = Speaker(
+    uuid="uuid-kitchen",
+    name="Kitchen speaker",
+    ip="192.168.4.30",
+    model="HK Citation One",
+)
+FROZEN = SpeakerHealth(
+    healthy=False,
+    response_time_ms=3106.0,
+    probes=(ProbeSample("reboot", 3106.0),),
+)
+HEALTHY = SpeakerHealth(
+    healthy=True,
+    response_time_ms=40.0,
+    probes=(ProbeSample("reboot", 40.0),),
+)
+SWITCH = "switch.kitchen_plug"
+COORDINATOR = "custom_components.hk_citation.coordinator.HKCitationCoordinator"
+REMEDIATION = "custom_components.hk_citation.remediation"
+
+
+async def _setup_integration(
+    hass: HomeAssistant,
+    check: AsyncMock,
+    max_attempts: int = 3,
+    data: dict[str, Any] | None = None,
+) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+            CONF_REMEDIATION_SWITCHES: {KITCHEN.uuid: SWITCH},
+            CONF_REMEDIATION_OFF_TIME: 0,
+            CONF_REMEDIATION_MAX_ATTEMPTS: max_attempts,
+        },
+        unique_id=DOMAIN,
+    )
+    entry.add_to_hass(hass)
+    if data is None:
+        data = {"speakers": {KITCHEN.uuid: SpeakerStatus(KITCHEN, FROZEN)}}
+    with (
+        patch(f"{COORDINATOR}._async_update_data", return_value=data),
+        patch(f"{COORDINATOR}._async_check_speaker", check),
+        patch(f"{REMEDIATION}.CONFIRM_DELAY", 0),
+        patch(f"{REMEDIATION}.REPROBE_INTERVAL", 0),
+        patch(f"{REMEDIATION}.RETRY_BACKOFF", 0),
+        patch(f"{REMEDIATION}.RECOVERY_TIMEOUT", 0.05),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    return entry
+
+
+async def test_frozen_speaker_is_power_cycled(hass: HomeAssistant) -> None:
+    """Test that a frozen speaker is power-cycled and re-probed until healthy."""
+    turn_off = async_mock_service(hass, "switch", "turn_off")
+    turn_on = async_mock_service(hass, "switch", "turn_on")
+    events = async_capture_events(hass, EVENT_REMEDIATION)
+    check = AsyncMock(
+        side_effect=[
+            SpeakerStatus(KITCHEN, FROZEN),
+            None,
+            SpeakerStatus(KITCHEN, HEALTHY),
+        ],
+    )
+
+    await _setup_integration(hass, check)
+
+    assert [call.data["entity_id"] for call in turn_off] == [SWITCH]
+    assert [call.data["entity_id"] for call in turn_on] == [SWITCH]
+    assert len(events) == 1
+    event = events[0].data
+    assert event["uuid"] == KITCHEN.uuid
+    assert event["switch"] == SWITCH
+    assert event["outcome"] == "recovered"
+    assert event["attempt"] == 1
+    assert event["reprobes"] == 2
+    assert event["time_to_recover"] is not None
+    assert hass.states.get("binary_sensor.kitchen_speaker_health").state == STATE_ON
+
+
+async def test_unconfirmed_freeze_not_power_cycled(hass: HomeAssistant) -> None:
+    """Test that a speaker healthy again on the confirming probe keeps power."""
+    turn_off = async_mock_service(hass, "switch", "turn_off")
+    async_mock_service(hass, "switch", "turn_on")
+    check = AsyncMock(return_value=SpeakerStatus(KITCHEN, HEALTHY))
+
+    await _setup_integration(hass, check)
+
+    check.assert_awaited_once()
+    assert not turn_off
+
+
+async def test_unreachable_after_freeze_is_power_cycled(hass: HomeAssistant) -> None:
+    """Test that a speaker that stopped answering after a freeze is power-cycled."""
+    turn_off = async_mock_service(hass, "switch", "turn_off")
+    async_mock_service(hass, "switch", "turn_on")
+    check = AsyncMock(return_value=None)
+    entry = await _setup_integration(hass, check, max_attempts=1, data={"speakers": {}})
+    coordinator = entry.runtime_data
+    coordinator._speakers = {KITCHEN.uuid: KITCHEN}
+    assert not turn_off
+
+    # A frozen check, then the hung speaker no longer answers on port 8008.
+    with (
+        patch(f"{COORDINATOR}._async_check_speaker", check),
+        patch(f"{REMEDIATION}.CONFIRM_DELAY", 0),
+        patch(f"{REMEDIATION}.REPROBE_INTERVAL", 0),
+        patch(f"{REMEDIATION}.RECOVERY_TIMEOUT", 0),
+    ):
+        coordinator._remediation._last_unhealthy[KITCHEN.uuid] = time.monotonic()
+        coordinator.async_set_updated_data({"speakers": {}})
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert [call.data["entity_id"] for call in turn_off] == [SWITCH]
+
+
+async def test_remediation_retries_then_gives_up(hass: HomeAssistant) -> None:
+    """Test that failed attempts are retried, then remediation stops."""
+    turn_off = async_mock_service(hass, "switch", "turn_off")
+    async_mock_service(hass, "switch", "turn_on")
+    events = async_capture_events(hass, EVENT_REMEDIATION)
+    check = AsyncMock(return_value=SpeakerStatus(KITCHEN, FROZEN))
+
+    entry = await _setup_integration(hass, check, max_attempts=2)
+
+    assert len(turn_off) == 2
+    assert [event.data["outcome"] for event in events] == ["retrying", "failed"]
+    assert events[-1].data["time_to_recover"] is None
+
+    # Still frozen, but within the cooldown: no new power cycle.
+    entry.runtime_data.async_update_listeners()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(turn_off) == 2
+
+
+async def test_switch_failure_stops_remediation(hass: HomeAssistant) -> None:
+    """Test that a missing switch service fires a switch_error event."""
+    events = async_capture_events(hass, EVENT_REMEDIATION)
+    check = AsyncMock(return_value=None)
+
+    await _setup_integration(hass, check)
+
+    assert [event.data["outcome"] for event in events] == ["switch_error"]
+    # Only the probe confirming the freeze ran.
+    check.assert_awaited_once()
@@ -0,0 +1,65 @@
+"""Tests for the HK Citation freeze risk model."""
+
+from __future__ import annotations
+
+from custom_components.hk_citation.risk import FreezeRiskModel
+
+HOUR = 3600.0
+MODEL = "HK Citation One"
+
+
+def _freeze_at(model: FreezeRiskModel, uuid: str, hours: float) -> None:
+    """Observe a speaker booted at 0 healthy every half hour until it freezes."""
+    steps = int(hours * 2)
+    for step in range(steps):
+        model.observe(uuid, MODEL, 0.0, True, step * HOUR / 2)
+    assert model.observe(uuid, MODEL, 0.0, False, steps * HOUR / 2)
+
+
+def test_no_assessment_without_freezes() -> None:
+    """Test that speakers are not rated before the fleet has frozen enough."""
+    model = FreezeRiskModel()
+    _freeze_at(model, "a", 200)
+    _freeze_at(model, "b", 200)
+    assert model.assess("a", MODEL, 0.0, 190 * HOUR) is None
+    # Staying frozen is not another freeze.
+    assert not model.observe("a", MODEL, 0.0, False, 201 * HOUR)
+
+
+def test_risk_follows_uptime_of_freezes() -> None:
+    """Test that the uptime window the fleet froze in is high risk."""
+    model = FreezeRiskModel()
+    for uuid in ("a", "b", "c"):
+        _freeze_at(model, uuid, 200)
+
+    high = model.assess("a", MODEL, 0.0, 190 * HOUR)
+    assert high.level == "high"
+    assert high.reboot_recommended is True
+    # A speaker of the model without history falls back to the model's rates.
+    assert model.assess("d", MODEL, 0.0, 190 * HOUR).level == "high"
+
+    low = model.assess("a", MODEL, 0.0, 36 * HOUR)
+    assert low.level == "low"
+    assert low.reboot_recommended is False
+    assert low.freezes_per_day < high.freezes_per_day
+
+
+def test_counts_round_trip() -> None:
+    """Test that saved counts restore the same assessment."""
+    model = FreezeRiskModel()
+    for uuid in ("a", "b", "c"):
+        _freeze_at(model, uuid, 200)
+
+    restored = FreezeRiskModel()
+    restored.load(model.as_dict())
+    assert restored.assess("a", MODEL, 0.0, 190 * HOUR) == model.assess(
+        "a", MODEL, 0.0, 190 * HOUR
+    )
+
+    # Counts saved with other uptime windows are dropped.
+    data = model.as_dict()
+    data["fleet"]["freezes"] = [3]
+    restored.load(data)
+    assert restored.as_dict()["fleet"]["freezes"] == [0] * len(
+        model.as_dict()["fleet"]["freezes"]
+    )
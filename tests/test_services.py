@@ -0,0 +1,227 @@
+"""Tests for HK Citation services."""
+
+from __future__ import annotations
+
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hk_citation.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_THRESHOLD_MS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD_MS,
+    DOMAIN,
+    SERVICE_PROBE,
+    SERVICE_PROFILE,
+)
+from custom_components.hk_citation.coordinator import STORAGE_KEY, STORAGE_VERSION
+from custom_components.hk_citation.models import (
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+
+KITCHEN = Speaker(
+    uuid="uuid-kitchen",
+    name="Kitchen speaker",
+    ip="192.168.4.30",
+    model="HK Citation One",
+)
+HALLWAY = Speaker(
+    uuid="uuid-hallway",
+    name="Hallway speaker",
+    ip="192.168.4.33",
+    model="HK Citation One",
+)
+FROZEN = SpeakerHealth(
+    healthy=False,
+    response_time_ms=3106.0,
+    probes=(ProbeSample("reboot", 3106.0),),
+)
+HEALTHY = SpeakerHealth(
+    healthy=True,
+    response_time_ms=40.0,
+    probes=(ProbeSample("reboot", 40.0),),
+)
+COORDINATOR = "custom_components.hk_citation.coordinator.HKCitationCoordinator"
+
+
+async def _setup_integration(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> MockConfigEntry:
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {"speakers": [KITCHEN.as_dict(), HALLWAY.as_dict()]},
+    }
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+        unique_id=DOMAIN,
+    )
+    entry.add_to_hass(hass)
+    data = {
+        "speakers": {
+            KITCHEN.uuid: SpeakerStatus(KITCHEN, FROZEN),
+            HALLWAY.uuid: SpeakerStatus(HALLWAY, FROZEN),
+        }
+    }
+    with patch(f"{COORDINATOR}._async_update_data", return_value=data):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def test_probe_entity_returns_results(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that the probe service probes only the target and merges the result."""
+    await _setup_integration(hass, hass_storage)
+    probe = AsyncMock(return_value=HEALTHY)
+
+    with (
+        patch(f"{COORDINATOR}._async_identify", return_value="uuidkitchen"),
+        patch(f"{COORDINATOR}._probe_speaker", probe),
+        patch(f"{COORDINATOR}._discover_speakers") as discover,
+    ):
+        response = await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROBE,
+            target={"entity_id": "binary_sensor.kitchen_speaker_health"},
+            blocking=True,
+            return_response=True,
+        )
+
+    discover.assert_not_called()
+    probe.assert_awaited_once_with(KITCHEN)
+    result = response["speakers"][KITCHEN.uuid]
+    assert result["healthy"] is True
+    assert result["reachable"] is True
+    assert result["rate_limited"] is False
+    assert hass.states.get("binary_sensor.kitchen_speaker_health").state == STATE_ON
+    assert hass.states.get("binary_sensor.hallway_speaker_health").state != STATE_ON
+
+
+async def test_probe_device_is_rate_limited(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test that a second probe within the cooldown returns the latest result."""
+    await _setup_integration(hass, hass_storage)
+    device = device_registry.async_get_device(identifiers={(DOMAIN, HALLWAY.uuid)})
+    probe = AsyncMock(return_value=HEALTHY)
+
+    with (
+        patch(f"{COORDINATOR}._async_identify", return_value="uuidhallway"),
+        patch(f"{COORDINATOR}._probe_speaker", probe),
+    ):
+        for _ in range(2):
+            response = await hass.services.async_call(
+                DOMAIN,
+                SERVICE_PROBE,
+                target={"device_id": device.id},
+                blocking=True,
+                return_response=True,
+            )
+
+    probe.assert_awaited_once_with(HALLWAY)
+    result = response["speakers"][HALLWAY.uuid]
+    assert result["rate_limited"] is True
+    assert result["healthy"] is True
+
+
+async def test_probe_unknown_target(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test that targeting nothing we know raises a validation error."""
+    await _setup_integration(hass, hass_storage)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROBE,
+            target={"entity_id": "binary_sensor.not_a_speaker"},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_profile_next_cycles(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test that the profile service profiles the requested cycles only."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _setup_integration(hass, hass_storage)
+    coordinator = entry.runtime_data
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_PROFILE, {"cycles": 2}, blocking=True, return_response=True
+    )
+    files = response["entries"][entry.entry_id]
+    assert files["profile"].startswith(str(tmp_path))
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(DOMAIN, SERVICE_PROFILE, blocking=True)
+
+    cycle = AsyncMock(return_value=coordinator.data)
+    with patch(f"{COORDINATOR}._async_cycle", cycle):
+        await coordinator.async_refresh()
+        assert not Path(files["profile"]).exists()
+        await coordinator.async_refresh()
+        await coordinator.async_refresh()
+
+    assert cycle.await_count == 3
+    assert coordinator.profiler is None
+    assert pstats.Stats(files["profile"]).total_calls > 0
+    assert Path(files["allocations"]).read_text().startswith("Allocation growth")
+
+
+async def test_unload_cancels_profile(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test that unloading mid-profile stops tracemalloc and writes nothing."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _setup_integration(hass, hass_storage)
+    coordinator = entry.runtime_data
+    profiler = coordinator.async_start_profiling(2)
+    profiler.start_cycle()
+    assert tracemalloc.is_tracing()
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+    assert coordinator.profiler is None
+    assert not tracemalloc.is_tracing()
+    assert profiler.stop_cycle() is False
+    assert not Path(profiler.profile_path).exists()
+
+
+async def test_profile_write_error_does_not_fail_cycle(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: Path
+) -> None:
+    """Test that a profile that cannot be written is logged, not raised."""
+    hass.config.config_dir = str(tmp_path / "missing")
+    entry = await _setup_integration(hass, hass_storage)
+    coordinator = entry.runtime_data
+    coordinator.async_start_profiling(1)
+
+    with patch(f"{COORDINATOR}._async_cycle", AsyncMock(return_value=coordinator.data)):
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert coordinator.profiler is None
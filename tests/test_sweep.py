@@ -0,0 +1,210 @@
+"""Tests for HK Citation subnet sweep discovery."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hk_citation.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_SWEEP_SUBNETS,
+    CONF_THRESHOLD_MS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD_MS,
+    DOMAIN,
+)
+from custom_components.hk_citation.coordinator import HKCitationCoordinator
+from custom_components.hk_citation.discovery import (
+    async_fetch_eureka_info,
+    parse_eureka_identity,
+)
+from custom_components.hk_citation.sweep import SubnetSweeper, parse_subnets
+
+EUREKA_CITATION = {
+    "name": "Office speaker",
+    "device_info": {
+        "model_name": "HK Citation 300",
+        "ssdp_udn": "1A2B3C4D-0000-1111-2222-333344445555",
+    },
+}
+
+
+def _sweeper(subnets: str, hosts_per_cycle: int) -> SubnetSweeper:
+    return SubnetSweeper(
+        MagicMock(),
+        parse_subnets(subnets),
+        concurrency=4,
+        rate=10000,
+        hosts_per_cycle=hosts_per_cycle,
+    )
+
+
+def test_parse_subnets() -> None:
+    """Test parsing of comma-separated CIDR ranges."""
+    assert [str(n) for n in parse_subnets(" 10.0.4.0/22, 192.168.1.7/30 ,")] == [
+        "10.0.4.0/22",
+        "192.168.1.4/30",
+    ]
+    assert parse_subnets("") == []
+    with pytest.raises(ValueError):
+        parse_subnets("10.0.0.0/33")
+    with pytest.raises(ValueError):
+        parse_subnets("fd00::/64")
+
+
+def test_parse_eureka_identity() -> None:
+    """Test that only Citations are accepted and the UUID is normalized."""
+    assert parse_eureka_identity("10.0.4.9", EUREKA_CITATION) == {
+        "name": "Office speaker",
+        "ip": "10.0.4.9",
+        "uuid": "1a2b3c4d000011112222333344445555",
+        "model": "HK Citation 300",
+    }
+    chromecast = {"name": "TV", "device_info": {"model_name": "Chromecast"}}
+    assert parse_eureka_identity("10.0.4.10", chromecast) is None
+    renamed = {"device_info": {"model_name": "Citation", "ssdp_udn": "AB-CD"}}
+    assert parse_eureka_identity("10.0.4.11", renamed) is None
+    assert parse_eureka_identity("10.0.4.11", renamed, require_model=False) == {
+        "name": "",
+        "ip": "10.0.4.11",
+        "uuid": "abcd",
+        "model": "Citation",
+    }
+
+
+async def test_eureka_info_connect_timeout_separate() -> None:
+    """Test that the connect timeout is passed apart from the total timeout."""
+    session = MagicMock()
+    session.get.side_effect = TimeoutError
+
+    assert await async_fetch_eureka_info(session, "10.0.4.9", 1.5, 0.2) is None
+
+    timeout = session.get.call_args.kwargs["timeout"]
+    assert (timeout.total, timeout.sock_connect) == (1.5, 0.2)
+
+
+async def test_port_open_waits_for_close() -> None:
+    """Test that the connection is closed, and a reset while closing ignored."""
+    sweeper = _sweeper("10.0.0.0/30", hosts_per_cycle=4)
+    writer = MagicMock()
+    writer.wait_closed = AsyncMock(side_effect=ConnectionResetError)
+
+    with patch(
+        "custom_components.hk_citation.sweep.asyncio.open_connection",
+        return_value=(MagicMock(), writer),
+    ):
+        assert await sweeper._port_open("10.0.0.1") is True
+
+    writer.close.assert_called_once()
+    writer.wait_closed.assert_awaited_once()
+
+
+async def test_sweep_resumes_across_cycles() -> None:
+    """Test that each sweep covers the next slice of hosts and wraps around."""
+    sweeper = _sweeper("10.0.0.0/29, 10.0.1.0/30", hosts_per_cycle=5)
+    checked: list[str] = []
+
+    async def _port_open(ip: str) -> bool:
+        checked.append(ip)
+        return False
+
+    with patch.object(sweeper, "_port_open", side_effect=_port_open):
+        await sweeper.async_sweep()
+        assert set(checked) == {f"10.0.0.{i}" for i in range(1, 6)}
+
+        checked.clear()
+        await sweeper.async_sweep(skip_ips={"10.0.1.1"})
+        assert set(checked) == {"10.0.0.6", "10.0.1.2", "10.0.0.1", "10.0.0.2"}
+
+
+async def test_sweep_bounds_tasks() -> None:
+    """Test that a large slice is checked by a fixed pool of worker tasks."""
+    sweeper = _sweeper("10.0.0.0/24", hosts_per_cycle=254)
+    baseline = len(asyncio.all_tasks())
+    peak = 0
+    checked: list[str] = []
+
+    async def _port_open(ip: str) -> bool:
+        nonlocal peak
+        peak = max(peak, len(asyncio.all_tasks()) - baseline)
+        await asyncio.sleep(0)
+        checked.append(ip)
+        return False
+
+    with patch.object(sweeper, "_port_open", side_effect=_port_open):
+        await sweeper.async_sweep()
+
+    assert len(checked) == 254
+    assert peak == 4
+
+
+async def test_sweep_identifies_open_hosts() -> None:
+    """Test that hosts with port 8008 open are confirmed via eureka_info."""
+    sweeper = _sweeper("10.0.4.8/30", hosts_per_cycle=10)
+
+    with (
+        patch.object(
+            sweeper,
+            "_port_open",
+            AsyncMock(side_effect=lambda ip: ip == "10.0.4.9"),
+        ),
+        patch.object(
+            sweeper,
+            "_identify",
+            AsyncMock(
+                side_effect=lambda ip: parse_eureka_identity(ip, EUREKA_CITATION)
+            ),
+        ) as identify,
+    ):
+        found = await sweeper.async_sweep()
+
+    identify.assert_awaited_once_with("10.0.4.9")
+    assert [s["uuid"] for s in found] == ["1a2b3c4d000011112222333344445555"]
+
+
+async def test_coordinator_merges_swept_speakers(hass: HomeAssistant) -> None:
+    """Test that swept speakers are merged into the registry alongside mDNS."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+            CONF_SWEEP_SUBNETS: "10.0.4.0/22",
+        },
+    )
+    entry.add_to_hass(hass)
+    coordinator = HKCitationCoordinator(hass, entry)
+    mdns_speaker = {
+        "name": "Kitchen speaker",
+        "ip": "192.168.4.30",
+        "uuid": "aaa",
+        "model": "HK Citation One",
+    }
+    swept_speaker = {
+        "name": "Office speaker",
+        "ip": "10.0.4.9",
+        "uuid": "bbb",
+        "model": "HK Citation 300",
+    }
+
+    with (
+        patch(
+            "custom_components.hk_citation.coordinator.run_mdns_scan",
+            return_value=[mdns_speaker],
+        ),
+        patch.object(
+            coordinator._sweeper,
+            "async_sweep",
+            AsyncMock(return_value=[swept_speaker, {**mdns_speaker, "ip": "x"}]),
+        ) as sweep,
+    ):
+        await coordinator._discover_speakers()
+
+    assert "192.168.4.30" in sweep.call_args.kwargs["skip_ips"]
+    assert coordinator._speakers["aaa"].ip == "192.168.4.30"
+    assert coordinator._speakers["bbb"].ip == "10.0.4.9"
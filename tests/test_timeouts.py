@@ -0,0 +1,41 @@
+"""Tests for the HK Citation adaptive request timeouts."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hk_citation.timeouts import AdaptiveTimeouts
+
+
+def test_timeout_follows_response_times() -> None:
+    """Test that a host's timeout is a few multiples of its response time."""
+    timeouts = AdaptiveTimeouts(0.05, 3.0)
+    assert timeouts.timeout("wired") == 3.0
+
+    for _ in range(20):
+        timeouts.record("wired", 0.002)
+        timeouts.record("mesh", 0.08)
+    assert timeouts.timeout("wired") == 0.05
+    assert 0.08 < timeouts.timeout("mesh") < 0.2
+
+    # A jittery host gets more slack than a steady one at the same mean.
+    for ms in (40, 120) * 10:
+        timeouts.record("jittery", ms / 1000)
+    assert timeouts.timeout("jittery") > timeouts.timeout("mesh")
+
+
+def test_failures_back_off_to_ceiling() -> None:
+    """Test that each failure doubles the timeout, capped at the ceiling."""
+    timeouts = AdaptiveTimeouts(0.05, 1.0)
+    timeouts.record("mesh", 0.1)
+    first = timeouts.timeout("mesh")
+
+    timeouts.record_failure("mesh")
+    assert timeouts.timeout("mesh") == pytest.approx(min(first * 2, 1.0))
+    for _ in range(10):
+        timeouts.record_failure("mesh")
+    assert timeouts.timeout("mesh") == 1.0
+
+    # A response resets the backoff.
+    timeouts.record("mesh", 0.1)
+    assert timeouts.timeout("mesh") < 1.0
@@ -0,0 +1,222 @@
+"""Tests for the HK Citation websocket API."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.hk_citation.const import (
+    CONF_SCAN_INTERVAL,
+    CONF_THRESHOLD_MS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_THRESHOLD_MS,
+    DOMAIN,
+)
+from custom_components.hk_citation.models import (
+    ProbeSample,
+    Speaker,
+    SpeakerHealth,
+    SpeakerStatus,
+)
+from custom_components.hk_citation.probe import evaluate_health
+
+KITCHEN = Speaker(
+    uuid="uuid-kitchen",
+    name="Kitchen speaker",
+    ip="192.168.4.30",
+    model="HK Citation One",
+)
+HALLWAY = Speaker(
+    uuid="uuid-hallway",
+    name="Hallway speaker",
+    ip="192.168.4.33",
+    model="HK Citation One",
+)
+HEALTHY = SpeakerHealth(
+    healthy=True,
+    response_time_ms=40.0,
+    probes=(ProbeSample("reboot", 40.0),),
+)
+COORDINATOR = "custom_components.hk_citation.coordinator.HKCitationCoordinator"
+
+
+async def _setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={},
+        options={
+            CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+            CONF_THRESHOLD_MS: DEFAULT_THRESHOLD_MS,
+        },
+        unique_id=DOMAIN,
+    )
+    entry.add_to_hass(hass)
+    data = {
+        "speakers": {
+            KITCHEN.uuid: SpeakerStatus(KITCHEN, HEALTHY),
+            HALLWAY.uuid: SpeakerStatus(HALLWAY, HEALTHY),
+        }
+    }
+    with patch(f"{COORDINATOR}._async_update_data", return_value=data):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return entry
+
+
+async def _fake_probe(
+    session: Any,
+    ip: str,
+    threshold_ms: float,
+    on_sample: Any,
+    plan: Any,
+    connect_timeout: float | None = None,
+) -> SpeakerHealth:
+    samples = [ProbeSample("get_app_device_id", 21.0), ProbeSample("reboot", 35.5)]
+    for sample in samples:
+        on_sample(sample)
+    return evaluate_health(samples, threshold_ms)
+
+
+async def test_subscribe_fleet_streams_samples(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test that a fleet-wide subscription receives each probe sample."""
+    entry = await _setup_integration(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe_probes"})
+    msg = await client.receive_json()
+    assert msg["success"]
+
+    with patch(
+        "custom_components.hk_citation.coordinator.async_probe_speaker", _fake_probe
+    ):
+        await entry.runtime_data._probe_speaker(KITCHEN)
+
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    samples = msg["event"]["samples"]
+    assert [(s["uuid"], s["endpoint"], s["ms"]) for s in samples] == [
+        (KITCHEN.uuid, "get_app_device_id", 21.0),
+        (KITCHEN.uuid, "reboot", 35.5),
+    ]
+    assert msg["event"]["dropped"] == 0
+
+
+async def test_subscribe_single_speaker(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test that an entity subscription only receives that speaker's samples."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": f"{DOMAIN}/subscribe_probes",
+            "entity_id": "binary_sensor.hallway_speaker_health",
+        }
+    )
+    assert (await client.receive_json())["success"]
+
+    coordinator._async_publish_sample(KITCHEN.uuid, ProbeSample("reboot", 10.0))
+    coordinator._async_publish_sample(HALLWAY.uuid, ProbeSample("reboot", 20.0))
+
+    msg = await client.receive_json()
+    assert [s["uuid"] for s in msg["event"]["samples"]] == [HALLWAY.uuid]
+
+
+async def test_slow_subscriber_drops_oldest(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test that a full subscriber queue drops the oldest samples."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/subscribe_probes", "max_queue": 2}
+    )
+    assert (await client.receive_json())["success"]
+
+    for ms in range(5):
+        coordinator._async_publish_sample(KITCHEN.uuid, ProbeSample("reboot", ms))
+
+    msg = await client.receive_json()
+    assert [s["ms"] for s in msg["event"]["samples"]] == [3, 4]
+    assert msg["event"]["dropped"] == 3
+
+
+async def test_unsubscribe_removes_listener(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test that unsubscribing stops sample delivery."""
+    entry = await _setup_integration(hass)
+    coordinator = entry.runtime_data
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id({"type": f"{DOMAIN}/subscribe_probes"})
+    subscription = (await client.receive_json())["id"]
+    assert coordinator._sample_listeners
+
+    await client.send_json_auto_id(
+        {"type": "unsubscribe_events", "subscription": subscription}
+    )
+    assert (await client.receive_json())["success"]
+    assert not coordinator._sample_listeners
+
+
+async def test_subscribe_unknown_entity(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test that subscribing to a non-speaker entity fails."""
+    await _setup_integration(hass)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/subscribe_probes", "entity_id": "light.kitchen"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "not_found"
+
+
+async def test_history(hass: HomeAssistant, hass_ws_client: WebSocketGenerator) -> None:
+    """Test that the history command returns a speaker's latency buckets."""
+    entry = await _setup_integration(hass)
+    history = entry.runtime_data.history
+    history.add(KITCHEN.uuid, 3600.0, 40.0)
+    history.add(KITCHEN.uuid, 3630.0, 60.0)
+    history.add(KITCHEN.uuid, 3700.0, 50.0)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": f"{DOMAIN}/history",
+            "entity_id": "binary_sensor.kitchen_speaker_health",
+            "resolution": "minute",
+        }
+    )
+    msg = await client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["uuid"] == KITCHEN.uuid
+    assert msg["result"]["history"] == [
+        {
+            "start": 3600.0,
+            "count": 2,
+            "min": 40.0,
+            "mean": 50.0,
+            "p95": 60.0,
+            "max": 60.0,
+        }
+    ]
+
+    await client.send_json_auto_id(
+        {"type": f"{DOMAIN}/history", "uuid": HALLWAY.uuid, "resolution": "raw"}
+    )
+    msg = await client.receive_json()
+    assert msg["result"]["history"] == []